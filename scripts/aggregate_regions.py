@@ -107,7 +107,7 @@ def main() -> None:
     facility_path = Path(cfg.paths.data_processed) / "facility_capabilities.parquet"
     facilities = _load_facility_capabilities(facility_path)
 
-    geo_cfg = getattr(cfg, "geo", {}) or {}
+    geo_cfg = cfg.section("geo")
     region_field = str(geo_cfg.get("region_field", "region"))
     lookup_path_value = geo_cfg.get("region_lookup_path")
     lookup_path = Path(lookup_path_value) if lookup_path_value else None
@@ -120,13 +120,13 @@ def main() -> None:
         region_field=region_field,
         lookup_path=lookup_path,
     )
-    filter_cfg = getattr(cfg, "filter", {}) or {}
+    filter_cfg = cfg.section("filter")
     min_confidence = float(filter_cfg.get("min_confidence", 0.0))
     if min_confidence > 0:
         facilities = facilities[facilities["confidence"] >= min_confidence].copy()
 
     coverage = aggregate_region_coverage(facilities)
-    desert_cfg = getattr(cfg, "desert", {}) or {}
+    desert_cfg = cfg.section("desert")
     coverage = apply_desert_labels(
         coverage,
         hard_threshold=float(desert_cfg.get("hard_threshold", 0.0)),
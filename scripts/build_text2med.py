@@ -42,6 +42,12 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Force reload of cached configuration.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used for the capability phrase scan (default: 1, no worker pool).",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -74,7 +80,7 @@ def main() -> None:
         logger.error("Unable to read ingestion artifacts", extra={"error": str(exc)})
         raise
 
-    chunking_cfg = getattr(cfg, "chunking", {}) or {}
+    chunking_cfg = cfg.section("chunking")
     strategy = str(chunking_cfg.get("strategy", "sentence"))
     max_chunk_chars = int(chunking_cfg.get("max_chunk_chars", 512))
 
@@ -87,18 +93,20 @@ def main() -> None:
         raise RuntimeError("No text chunks were generated from raw_documents input.")
 
     ontology = load_capability_ontology()
-    raw_claims, match_rows = extract_capability_claims(text_chunks, ontology)
+    raw_claims, match_rows = extract_capability_claims(
+        text_chunks, ontology, workers=max(1, args.workers)
+    )
     if raw_claims.empty:
         raise RuntimeError("No capability claims were extracted.")
 
-    verification_cfg = getattr(cfg, "verification", {}) or {}
+    verification_cfg = cfg.section("verification")
     verified_claims = apply_verification(
         raw_claims,
         ontology,
         prerequisite_strict=bool(verification_cfg.get("prerequisite_strict", True)),
     )
 
-    confidence_cfg = getattr(cfg, "confidence", {}) or {}
+    confidence_cfg = cfg.section("confidence")
     weights = confidence_cfg.get("weights", {}) or {}
     final_claims = score_claims(verified_claims, weights)
 
@@ -128,7 +136,7 @@ def main() -> None:
         extra={name: str(path) for name, path in outputs.items()},
     )
 
-    tracing_cfg = getattr(cfg, "tracing", {}) or {}
+    tracing_cfg = cfg.section("tracing")
     if bool(tracing_cfg.get("export_traces", False)) and not match_rows.empty:
         trace_path = Path(cfg.paths.outputs_traces) / "text2med_retrieval_matches.parquet"
         write_parquet(match_rows, trace_path, index=False)
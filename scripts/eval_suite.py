@@ -11,8 +11,9 @@ import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
@@ -20,6 +21,7 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from src.common import load_config, setup_logging
+from src.common.schemas import coerce_schema
 from src.common.storage import StorageError, read_json, read_parquet, write_json
 
 
@@ -164,7 +166,7 @@ def _prepare_frame(frame: pd.DataFrame) -> pd.DataFrame:
     prepared["contradiction_count"] = prepared["contradiction_count"].apply(
         lambda value: _to_int_or_default(value, 0)
     )
-    return prepared
+    return coerce_schema(prepared)
 
 
 def _build_check(
@@ -329,16 +331,42 @@ def _load_question_specs(glob_pattern: str) -> List[Dict[str, Any]]:
     return specs
 
 
-def _evaluate_capability_status_count(frame: pd.DataFrame, question: Dict[str, Any]) -> Dict[str, Any]:
+class _QuestionIndex(NamedTuple):
+    """Row positions per capability plus status codes, built once per prepared frame."""
+
+    capability_rows: Dict[Any, np.ndarray]
+    status_codes: np.ndarray
+    status_categories: pd.Index
+
+    def rows(self, capability: str) -> np.ndarray:
+        return self.capability_rows.get(capability, np.empty(0, dtype=np.intp))
+
+    def rows_with_status(self, rows: np.ndarray, statuses: Sequence[str]) -> np.ndarray:
+        wanted = self.status_categories.get_indexer(list(statuses))
+        return rows[np.isin(self.status_codes[rows], wanted[wanted >= 0])]
+
+
+def _build_question_index(frame: pd.DataFrame) -> _QuestionIndex:
+    status = frame["status"].astype("category")
+    return _QuestionIndex(
+        capability_rows=frame.groupby("capability", sort=False, observed=True).indices,
+        status_codes=status.cat.codes.to_numpy(),
+        status_categories=status.cat.categories,
+    )
+
+
+def _evaluate_capability_status_count(
+    frame: pd.DataFrame, question: Dict[str, Any], index: _QuestionIndex
+) -> Dict[str, Any]:
     capability = str(question.get("capability", "")).strip()
     statuses = question.get("statuses") or question.get("status_in") or ["present"]
     statuses = [str(status).strip() for status in statuses]
     if not capability:
         return {"passed": False, "error": "Missing required field: capability", "match_count": 0}
 
-    subset = frame[(frame["capability"] == capability) & (frame["status"].isin(statuses))]
-    sample_facilities = subset["facility_id"].drop_duplicates().head(5).tolist()
-    count = int(len(subset))
+    rows = index.rows_with_status(index.rows(capability), statuses)
+    sample_facilities = frame["facility_id"].take(rows).drop_duplicates().head(5).tolist()
+    count = int(len(rows))
 
     expected_min = question.get("expect_min")
     expected_max = question.get("expect_max")
@@ -356,7 +384,9 @@ def _evaluate_capability_status_count(frame: pd.DataFrame, question: Dict[str, A
     }
 
 
-def _evaluate_missing_prerequisite(frame: pd.DataFrame, question: Dict[str, Any]) -> Dict[str, Any]:
+def _evaluate_missing_prerequisite(
+    frame: pd.DataFrame, question: Dict[str, Any], index: _QuestionIndex
+) -> Dict[str, Any]:
     capability = str(question.get("capability", "")).strip()
     prerequisite = str(
         question.get("prerequisite", question.get("required_capability", ""))
@@ -370,21 +400,20 @@ def _evaluate_missing_prerequisite(frame: pd.DataFrame, question: Dict[str, Any]
             "match_count": 0,
         }
 
-    cap_rows = frame[frame["capability"] == capability][["facility_id", "status"]].drop_duplicates(
+    cap_rows = frame[["facility_id", "status"]].take(index.rows(capability)).drop_duplicates(
         subset=["facility_id"], keep="first"
     )
-    prereq_rows = frame[frame["capability"] == prerequisite][["facility_id", "status"]].drop_duplicates(
+    prereq_rows = frame[["facility_id", "status"]].take(index.rows(prerequisite)).drop_duplicates(
         subset=["facility_id"], keep="first"
     )
-    prereq_status_map = prereq_rows.set_index("facility_id")["status"].astype(str).to_dict()
+    prereq_status = prereq_rows.set_index("facility_id")["status"].astype(str)
 
-    matches: List[str] = []
-    for row in cap_rows.itertuples(index=False):
-        if str(row.status) not in cap_statuses:
-            continue
-        prereq_status = prereq_status_map.get(str(row.facility_id), "missing")
-        if prereq_status in lacking_statuses:
-            matches.append(str(row.facility_id))
+    cap_facilities = cap_rows["facility_id"].astype(str)
+    facility_prereq_status = cap_facilities.map(prereq_status).fillna("missing")
+    lacking = cap_rows["status"].astype(str).isin(cap_statuses) & facility_prereq_status.isin(
+        lacking_statuses
+    )
+    matches: List[str] = cap_facilities[lacking].tolist()
 
     expected_min = question.get("expect_min")
     expected_max = question.get("expect_max")
@@ -408,16 +437,24 @@ def _evaluate_missing_prerequisite(frame: pd.DataFrame, question: Dict[str, Any]
     }
 
 
-def _evaluate_question(frame: pd.DataFrame, question: Dict[str, Any]) -> Dict[str, Any]:
+def _evaluate_question(
+    frame: pd.DataFrame,
+    question: Dict[str, Any],
+    index: Optional[_QuestionIndex] = None,
+) -> Dict[str, Any]:
+    """Evaluate one question spec; pass `index` to share it across questions on one frame."""
+
     question_id = str(question.get("id", "unnamed_question"))
     q_type = str(question.get("type", "")).strip()
     prompt = str(question.get("prompt", question.get("question", question_id)))
     required = bool(question.get("required", False))
 
+    if q_type in ("capability_status_count", "missing_prerequisite") and index is None:
+        index = _build_question_index(frame)
     if q_type == "capability_status_count":
-        result = _evaluate_capability_status_count(frame, question)
+        result = _evaluate_capability_status_count(frame, question, index)
     elif q_type == "missing_prerequisite":
-        result = _evaluate_missing_prerequisite(frame, question)
+        result = _evaluate_missing_prerequisite(frame, question, index)
     else:
         result = {"passed": False, "error": f"Unsupported question type: {q_type}", "match_count": 0}
 
@@ -477,7 +514,10 @@ def main() -> None:
     prepared = _prepare_frame(frame)
     checks = _run_regression_checks(prepared)
     questions = _load_question_specs(args.questions_glob)
-    question_results = [_evaluate_question(prepared, question) for question in questions]
+    question_index = _build_question_index(prepared)
+    question_results = [
+        _evaluate_question(prepared, question, question_index) for question in questions
+    ]
     summary = _summarize_report(prepared, checks, question_results)
     summary["input_path"] = str(input_path)
     summary["summary_path"] = str(summary_path)
@@ -6,7 +6,7 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 import sys
-from typing import List, Sequence
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
@@ -20,6 +20,75 @@ from src.data_ingest.search import SearchExpander, SearchExpansionConfig
 from src.data_ingest.vf_loader import load_vf_data
 
 
+_DEFAULT_SEARCH_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0 Safari/537.36"
+)
+
+CoercionSchema = Dict[str, Tuple[Callable[[Any], Any], Any]]
+
+
+def _status_tuple(value: Any) -> Tuple[int, ...]:
+    if not isinstance(value, (list, tuple)):
+        raise TypeError("expected a list of HTTP status codes")
+    return tuple(int(item) for item in value)
+
+
+def _str_tuple(value: Any) -> Tuple[str, ...]:
+    if not isinstance(value, (list, tuple)):
+        raise TypeError("expected a list of strings")
+    return tuple(str(item) for item in value)
+
+
+_SCRAPER_SCHEMA: CoercionSchema = {
+    "timeout_sec": (float, 30.0),
+    "retries": (int, 2),
+    "respect_robots": (bool, True),
+    "concurrency": (int, 4),
+    "user_agent": (str, "BMD-Ingestor/0.1"),
+    "backoff_base_sec": (float, 1.0),
+    "backoff_max_sec": (float, 60.0),
+    "retry_on_status": (_status_tuple, (429, 502, 503)),
+    "use_playwright_fallback": (bool, False),
+    "delay_between_requests_per_domain": (float, 0.0),
+    "max_response_bytes": (int, 5_000_000),
+    "robots_allowlist": (_str_tuple, ()),
+}
+
+_SEARCH_SCHEMA: CoercionSchema = {
+    "max_results": (int, 3),
+    "extra_terms": (list, ("hospital",)),
+    "user_agent": (str, _DEFAULT_SEARCH_USER_AGENT),
+    "concurrency": (int, 8),
+    "fallback_without_country": (bool, False),
+}
+
+_CHUNKER_SCHEMA: CoercionSchema = {
+    "max_chars": (int, 900),
+    "min_chars": (int, 120),
+    "overlap_chars": (int, 120),
+}
+
+
+def _coerce(settings: Mapping[str, Any], schema: CoercionSchema) -> Dict[str, Any]:
+    """Cast each schema key from settings in one pass; missing/None values use the default.
+
+    Values that cannot be cast raise ValueError naming the offending key.
+    """
+
+    coerced: Dict[str, Any] = {}
+    for key, (cast, default) in schema.items():
+        value = settings.get(key)
+        if value is None:
+            coerced[key] = cast(default)
+            continue
+        try:
+            coerced[key] = cast(value)
+        except (TypeError, ValueError) as exc:
+            raise ValueError(f"Invalid config value for {key!r}: {value!r} ({exc})") from exc
+    return coerced
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="VF data ingestion pipeline")
     parser.add_argument(
@@ -61,7 +130,7 @@ def main() -> None:
     log_setup = setup_logging(cfg, run_name="ingest_data")
     logger = log_setup.logger
 
-    sources_cfg = getattr(cfg, "sources", {}) or {}
+    sources_cfg = cfg.section("sources")
     csv_root = Path(sources_cfg.get("vf_csv_path", cfg.paths.data_raw))
     country = sources_cfg.get("country")
     scrape_enabled = bool(sources_cfg.get("scrape_enabled", True))
@@ -85,23 +154,15 @@ def main() -> None:
     )
 
     scraped_documents: List[DocumentRecord] = []
-    scraper_settings = getattr(cfg, "scraper", {}) or {}
+    scraper_settings = cfg.section("scraper")
 
     scrape_requests: List[ScrapeRequest] = []
-    search_settings = getattr(cfg, "search", {}) or {}
+    search_settings = cfg.section("search")
     if search_allowed and search_settings.get("enabled", False):
         search_config = SearchExpansionConfig(
             enabled=True,
-            max_results=int(search_settings.get("max_results", 3)),
-            extra_terms=list(search_settings.get("extra_terms", ["hospital"])),
             country_hint=str(search_settings.get("country_hint", country or "Ghana")),
-            user_agent=str(
-                search_settings.get(
-                    "user_agent",
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0 Safari/537.36",
-                )
-            ),
+            **_coerce(search_settings, _SEARCH_SCHEMA),
         )
         expander = SearchExpander(search_config, logger)
         existing_urls = {req.url for req in scrape_requests}
@@ -122,26 +183,9 @@ def main() -> None:
         )
 
     if scrape_enabled and scrape_requests:
-        def _tuple_or_default(key: str, default: tuple) -> tuple:
-            val = scraper_settings.get(key, default)
-            if val is None:
-                return default
-            return tuple(val) if isinstance(val, (list, tuple)) else default
-
         scraper_cfg = ScraperConfig(
-            timeout_sec=float(scraper_settings.get("timeout_sec", 30)),
-            retries=int(scraper_settings.get("retries", 2)),
-            respect_robots=bool(scraper_settings.get("respect_robots", True)),
             cache_dir=scrape_cache,
-            concurrency=int(scraper_settings.get("concurrency", 4)),
-            user_agent=str(scraper_settings.get("user_agent", "BMD-Ingestor/0.1")),
-            backoff_base_sec=float(scraper_settings.get("backoff_base_sec", 1.0)),
-            backoff_max_sec=float(scraper_settings.get("backoff_max_sec", 60)),
-            retry_on_status=_tuple_or_default("retry_on_status", (429, 502, 503)),
-            use_playwright_fallback=bool(scraper_settings.get("use_playwright_fallback", False)),
-            delay_between_requests_per_domain=float(
-                scraper_settings.get("delay_between_requests_per_domain", 0.0)
-            ),
+            **_coerce(scraper_settings, _SCRAPER_SCHEMA),
         )
         scraper = WebScraper(scraper_cfg, logger)
         logger.info(
@@ -172,12 +216,8 @@ def main() -> None:
             extra={"scrape_enabled": scrape_enabled, "scrape_requests": len(scrape_requests)},
         )
 
-    chunker_settings = getattr(cfg, "chunker", {}) or {}
-    chunker_cfg = ChunkerConfig(
-        max_chars=int(chunker_settings.get("max_chars", 900)),
-        min_chars=int(chunker_settings.get("min_chars", 120)),
-        overlap_chars=int(chunker_settings.get("overlap_chars", 120)),
-    )
+    chunker_settings = cfg.section("chunker")
+    chunker_cfg = ChunkerConfig(**_coerce(chunker_settings, _CHUNKER_SCHEMA))
     chunker = TextChunker(chunker_cfg)
 
     output_path = Path(cfg.paths.data_interim) / "raw_documents.parquet"
@@ -15,6 +15,7 @@ if str(PROJECT_ROOT) not in sys.path:
 
 from src.common import load_config, setup_logging
 from src.loc2med.server import Loc2MedBackend, run_fastapi, run_streamlit
+from src.loc2med.tile_cache import TileCache
 from src.loc2med.ui_state import state_from_config
 
 
@@ -34,6 +35,11 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument("--capability", default=None)
     parser.add_argument("--min-confidence", type=float, default=None)
     parser.add_argument("--region-id", default=None)
+    parser.add_argument(
+        "--payload-cache",
+        action="store_true",
+        help="Persist dashboard payloads under outputs/tiles/payloads across restarts.",
+    )
     return parser.parse_args()
 
 
@@ -55,12 +61,15 @@ def main() -> None:
 
     facilities_path = Path(cfg.paths.data_processed) / "facility_capabilities.parquet"
     region_path = Path(cfg.paths.data_processed) / "region_coverage.parquet"
-    ui_state = state_from_config({"map": getattr(cfg, "map", {}), "filters": getattr(cfg, "filters", {})})
+    ui_state = state_from_config({"map": cfg.section("map"), "filters": cfg.section("filters")})
 
     backend = Loc2MedBackend(
         facility_capabilities_path=facilities_path,
         region_coverage_path=region_path,
         default_state=ui_state,
+        tile_cache=(
+            TileCache(Path(cfg.paths.outputs_tiles) / "payloads") if args.payload_cache else None
+        ),
     )
 
     overrides = {
@@ -6,21 +6,16 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 import sys
-from typing import List, Sequence
-
-import pandas as pd
+from typing import TYPE_CHECKING, List, Sequence
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.common import load_config, setup_logging
-from src.common.storage import read_parquet, write_parquet
-from src.loc2hospital.regions import map_facilities_to_regions
-from src.planning.exports import export_recommendations_csv
-from src.planning.gap_analysis import GapAnalysisConfig, compute_gap_table
-from src.planning.recommendations import RecommendationConfig, generate_recommendations
-from src.planning.unlock_engine import UnlockConfig, find_unlock_candidates
+# pandas and the src.* pipeline modules are imported inside functions so that
+# `--help` and argument errors return without paying their import cost.
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def _parse_args() -> argparse.Namespace:
@@ -48,11 +43,22 @@ def _load_facilities(path: Path) -> pd.DataFrame:
         "confidence",
         "missing_prerequisites",
     ]
+    from src.common.storage import read_parquet
+
     return read_parquet(path, required_columns=required)
 
 
 def main() -> None:
     args = _parse_args()
+
+    from src.common import load_config, setup_logging
+    from src.common.storage import read_parquet, write_parquet
+    from src.loc2hospital.regions import map_facilities_to_regions
+    from src.planning.exports import export_recommendations_csv
+    from src.planning.gap_analysis import GapAnalysisConfig, compute_gap_table
+    from src.planning.recommendations import RecommendationConfig, generate_recommendations
+    from src.planning.unlock_engine import UnlockConfig, find_unlock_candidates
+
     config_names = _ensure_config(args.config_name)
     cfg = load_config(config_name=config_names, overrides=args.override, reload=args.reload_config)
     logger = setup_logging(cfg, run_name="run_planning").logger
@@ -63,7 +69,7 @@ def main() -> None:
     facilities = _load_facilities(facility_path)
     region_coverage = read_parquet(region_coverage_path)
 
-    region_cfg = getattr(cfg, "regions", {}) or {}
+    region_cfg = cfg.section("regions")
     region_field = str(region_cfg.get("region_field", "region"))
     lookup_path = region_cfg.get("region_lookup_path")
     lookup_path_obj = None
@@ -78,14 +84,14 @@ def main() -> None:
         lookup_path=lookup_path_obj,
     )
 
-    gap_cfg = getattr(cfg, "gap_analysis", {}) or {}
+    gap_cfg = cfg.section("gap_analysis")
     gap_config = GapAnalysisConfig(
         top_n_missing=int(gap_cfg.get("top_n_missing", 5)),
         coverage_floor=float(gap_cfg.get("coverage_floor", 1.0)),
     )
     gap_table = compute_gap_table(region_coverage, config=gap_config)
 
-    unlock_cfg = getattr(cfg, "unlock", {}) or {}
+    unlock_cfg = cfg.section("unlock")
     unlock_config = UnlockConfig(
         max_prerequisites_missing=int(unlock_cfg.get("max_prerequisites_missing", 2)),
         min_confidence=float(unlock_cfg.get("min_confidence", 0.2)),
@@ -93,7 +99,7 @@ def main() -> None:
     )
     unlock_candidates = find_unlock_candidates(facilities, gap_table, config=unlock_config)
 
-    recommendation_cfg = getattr(cfg, "recommendations", {}) or {}
+    recommendation_cfg = cfg.section("recommendations")
     recommendation_config = RecommendationConfig(
         min_alternatives=int(
             recommendation_cfg.get(
@@ -126,7 +132,7 @@ def main() -> None:
     write_parquet(recommendations, output_parquet, index=False)
     logger.info("Recommendations written", extra={"path": str(output_parquet)})
 
-    exports_cfg = getattr(cfg, "exports", {}) or {}
+    exports_cfg = cfg.section("exports")
     if exports_cfg.get("csv", True):
         csv_path = Path(cfg.paths.outputs_reports) / "planning_summary.csv"
         export_recommendations_csv(recommendations, csv_path)
@@ -10,26 +10,24 @@ import ast
 import json
 import re
 import sys
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List, Sequence
-
-import pandas as pd
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
-from src.common import load_config, setup_logging
-from src.common.storage import StorageError, read_parquet, write_json, write_parquet
-from src.text2med.confidence import score_claims
-from src.text2med.ontology import load_capability_ontology
-from src.text2med.verifier import apply_verification
-from src.text2med.writer import write_final_capabilities
+# pandas and the src.* pipeline modules are imported inside functions so that
+# `--help` and argument errors return without paying their import cost.
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 _RAW_EXPLANATION_PATTERN = re.compile(
     r"strong=(?P<strong>\d+),\s*weak=(?P<weak>\d+),\s*negative=(?P<negative>\d+)"
 )
+_EMPTY_LIST_TEXTS = frozenset({"", "[]"})
 
 
 def _parse_args() -> argparse.Namespace:
@@ -79,6 +77,8 @@ def _merge_config_names(names: Sequence[str]) -> List[str]:
 def _is_null(value: Any) -> bool:
     if value is None:
         return True
+    import pandas as pd
+
     try:
         return bool(pd.isna(value))
     except Exception:
@@ -111,37 +111,48 @@ def _normalize_list(value: Any) -> List[str]:
     return [str(value).strip()]
 
 
-def _extract_match_counts(frame: pd.DataFrame) -> pd.DataFrame:
-    strong_counts: List[int] = []
-    weak_counts: List[int] = []
-    negative_counts: List[int] = []
-
-    for row in frame.itertuples(index=False):
-        raw_explanation = str(getattr(row, "raw_explanation", "") or "")
-        match = _RAW_EXPLANATION_PATTERN.search(raw_explanation)
-        if match:
-            strong_counts.append(int(match.group("strong")))
-            weak_counts.append(int(match.group("weak")))
-            negative_counts.append(int(match.group("negative")))
+def _normalize_list_column(values: pd.Series) -> List[List[str]]:
+    """`_normalize_list` per cell, skipping the parsers for empty-list text like "[]".
+
+    Parquet list columns load as NumPy arrays; those are read like lists.
+    """
+
+    import numpy as np
+
+    normalized: List[List[str]] = []
+    for value in values.tolist():
+        if isinstance(value, np.ndarray):
+            value = value.tolist()
+        elif isinstance(value, str) and value.strip() in _EMPTY_LIST_TEXTS:
+            normalized.append([])
             continue
-        strong_counts.append(0)
-        weak_counts.append(0)
-        negative_counts.append(0)
+        normalized.append(_normalize_list(value))
+    return normalized
 
-    frame["strong_match_count"] = strong_counts
-    frame["weak_match_count"] = weak_counts
-    frame["negative_match_count"] = negative_counts
+
+def _extract_match_counts(frame: pd.DataFrame) -> pd.DataFrame:
+    # One vectorized regex pass; rows without the pattern count zero matches.
+    explanations = frame["raw_explanation"].fillna("").astype(str)
+    counts = explanations.str.extract(_RAW_EXPLANATION_PATTERN).fillna(0).astype("int64")
+    frame["strong_match_count"] = counts["strong"].to_numpy()
+    frame["weak_match_count"] = counts["weak"].to_numpy()
+    frame["negative_match_count"] = counts["negative"].to_numpy()
     return frame
 
 
-def _to_int_or_default(value: Any, default: int) -> int:
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return default
+def _int_column_or_fallback(values: pd.Series, fallback: Any) -> Any:
+    """Keep numeric values truncated to int; fill null/non-numeric rows from `fallback`."""
+
+    import numpy as np
+    import pandas as pd
+
+    numeric = pd.to_numeric(values, errors="coerce").to_numpy(dtype=np.float64)
+    return np.where(np.isfinite(numeric), np.trunc(numeric), fallback).astype(np.int64)
 
 
 def _prepare_input_for_verification(frame: pd.DataFrame) -> pd.DataFrame:
+    import pandas as pd
+
     prepared = frame.copy()
 
     required_defaults: Dict[str, Any] = {
@@ -172,15 +183,17 @@ def _prepare_input_for_verification(frame: pd.DataFrame) -> pd.DataFrame:
         if list_column not in prepared.columns:
             prepared[list_column] = [[] for _ in range(len(prepared))]
         else:
-            prepared[list_column] = prepared[list_column].apply(_normalize_list)
+            prepared[list_column] = _normalize_list_column(prepared[list_column])
 
-    prepared["evidence_count"] = prepared.apply(
-        lambda row: _to_int_or_default(row["evidence_count"], len(row["evidence_ids"])),
-        axis=1,
+    evidence_ids = pd.Series(prepared["evidence_ids"].to_numpy(), copy=False)
+    source_refs = pd.Series(prepared["evidence_source_refs"].to_numpy(), copy=False)
+    prepared["evidence_count"] = _int_column_or_fallback(
+        prepared["evidence_count"], evidence_ids.str.len().to_numpy()
     )
-    prepared["source_support_count"] = prepared.apply(
-        lambda row: _to_int_or_default(row["source_support_count"], len(set(row["evidence_source_refs"]))),
-        axis=1,
+    # One explode + groupby instead of a Python set per row.
+    unique_source_refs = source_refs.explode().groupby(level=0).nunique().to_numpy()
+    prepared["source_support_count"] = _int_column_or_fallback(
+        prepared["source_support_count"], unique_source_refs
     )
 
     prepared = _extract_match_counts(prepared)
@@ -188,11 +201,23 @@ def _prepare_input_for_verification(frame: pd.DataFrame) -> pd.DataFrame:
 
 
 def _build_anomaly_rows(frame: pd.DataFrame) -> pd.DataFrame:
-    return frame[frame["flags"].apply(bool) | (frame["confidence_label"] == "uncertain")].copy()
+    # No .copy(): the only consumer is write_parquet, which re-materializes via Arrow anyway.
+    mask = frame["flags"].map(bool).to_numpy(dtype=bool) | (
+        frame["confidence_label"].to_numpy() == "uncertain"
+    )
+    return frame.loc[mask]
 
 
 def main() -> None:
     args = _parse_args()
+
+    from src.common import load_config, setup_logging
+    from src.common.storage import StorageError, read_parquet, write_json, write_parquet
+    from src.text2med.confidence import score_claims
+    from src.text2med.ontology import load_capability_ontology
+    from src.text2med.verifier import apply_verification
+    from src.text2med.writer import write_final_capabilities
+
     config_names = _merge_config_names(args.config_name)
     cfg = load_config(config_name=config_names, overrides=args.override, reload=args.reload_config)
     log_setup = setup_logging(cfg, run_name="verify_capabilities")
@@ -213,27 +238,25 @@ def main() -> None:
     prepared = _prepare_input_for_verification(frame)
     ontology = load_capability_ontology()
 
-    verification_cfg = getattr(cfg, "verification", {}) or {}
+    verification_cfg = cfg.section("verification")
     verified = apply_verification(
         prepared,
         ontology,
         prerequisite_strict=bool(verification_cfg.get("prerequisite_strict", True)),
     )
-    confidence_cfg = getattr(cfg, "confidence", {}) or {}
+    confidence_cfg = cfg.section("confidence")
     weights = confidence_cfg.get("weights", {}) or {}
     rescored = score_claims(verified, weights)
 
     anomalies = _build_anomaly_rows(rescored)
+    # One pass over the flag lists counts rows per flag, instead of one apply per flag.
+    flag_rows = Counter(flag for flags in rescored["flags"].tolist() for flag in set(flags))
     summary = {
         "rows_evaluated": int(len(rescored)),
         "facilities_evaluated": int(rescored["facility_id"].nunique()),
         "anomaly_rows": int(len(anomalies)),
-        "missing_prerequisite_rows": int(
-            rescored["flags"].apply(lambda values: "missing_prerequisite" in values).sum()
-        ),
-        "inconsistent_claim_rows": int(
-            rescored["flags"].apply(lambda values: "inconsistent_claim" in values).sum()
-        ),
+        "missing_prerequisite_rows": flag_rows["missing_prerequisite"],
+        "inconsistent_claim_rows": flag_rows["inconsistent_claim"],
         "output_path": str(output_path),
         "anomaly_path": str(anomaly_path),
     }
@@ -245,7 +268,14 @@ def main() -> None:
 
     write_final_capabilities(rescored, output_path)
     if not anomalies.empty:
-        write_parquet(anomalies, anomaly_path, index=False)
+        write_parquet(
+            anomalies,
+            anomaly_path,
+            index=False,
+            sort_by="facility_id",
+            row_group_size=32_768,
+            compression="zstd",
+        )
     write_json(summary, summary_path)
     logger.info(
         "Verification artifacts written",
@@ -14,6 +14,18 @@ __all__ = [
     "LoggingSetupResult",
     "load_config",
     "setup_logging",
+    "StorageError",
+    "ensure_parent_dir",
+    "read_parquet",
+    "write_parquet",
+    "read_json",
+    "write_json",
+    "CATEGORICAL_COLS",
+    "coerce_schema",
+    "EvidenceCitation",
+    "build_evidence_id",
+    "build_citation",
+    "citations_to_dicts",
 ]
 
 _CONFIG_EXPORTS = {
@@ -25,6 +37,21 @@ _CONFIG_EXPORTS = {
     "load_config",
 }
 _LOGGING_EXPORTS = {"LoggingSetupResult", "setup_logging"}
+_STORAGE_EXPORTS = {
+    "StorageError",
+    "ensure_parent_dir",
+    "read_parquet",
+    "write_parquet",
+    "read_json",
+    "write_json",
+}
+_SCHEMA_EXPORTS = {"CATEGORICAL_COLS", "coerce_schema"}
+_CITATION_EXPORTS = {
+    "EvidenceCitation",
+    "build_evidence_id",
+    "build_citation",
+    "citations_to_dicts",
+}
 
 
 def __getattr__(name: str) -> Any:
@@ -34,6 +61,15 @@ def __getattr__(name: str) -> Any:
     if name in _LOGGING_EXPORTS:
         module = importlib.import_module(".logging", __name__)
         return getattr(module, name)
+    if name in _STORAGE_EXPORTS:
+        module = importlib.import_module(".storage", __name__)
+        return getattr(module, name)
+    if name in _SCHEMA_EXPORTS:
+        module = importlib.import_module(".schemas", __name__)
+        return getattr(module, name)
+    if name in _CITATION_EXPORTS:
+        module = importlib.import_module(".citations", __name__)
+        return getattr(module, name)
     raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
@@ -3,23 +3,25 @@
 from __future__ import annotations
 
 import hashlib
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from typing import List, Sequence
 
 
-def _sha1_short(value: str, length: int = 16) -> str:
-    digest = hashlib.sha1(value.encode("utf-8")).hexdigest()
-    return digest[:length]
+def _short_digest(value: str, length: int = 16) -> str:
+    """Non-cryptographic stable label: BLAKE2b sized to `length` hex chars."""
+
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=max(1, (length + 1) // 2))
+    return digest.hexdigest()[:length]
 
 
 def build_evidence_id(facility_id: str, capability: str, chunk_id: str) -> str:
     """Create a stable evidence ID from facility/capability/chunk linkage."""
 
     seed = f"{facility_id}|{capability}|{chunk_id}"
-    return f"ev_{_sha1_short(seed)}"
+    return f"ev_{_short_digest(seed)}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvidenceCitation:
     """Normalized citation payload attached to capability claims."""
 
@@ -31,7 +33,15 @@ class EvidenceCitation:
     snippet: str
 
     def to_dict(self) -> dict[str, str]:
-        return asdict(self)
+        # Flat string fields only, so a literal is equivalent to asdict() without the reflection.
+        return {
+            "evidence_id": self.evidence_id,
+            "chunk_id": self.chunk_id,
+            "doc_id": self.doc_id,
+            "source_type": self.source_type,
+            "source_ref": self.source_ref,
+            "snippet": self.snippet,
+        }
 
 
 def build_citation(
@@ -47,9 +57,13 @@ def build_citation(
 ) -> EvidenceCitation:
     """Build a normalized citation record for a single chunk hit."""
 
-    snippet = text.strip()
+    # Chunker output is already trimmed, so only strip when an end is whitespace.
+    snippet = text.strip() if text and (text[0].isspace() or text[-1].isspace()) else text
     if len(snippet) > max_snippet_chars:
-        snippet = snippet[: max_snippet_chars - 3].rstrip() + "..."
+        cut = snippet[: max_snippet_chars - 3]
+        if cut and cut[-1].isspace():
+            cut = cut.rstrip()
+        snippet = cut + "..."
     return EvidenceCitation(
         evidence_id=build_evidence_id(facility_id, capability, chunk_id),
         chunk_id=chunk_id,
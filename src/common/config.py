@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import copy
 import os
+from collections import OrderedDict
 from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Union
 
-from omegaconf import OmegaConf
 from pydantic import BaseModel, ConfigDict, Field
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -15,6 +16,10 @@ CONFIG_ROOT = PROJECT_ROOT / "config"
 BASE_CONFIG_PATH = CONFIG_ROOT / "base.yaml"
 ENV_VAR_CONFIG_NAME = "BMD_CONFIG_NAME"
 
+_OMEGA_CACHE_MAX_ENTRIES = 100
+# Parsed YAML trees keyed by (path, mtime, size) so edits on disk invalidate entries.
+_OMEGA_CACHE: "OrderedDict[tuple[str, float, int], Any]" = OrderedDict()
+
 
 class PathsConfig(BaseModel):
     """Filesystem layout for data + outputs."""
@@ -33,8 +38,12 @@ class PathsConfig(BaseModel):
         def _resolve(value: Path) -> Path:
             return value if value.is_absolute() else (base_dir / value).resolve()
 
-        resolved_fields = {f: _resolve(getattr(self, f)) for f in self.model_fields}
-        return type(self)(**resolved_fields)
+        resolved_fields = {f: _resolve(getattr(self, f)) for f in _PATHS_FIELDS}
+        # Values were validated on the way in; skip re-running the validators.
+        return type(self).model_construct(**resolved_fields)
+
+
+_PATHS_FIELDS = tuple(PathsConfig.model_fields)
 
 
 class LoggingConfig(BaseModel):
@@ -73,6 +82,12 @@ class AppConfig(BaseModel):
     experiment: ExperimentConfig
     datastore: DatastoreConfig
 
+    def section(self, name: str) -> dict[str, Any]:
+        """Return a pipeline section (extra top-level key) as a plain dict, or {} if unset."""
+
+        value = (self.model_extra or {}).get(name)
+        return value if isinstance(value, dict) else {}
+
 
 class ConfigLoaderError(RuntimeError):
     """Raised when config files are missing or malformed."""
@@ -90,8 +105,25 @@ def _as_tuple(overrides: Optional[Sequence[str]]) -> tuple[str, ...]:
 
 
 def _load_omegaconf(path: Path) -> Any:
+    """Load a YAML file as an OmegaConf tree, reusing a parsed copy while the file is unchanged.
+
+    A deep copy is returned on every call because `_merge_confs` mutates its inputs.
+    """
+
+    from omegaconf import OmegaConf
+
     _ensure_exists(path)
-    return OmegaConf.load(path)
+    stat = path.stat()
+    key = (str(path), stat.st_mtime, stat.st_size)
+    cached = _OMEGA_CACHE.get(key)
+    if cached is None:
+        cached = OmegaConf.load(path)
+        _OMEGA_CACHE[key] = cached
+        if len(_OMEGA_CACHE) > _OMEGA_CACHE_MAX_ENTRIES:
+            _OMEGA_CACHE.popitem(last=False)
+    else:
+        _OMEGA_CACHE.move_to_end(key)
+    return copy.deepcopy(cached)
 
 
 def _resolve_config_paths(names: Sequence[str]) -> List[Path]:
@@ -108,9 +140,13 @@ def _resolve_config_paths(names: Sequence[str]) -> List[Path]:
 
 
 def _merge_confs(base_conf: Any, overlays: Sequence[Any]) -> Any:
+    """Merge overlays into base_conf in place; callers must not reuse the inputs."""
+
+    from omegaconf import OmegaConf
+
     cfg = base_conf
     for overlay in overlays:
-        cfg = OmegaConf.merge(cfg, overlay)
+        cfg = OmegaConf.unsafe_merge(cfg, overlay)
     return cfg
 
 
@@ -122,8 +158,10 @@ def _resolve_paths(app_cfg: AppConfig) -> AppConfig:
 def _apply_overrides(cfg: Any, overrides: Sequence[str]) -> Any:
     if not overrides:
         return cfg
+    from omegaconf import OmegaConf
+
     override_conf = OmegaConf.from_dotlist(list(overrides))
-    return OmegaConf.merge(cfg, override_conf)
+    return OmegaConf.unsafe_merge(cfg, override_conf)
 
 
 def _default_config_names(config_name: Optional[Union[str, Sequence[str]]]) -> List[str]:
@@ -142,6 +180,8 @@ def _load_config_internal(
 ) -> AppConfig:
     """Internal cached loader keyed by config target + overrides tuple."""
 
+    from omegaconf import OmegaConf
+
     base = _load_omegaconf(BASE_CONFIG_PATH)
     overlay_names = [name for name in config_name_key.split(",") if name]
     overlay_paths = _resolve_config_paths(overlay_names)
@@ -168,6 +208,7 @@ def load_config(
 
     if reload:
         _load_config_internal.cache_clear()
+        _OMEGA_CACHE.clear()
 
     cfg = _load_config_internal(name_key, overrides_key)
     return cfg
@@ -4,10 +4,18 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Mapping, Optional
 
-import pandas as pd
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# pandas/numpy are imported inside the functions that need them so scalar
+# helpers (normalize_region_name, haversine_km) stay cheap to import.
+
+EARTH_RADIUS_KM = 6371.0
 
 
 @dataclass(frozen=True)
@@ -21,25 +29,50 @@ class RegionLookupEntry:
     longitude: float | None = None
 
 
+@lru_cache(maxsize=4096)
+def _normalize_region_name_cached(value: str) -> str:
+    # str.replace runs in C and beats a translate() table here; split() trims and collapses.
+    clean = value.replace(".", "").replace("-", " ").replace("_", " ").lower()
+    return " ".join(clean.split())
+
+
 def normalize_region_name(value: str | None) -> str:
-    """Normalize names for consistent region joins."""
+    """Normalize names for consistent region joins.
+
+    Results are memoized per distinct string since facility region values repeat heavily.
+    """
 
     if not value:
         return ""
-    clean = (
-        str(value)
-        .strip()
-        .replace(".", "")
-        .replace("-", " ")
-        .replace("_", " ")
-        .lower()
+    return _normalize_region_name_cached(str(value))
+
+
+def region_name_cache_clear() -> None:
+    """Drop memoized `normalize_region_name` results."""
+
+    _normalize_region_name_cached.cache_clear()
+
+
+def normalize_region_names(values: pd.Series) -> pd.Series:
+    """Vectorized `normalize_region_name` for whole columns; nulls normalize to ""."""
+
+    return (
+        values.fillna("")
+        .astype(str)
+        .str.replace(".", "", regex=False)
+        .str.replace("-", " ", regex=False)
+        .str.replace("_", " ", regex=False)
+        .str.lower()
+        .str.split()
+        .str.join(" ")
     )
-    return " ".join(part for part in clean.split() if part)
 
 
 def load_region_lookup(csv_path: Path) -> pd.DataFrame:
     """Load region lookup table with normalized name column."""
 
+    import pandas as pd
+
     if not csv_path.exists():
         raise FileNotFoundError(f"Region lookup file not found: {csv_path}")
 
@@ -51,33 +84,62 @@ def load_region_lookup(csv_path: Path) -> pd.DataFrame:
             f"Region lookup missing required columns: {', '.join(sorted(missing))}"
         )
     df = df.copy()
-    df["region_name_norm"] = df["region_name"].apply(normalize_region_name)
+    df["region_name_norm"] = normalize_region_names(df["region_name"])
     return df
 
 
+def build_region_index(lookup: pd.DataFrame) -> Dict[str, RegionLookupEntry]:
+    """Map normalized region name -> lookup entry (first row wins on duplicates)."""
+
+    import pandas as pd
+
+    index: Dict[str, RegionLookupEntry] = {}
+    countries = lookup["country"] if "country" in lookup.columns else [None] * len(lookup)
+    for norm, region_id, region_name, country in zip(
+        lookup["region_name_norm"], lookup["region_id"], lookup["region_name"], countries
+    ):
+        if norm and norm not in index:
+            index[norm] = RegionLookupEntry(
+                region_id=str(region_id),
+                region_name=str(region_name),
+                country=None if pd.isna(country) else str(country),
+            )
+    return index
+
+
 def assign_region(
     facility_row: pd.Series,
-    lookup: pd.DataFrame,
+    lookup: pd.DataFrame | Mapping[str, RegionLookupEntry],
     *,
     facility_region_field: str,
 ) -> tuple[str, str]:
-    """Return (region_id, region_name) for a facility row."""
+    """Return (region_id, region_name) for a facility row.
+
+    Pass the result of `build_region_index` when assigning many rows; a raw
+    lookup frame is indexed on every call.
+    """
 
     region_value = facility_row.get(facility_region_field)
     norm = normalize_region_name(region_value)
     if not norm:
         return "", ""
-    matches = lookup[lookup["region_name_norm"] == norm]
-    if matches.empty:
+    index = lookup if isinstance(lookup, Mapping) else build_region_index(lookup)
+    entry = index.get(norm)
+    if entry is None:
         return "", str(region_value)
-    row = matches.iloc[0]
-    return str(row["region_id"]), str(row["region_name"])
+    return entry.region_id, entry.region_name
 
 
 def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """Compute Haversine distance between two coordinates in km."""
+    """Compute Haversine distance between two coordinates in km.
+
+    Array-like arguments are broadcast through NumPy and return an array.
+    """
+
+    if not all(isinstance(value, (int, float)) for value in (lat1, lon1, lat2, lon2)):
+        return _haversine_km_array(lat1, lon1, lat2, lon2)
 
-    radius = 6371.0
+    radius = EARTH_RADIUS_KM
 
     phi1 = math.radians(lat1)
     phi2 = math.radians(lat2)
@@ -91,14 +153,172 @@ def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return radius * c
 
 
-def within_radius(
-    facilities: pd.DataFrame,
+def _haversine_km_array(lat1, lon1, lat2, lon2) -> "np.ndarray":
+    import numpy as np
+
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    d_phi = np.radians(np.subtract(lat2, lat1, dtype=np.float64))
+    d_lambda = np.radians(np.subtract(lon2, lon1, dtype=np.float64))
+    a = np.sin(d_phi / 2.0) ** 2 + np.cos(phi1) * np.cos(phi2) * np.sin(d_lambda / 2.0) ** 2
+    return EARTH_RADIUS_KM * 2.0 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+
+
+# Below this many points the NumPy path beats numba's parallel dispatch overhead.
+_NUMBA_MIN_ROWS = 4096
+
+
+@lru_cache(maxsize=1)
+def _numba_haversine_kernel():
+    """Compile (once, cached on disk) a parallel numba haversine kernel, or None without numba."""
+
+    try:
+        import numba
+        import numpy as np
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+
+    # No fastmath: it assumes NaN-free inputs, and NaN coordinates must map to inf.
+    @numba.njit(parallel=True, cache=True)
+    def kernel(latitudes, longitudes, latitude, longitude):  # pragma: no cover - needs numba
+        out = np.empty(latitudes.shape[0], dtype=np.float64)
+        cos_phi2 = math.cos(math.radians(latitude))
+        for i in numba.prange(latitudes.shape[0]):
+            d_phi = math.radians(latitude - latitudes[i])
+            d_lambda = math.radians(longitude - longitudes[i])
+            a = (
+                math.sin(d_phi / 2.0) ** 2
+                + math.cos(math.radians(latitudes[i])) * cos_phi2 * math.sin(d_lambda / 2.0) ** 2
+            )
+            distance = EARTH_RADIUS_KM * 2.0 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a))
+            out[i] = math.inf if math.isnan(distance) else distance
+        return out
+
+    return kernel
+
+
+@lru_cache(maxsize=1)
+def _numba_radians_haversine_kernel():
+    """Numba twin of `haversine_distances_from_radians`, or None without numba."""
+
+    try:
+        import numba
+        import numpy as np
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+
+    @numba.njit(parallel=True, cache=True)
+    def kernel(phi, lam, cos_phi, phi2, lam2):  # pragma: no cover - needs numba
+        out = np.empty(phi.shape[0], dtype=np.float64)
+        cos_phi2 = math.cos(phi2)
+        for i in numba.prange(phi.shape[0]):
+            a = (
+                math.sin((phi2 - phi[i]) / 2.0) ** 2
+                + cos_phi[i] * cos_phi2 * math.sin((lam2 - lam[i]) / 2.0) ** 2
+            )
+            distance = EARTH_RADIUS_KM * 2.0 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a))
+            out[i] = math.inf if math.isnan(distance) else distance
+        return out
+
+    return kernel
+
+
+def haversine_distances_km(
+    latitudes: "np.ndarray",
+    longitudes: "np.ndarray",
+    *,
+    latitude: float,
+    longitude: float,
+) -> "np.ndarray":
+    """Vectorized `haversine_km` from one coordinate to float arrays; NaN coordinates map to inf.
+
+    Large inputs use a parallel numba kernel when numba is installed.
+    """
+
+    import numpy as np
+
+    if len(latitudes) >= _NUMBA_MIN_ROWS:
+        kernel = _numba_haversine_kernel()
+        if kernel is not None:
+            return kernel(
+                np.ascontiguousarray(latitudes, dtype=np.float64),
+                np.ascontiguousarray(longitudes, dtype=np.float64),
+                float(latitude),
+                float(longitude),
+            )
+
+    phi = np.radians(latitudes)
+    return haversine_distances_from_radians(
+        phi, np.radians(longitudes), np.cos(phi), latitude=latitude, longitude=longitude
+    )
+
+
+def haversine_distances_from_radians(
+    phi: "np.ndarray",
+    lam: "np.ndarray",
+    cos_phi: "np.ndarray",
+    *,
+    latitude: float,
+    longitude: float,
+) -> "np.ndarray":
+    """`haversine_distances_km` over precomputed radians and cos(latitude) arrays.
+
+    Lets callers that query the same points repeatedly convert them only once.
+    """
+
+    import numpy as np
+
+    if len(phi) >= _NUMBA_MIN_ROWS:
+        kernel = _numba_radians_haversine_kernel()
+        if kernel is not None:
+            return kernel(
+                np.ascontiguousarray(phi, dtype=np.float64),
+                np.ascontiguousarray(lam, dtype=np.float64),
+                np.ascontiguousarray(cos_phi, dtype=np.float64),
+                math.radians(latitude),
+                math.radians(longitude),
+            )
+
+    phi2 = math.radians(latitude)
+    d_phi = phi2 - phi
+    d_lambda = math.radians(longitude) - lam
+    a = np.sin(d_phi / 2.0) ** 2 + cos_phi * math.cos(phi2) * np.sin(d_lambda / 2.0) ** 2
+    distances = EARTH_RADIUS_KM * 2.0 * np.arctan2(np.sqrt(a), np.sqrt(1.0 - a))
+    return np.where(np.isnan(distances), np.inf, distances)
+
+
+def bounding_box_mask(
+    latitudes: "np.ndarray",
+    longitudes: "np.ndarray",
     *,
     latitude: float,
     longitude: float,
     radius_km: float,
-) -> pd.DataFrame:
-    """Filter facilities within radius_km of given coordinate."""
+) -> "np.ndarray":
+    """Cheap lat/lon box test that keeps every point within radius_km (and some beyond).
+
+    Trig-free on the arrays, so it can prune candidates before exact haversine distances.
+    NaN coordinates never pass.
+    """
+
+    import numpy as np
+
+    angular = radius_km / EARTH_RADIUS_KM
+    # A hair of slack keeps rounding from dropping points that sit exactly on the radius.
+    lat_delta = math.degrees(angular) + 1e-9
+    mask = np.abs(latitudes - latitude) <= lat_delta
+    if abs(latitude) + lat_delta < 90.0 and angular < math.pi / 2:
+        # Widest longitude span of the circle; it is reached poleward of the centre latitude.
+        lon_delta = math.degrees(
+            math.asin(min(1.0, math.sin(angular) / math.cos(math.radians(latitude))))
+        ) + 1e-9
+        wrapped = np.abs((longitudes - longitude + 180.0) % 360.0 - 180.0)
+        mask &= wrapped <= lon_delta
+    return mask
+
+
+def require_geo_columns(facilities: pd.DataFrame) -> None:
+    """Raise ValueError unless the frame has latitude/longitude columns."""
 
     required_cols = {"latitude", "longitude"}
     missing = [col for col in required_cols if col not in facilities.columns]
@@ -107,24 +327,45 @@ def within_radius(
             f"Facilities frame missing required geo columns: {', '.join(missing)}"
         )
 
-    def _distance(row: pd.Series) -> float:
-        lat = row.get("latitude")
-        lon = row.get("longitude")
-        if pd.isna(lat) or pd.isna(lon):
-            return float("inf")
-        return haversine_km(float(lat), float(lon), latitude, longitude)
 
-    distances = facilities.apply(_distance, axis=1)
-    facilities = facilities.copy()
-    facilities["distance_km"] = distances
-    return facilities[facilities["distance_km"] <= radius_km]
+def within_radius(
+    facilities: pd.DataFrame,
+    *,
+    latitude: float,
+    longitude: float,
+    radius_km: float,
+) -> pd.DataFrame:
+    """Filter facilities within radius_km of given coordinate."""
+
+    import numpy as np
+    import pandas as pd
+
+    require_geo_columns(facilities)
+    lat = pd.to_numeric(facilities["latitude"], errors="coerce").to_numpy(dtype=np.float64)
+    lon = pd.to_numeric(facilities["longitude"], errors="coerce").to_numpy(dtype=np.float64)
+    candidates = np.flatnonzero(
+        bounding_box_mask(lat, lon, latitude=latitude, longitude=longitude, radius_km=radius_km)
+    )
+    distances = haversine_distances_km(
+        lat[candidates], lon[candidates], latitude=latitude, longitude=longitude
+    )
+
+    within = distances <= radius_km
+    return facilities.iloc[candidates[within]].assign(distance_km=distances[within])
 
 
 __all__ = [
     "RegionLookupEntry",
     "normalize_region_name",
+    "normalize_region_names",
+    "region_name_cache_clear",
     "load_region_lookup",
+    "build_region_index",
     "assign_region",
     "haversine_km",
+    "haversine_distances_km",
+    "haversine_distances_from_radians",
+    "bounding_box_mask",
+    "require_geo_columns",
     "within_radius",
 ]
@@ -5,13 +5,18 @@ from __future__ import annotations
 import json
 import logging
 import logging.config
+import time
 from dataclasses import dataclass
-from datetime import datetime
 from typing import Mapping, MutableMapping, Optional
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 from .config import AppConfig
 
-_STANDARD_RECORD_KEYS = set(vars(logging.LogRecord("", 0, "", 0, "", (), None)))
+_STANDARD_RECORD_KEYS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None)))
 
 
 class JsonFormatter(logging.Formatter):
@@ -19,7 +24,8 @@ class JsonFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         log_entry = {
-            "timestamp": datetime.utcfromtimestamp(record.created).isoformat() + "Z",
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(record.created))
+            + f".{int(record.msecs):03d}Z",
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -28,12 +34,19 @@ class JsonFormatter(logging.Formatter):
             log_entry["exc_info"] = self.formatException(record.exc_info)
         if record.stack_info:
             log_entry["stack_info"] = self.formatStack(record.stack_info)
-        if record.__dict__:
+        attributes = record.__dict__
+        # Every record carries the standard keys; only look for extras when there are more.
+        if len(attributes) > len(_STANDARD_RECORD_KEYS):
             extra = {
-                key: value for key, value in record.__dict__.items() if key not in _STANDARD_RECORD_KEYS
+                key: value for key, value in attributes.items() if key not in _STANDARD_RECORD_KEYS
             }
             if extra:
                 log_entry["extra"] = extra
+        if orjson is not None:
+            try:
+                return orjson.dumps(log_entry, default=str).decode("utf-8")
+            except TypeError:
+                pass
         return json.dumps(log_entry, default=str)
 
 
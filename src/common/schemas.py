@@ -0,0 +1,34 @@
+"""Shared in-memory dtypes for facility, claim and coverage tables."""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional
+
+import pandas as pd
+
+# Low-cardinality label columns. As categoricals, equality filters, isin and groupby work on
+# integer codes and each distinct string is stored once.
+CATEGORICAL_COLS = frozenset(
+    {"region_id", "region_name", "capability", "status", "confidence_label", "desert_flag"}
+)
+
+
+def coerce_schema(frame: pd.DataFrame, columns: Optional[Iterable[str]] = None) -> pd.DataFrame:
+    """Return `frame` with its label columns (`CATEGORICAL_COLS` by default) as categoricals.
+
+    Columns that are missing or already categorical are skipped, and `frame` itself is
+    returned when nothing needs converting. Numeric columns keep their float64 dtype:
+    confidence thresholds such as 0.7 are not representable in float32, so downcast scores
+    would fall on the wrong side of them.
+    """
+
+    wanted = CATEGORICAL_COLS if columns is None else columns
+    converted = {
+        column: frame[column].astype("category")
+        for column in wanted
+        if column in frame.columns and not isinstance(frame[column].dtype, pd.CategoricalDtype)
+    }
+    return frame.assign(**converted) if converted else frame
+
+
+__all__ = ["CATEGORICAL_COLS", "coerce_schema"]
@@ -4,9 +4,15 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Sequence
+from typing import TYPE_CHECKING, Any, Sequence
 
-import pandas as pd
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class StorageError(RuntimeError):
@@ -24,6 +30,8 @@ def read_parquet(path: Path, *, required_columns: Sequence[str] | None = None) -
 
     if not path.exists():
         raise StorageError(f"Parquet file not found: {path}")
+    import pandas as pd
+
     frame = pd.read_parquet(path)
     if required_columns:
         missing = [column for column in required_columns if column not in frame.columns]
@@ -34,11 +42,37 @@ def read_parquet(path: Path, *, required_columns: Sequence[str] | None = None) -
     return frame
 
 
-def write_parquet(frame: pd.DataFrame, path: Path, *, index: bool = False) -> Path:
-    """Write DataFrame to parquet, creating parent directories if needed."""
+def write_parquet(
+    frame: pd.DataFrame,
+    path: Path,
+    *,
+    index: bool = False,
+    sort_by: str | Sequence[str] | None = None,
+    row_group_size: int | None = None,
+    compression: str | None = "snappy",
+    write_statistics: bool = True,
+) -> Path:
+    """Write DataFrame to parquet, creating parent directories if needed.
+
+    `sort_by` clusters rows on the most-filtered column(s) so per-row-group
+    min/max statistics let readers skip row groups on equality/range filters.
+    """
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
 
     ensure_parent_dir(path)
-    frame.to_parquet(path, index=index)
+    if sort_by is not None:
+        frame = frame.sort_values(by=sort_by, kind="mergesort")
+    table = pa.Table.from_pandas(frame, preserve_index=index)
+    pq.write_table(
+        table,
+        path,
+        compression=compression,
+        row_group_size=row_group_size,
+        write_statistics=write_statistics,
+        use_dictionary=True,
+    )
     return path
 
 
@@ -51,12 +85,23 @@ def read_json(path: Path) -> Any:
         return json.load(handle)
 
 
-def write_json(payload: Any, path: Path, *, indent: int = 2) -> Path:
-    """Write JSON payload to disk."""
+def write_json(payload: Any, path: Path, *, indent: int | None = 2) -> Path:
+    """Write JSON payload to disk; `indent=None` writes compact JSON."""
 
     ensure_parent_dir(path)
+    # orjson only indents by two spaces; other widths (or unsupported payloads) use stdlib json.
+    if orjson is not None and indent in (2, None):
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent == 2 else 0)
+        try:
+            data = orjson.dumps(payload, option=option)
+        except TypeError:
+            pass
+        else:
+            path.write_bytes(data)
+            return path
     with path.open("w", encoding="utf-8") as handle:
-        json.dump(payload, handle, indent=indent, ensure_ascii=False)
+        separators = (",", ":") if indent is None else None
+        json.dump(payload, handle, indent=indent, separators=separators, ensure_ascii=False)
     return path
 
 
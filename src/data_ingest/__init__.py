@@ -1,7 +1,12 @@
 """Data ingestion utilities (VF loader, scraper, chunker, document store)."""
 
 from .chunker import ChunkerConfig, TextChunk, TextChunker
-from .document_store import DocumentRecord, build_raw_document_rows, write_raw_documents
+from .document_store import (
+    DocumentRecord,
+    build_raw_document_columns,
+    build_raw_document_rows,
+    write_raw_documents,
+)
 from .scraper import ScrapeRequest, ScraperConfig, WebScraper
 from .vf_loader import VFIngestResult, load_vf_data
 
@@ -10,6 +15,7 @@ __all__ = [
     "TextChunker",
     "TextChunk",
     "DocumentRecord",
+    "build_raw_document_columns",
     "build_raw_document_rows",
     "write_raw_documents",
     "ScrapeRequest",
@@ -2,15 +2,29 @@
 
 from __future__ import annotations
 
+import hashlib
 import re
 from dataclasses import dataclass
-from typing import Iterable, List
+from typing import Callable, Iterable, List, Optional, Tuple
 from uuid import uuid4
 
 
 _SENTENCE_SPLIT_REGEX = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9])")
 
 
+def chunk_id_for(id_seed: str, index: int) -> str:
+    """Deterministic chunk id for the `index`-th chunk of the document seeded by `id_seed`."""
+
+    return hashlib.blake2b(f"{id_seed}:{index}".encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _chunk_id_factory(id_seed: Optional[str]) -> Callable[[int], str]:
+    if id_seed is not None:
+        return lambda index: chunk_id_for(id_seed, index)
+    prefix = uuid4().hex
+    return lambda index: f"{prefix}-{index}"
+
+
 @dataclass(frozen=True)
 class ChunkerConfig:
     max_chars: int = 900
@@ -32,64 +46,78 @@ class TextChunker:
         self.config = config or ChunkerConfig()
 
     def _normalize(self, text: str) -> str:
-        return re.sub(r"\s+", " ", text.strip())
+        # str.split() collapses the same whitespace runs as re's \s+ and strips the ends.
+        return " ".join(text.split())
+
+    def _sentence_spans(self, text: str) -> List[Tuple[int, int]]:
+        """Return (start, end) offsets of each sentence in normalized text."""
 
-    def _split_paragraphs(self, text: str) -> List[str]:
-        paragraphs = [p.strip() for p in re.split(r"\n{2,}", text)]
-        return [p for p in paragraphs if p]
+        spans: List[Tuple[int, int]] = []
+        start = 0
+        for match in _SENTENCE_SPLIT_REGEX.finditer(text):
+            spans.append((start, match.start()))
+            start = match.end()
+        spans.append((start, len(text)))
+        return spans
 
-    def _split_sentences(self, paragraph: str) -> List[str]:
-        sentences = _SENTENCE_SPLIT_REGEX.split(paragraph)
-        if len(sentences) == 1:
-            return [paragraph]
-        return [s.strip() for s in sentences if s.strip()]
+    def chunk(self, text: str, *, id_seed: Optional[str] = None) -> List[TextChunk]:
+        """Split text into chunks.
+
+        With `id_seed` (e.g. the owning doc_id) chunk ids are derived from
+        `(id_seed, index)` and are reproducible; otherwise one random prefix is
+        drawn per call and suffixed with the chunk index.
+        """
 
-    def chunk(self, text: str) -> List[TextChunk]:
         normalized = self._normalize(text)
         if not normalized:
             return []
+        make_id = _chunk_id_factory(id_seed)
 
         max_chars = max(self.config.max_chars, self.config.min_chars)
         overlap = max(0, min(self.config.overlap_chars, max_chars // 2))
 
-        paragraphs = self._split_paragraphs(normalized)
-        sentences: List[str] = []
-        for paragraph in paragraphs:
-            sentences.extend(self._split_sentences(paragraph))
-
+        # _normalize has already folded newlines into spaces, so there are no
+        # paragraph breaks left to split on; go straight to sentences. Sentences
+        # are separated by single spaces, so each chunk is one slice of
+        # `normalized` between a start offset and the end of its last sentence.
         chunks: List[TextChunk] = []
-        buffer: List[str] = []
+        chunk_start: Optional[int] = None
+        chunk_end = 0
         buffer_len = 0
         chunk_index = 0
 
-        for sentence in sentences:
-            sentence_len = len(sentence) + 1
-            if buffer and buffer_len + sentence_len > max_chars:
-                chunk_text = " ".join(buffer).strip()
-                if chunk_text:
-                    chunks.append(
-                        TextChunk(
-                            chunk_id=uuid4().hex,
-                            index=chunk_index,
-                            text=chunk_text,
-                        )
+        for sentence_start, sentence_end in self._sentence_spans(normalized):
+            sentence_len = sentence_end - sentence_start + 1
+            if chunk_start is not None and buffer_len + sentence_len > max_chars:
+                chunks.append(
+                    TextChunk(
+                        chunk_id=make_id(chunk_index),
+                        index=chunk_index,
+                        text=normalized[chunk_start:chunk_end],
                     )
-                    chunk_index += 1
-                if overlap and chunk_text:
-                    buffer = [chunk_text[-overlap:].strip()]
-                    buffer_len = len(buffer[0])
+                )
+                chunk_index += 1
+                if overlap:
+                    chunk_start = max(chunk_start, chunk_end - overlap)
+                    if normalized[chunk_start] == " ":
+                        chunk_start += 1
+                    buffer_len = chunk_end - chunk_start
                 else:
-                    buffer = []
+                    chunk_start = None
                     buffer_len = 0
-            buffer.append(sentence)
+            if chunk_start is None:
+                chunk_start = sentence_start
+            chunk_end = sentence_end
             buffer_len += sentence_len
 
-        if buffer:
-            chunk_text = " ".join(buffer).strip()
-            if chunk_text:
-                chunks.append(
-                    TextChunk(chunk_id=uuid4().hex, index=chunk_index, text=chunk_text)
+        if chunk_start is not None:
+            chunks.append(
+                TextChunk(
+                    chunk_id=make_id(chunk_index),
+                    index=chunk_index,
+                    text=normalized[chunk_start:chunk_end],
                 )
+            )
 
         # Ensure minimum chunk length by merging small trailing chunks
         if len(chunks) >= 2 and len(chunks[-1].text) < self.config.min_chars:
@@ -104,4 +132,4 @@ class TextChunker:
         return chunks
 
 
-__all__ = ["ChunkerConfig", "TextChunk", "TextChunker"]
+__all__ = ["ChunkerConfig", "TextChunk", "TextChunker", "chunk_id_for"]
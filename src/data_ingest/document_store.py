@@ -2,19 +2,20 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence
-from uuid import uuid4
+from typing import Dict, Iterable, List, Sequence, Tuple
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
-from .chunker import TextChunk, TextChunker
+from .chunker import TextChunk, TextChunker, chunk_id_for
 
 
-@dataclass
+@dataclass(slots=True)
 class DocumentRecord:
     facility_id: str
     facility_name: str
@@ -23,10 +24,37 @@ class DocumentRecord:
     source_ref: str
     text: str
     metadata: Dict[str, object] = field(default_factory=dict)
-    doc_id: str = field(default_factory=lambda: uuid4().hex)
+    doc_id: str = ""
+
+    def __post_init__(self) -> None:
+        # Derive a stable id from the source identity so re-ingesting the same
+        # row/URL reproduces its doc_id (and therefore its chunk ids).
+        if not self.doc_id:
+            seed = f"{self.source_type}|{self.source_ref}|{self.facility_id}"
+            self.doc_id = hashlib.blake2b(seed.encode("utf-8"), digest_size=8).hexdigest()
+
+
+_RAW_DOCUMENT_COLUMNS: Tuple[str, ...] = (
+    "doc_id",
+    "chunk_id",
+    "chunk_index",
+    "facility_id",
+    "facility_name",
+    "country",
+    "source_type",
+    "source_ref",
+    "text",
+    "metadata",
+    "ingested_at",
+)
+
+
+_RAW_DOCUMENTS_ROW_GROUP_SIZE = 64_000
 
 
 def _metadata_to_json(metadata: Dict[str, object]) -> str:
+    if not metadata:
+        return "{}"
     try:
         return json.dumps(metadata, ensure_ascii=False)
     except (TypeError, ValueError):
@@ -35,14 +63,14 @@ def _metadata_to_json(metadata: Dict[str, object]) -> str:
 
 
 def _chunk_record(record: DocumentRecord, chunker: TextChunker) -> List[TextChunk]:
-    chunks = chunker.chunk(record.text)
+    chunks = chunker.chunk(record.text, id_seed=record.doc_id)
     if not chunks:
         fallback_text = record.text.strip()
         if not fallback_text:
             return []
         chunks = [
             TextChunk(
-                chunk_id=uuid4().hex,
+                chunk_id=chunk_id_for(record.doc_id, 0),
                 index=0,
                 text=fallback_text,
             )
@@ -50,37 +78,52 @@ def _chunk_record(record: DocumentRecord, chunker: TextChunker) -> List[TextChun
     return chunks
 
 
-def build_raw_document_rows(
+def build_raw_document_columns(
     records: Sequence[DocumentRecord],
     chunker: TextChunker,
-) -> List[Dict[str, object]]:
-    """Transform DocumentRecord list into chunk rows ready for DataFrame creation."""
+) -> Dict[str, List[object]]:
+    """Transform DocumentRecord list into one list per raw_documents column."""
 
-    rows: List[Dict[str, object]] = []
+    columns: Dict[str, List[object]] = {name: [] for name in _RAW_DOCUMENT_COLUMNS}
     ingested_at = datetime.now(timezone.utc).isoformat()
+    # Records from one batch often share a metadata dict; serialize each one once.
+    # Keyed by id() which is safe here because `records` keeps every dict alive.
+    metadata_cache: Dict[int, str] = {}
 
     for record in records:
         chunks = _chunk_record(record, chunker)
         if not chunks:
             continue
-        metadata_json = _metadata_to_json(record.metadata)
+        metadata = record.metadata
+        metadata_json = metadata_cache.get(id(metadata))
+        if metadata_json is None:
+            metadata_json = _metadata_to_json(metadata)
+            metadata_cache[id(metadata)] = metadata_json
+
+        repeat = len(chunks)
+        columns["doc_id"].extend([record.doc_id] * repeat)
+        columns["facility_id"].extend([record.facility_id] * repeat)
+        columns["facility_name"].extend([record.facility_name] * repeat)
+        columns["country"].extend([record.country] * repeat)
+        columns["source_type"].extend([record.source_type] * repeat)
+        columns["source_ref"].extend([record.source_ref] * repeat)
+        columns["metadata"].extend([metadata_json] * repeat)
+        columns["ingested_at"].extend([ingested_at] * repeat)
         for chunk in chunks:
-            rows.append(
-                {
-                    "doc_id": record.doc_id,
-                    "chunk_id": chunk.chunk_id,
-                    "chunk_index": chunk.index,
-                    "facility_id": record.facility_id,
-                    "facility_name": record.facility_name,
-                    "country": record.country,
-                    "source_type": record.source_type,
-                    "source_ref": record.source_ref,
-                    "text": chunk.text,
-                    "metadata": metadata_json,
-                    "ingested_at": ingested_at,
-                }
-            )
-    return rows
+            columns["chunk_id"].append(chunk.chunk_id)
+            columns["chunk_index"].append(chunk.index)
+            columns["text"].append(chunk.text)
+    return columns
+
+
+def build_raw_document_rows(
+    records: Sequence[DocumentRecord],
+    chunker: TextChunker,
+) -> List[Dict[str, object]]:
+    """Transform DocumentRecord list into chunk rows ready for DataFrame creation."""
+
+    columns = build_raw_document_columns(records, chunker)
+    return [dict(zip(columns, row)) for row in zip(*columns.values())]
 
 
 def write_raw_documents(
@@ -90,14 +133,26 @@ def write_raw_documents(
 ) -> Path:
     """Write raw_documents.parquet containing chunked representations."""
 
-    rows = build_raw_document_rows(records, chunker)
-    if not rows:
+    columns = build_raw_document_columns(records, chunker)
+    if not columns["chunk_id"]:
         raise ValueError("No documents were generated; nothing to write.")
 
-    df = pd.DataFrame(rows)
+    # Columns go straight to Arrow; no pandas frame needed.
+    table = pa.table(columns)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(output_path, index=False)
+    pq.write_table(
+        table,
+        output_path,
+        compression="snappy",
+        row_group_size=_RAW_DOCUMENTS_ROW_GROUP_SIZE,
+        use_dictionary=True,
+    )
     return output_path
 
 
-__all__ = ["DocumentRecord", "build_raw_document_rows", "write_raw_documents"]
+__all__ = [
+    "DocumentRecord",
+    "build_raw_document_columns",
+    "build_raw_document_rows",
+    "write_raw_documents",
+]
@@ -2,22 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import gzip
 import hashlib
+import importlib.util
 import logging
+import os
 import re
-import threading
+import tempfile
 import time
 from dataclasses import dataclass
+from fnmatch import fnmatchcase
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Any, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 from uuid import uuid4
 
 try:
+    import anyio
     import httpx
 except ImportError:  # pragma: no cover
+    anyio = None
     httpx = None
 
 try:
@@ -25,10 +31,56 @@ try:
 except ImportError:  # pragma: no cover
     BeautifulSoup = None
 
-from .document_store import DocumentRecord
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # pragma: no cover
+    HTMLParser = None
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
 
+# Tree builder for BeautifulSoup when selectolax is absent: the C-backed lxml if present.
+BS4_FEATURES = "lxml" if importlib.util.find_spec("lxml") is not None else "html.parser"
 
-@dataclass(frozen=True)
+if HTMLParser is not None:
+    _HTML_TEXT_BACKEND = "selectolax"
+elif BeautifulSoup is not None:
+    _HTML_TEXT_BACKEND = "bs4-" + BS4_FEATURES.replace(".", "-")
+else:
+    _HTML_TEXT_BACKEND = "regex"
+
+from .document_store import DocumentRecord
+
+# HTTP/2 needs the optional `h2` package (httpx[http2]); fall back to HTTP/1.1 keep-alive without it.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def build_async_client(
+    *,
+    user_agent: str,
+    timeout: float,
+    max_connections: int,
+    max_keepalive_connections: Optional[int] = None,
+) -> "httpx.AsyncClient":
+    """Pooled AsyncClient shared by all requests of one run (HTTP/2 when available)."""
+
+    if httpx is None:  # pragma: no cover
+        raise RuntimeError("httpx is required for scraping. Install via `pip install httpx`.")
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        timeout=timeout,
+        follow_redirects=True,
+        headers={"User-Agent": user_agent},
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=(
+                max_connections if max_keepalive_connections is None else max_keepalive_connections
+            ),
+        ),
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class ScrapeRequest:
     facility_id: str
     facility_name: str
@@ -54,45 +106,130 @@ class ScraperConfig:
     use_playwright_fallback: bool = False
     # Min seconds between requests to the same host (politeness; 0 = disabled).
     delay_between_requests_per_domain: float = 0.0
+    # Stop reading a page body after this many bytes (0 = unlimited).
+    max_response_bytes: int = 5_000_000
+    # Host patterns (fnmatch, e.g. "*.gov.gh") trusted without fetching robots.txt.
+    robots_allowlist: Tuple[str, ...] = ()
 
 
 class RobotsCache:
-    def __init__(self, user_agent: str) -> None:
-        self.user_agent = user_agent
-        self._cache: dict[str, RobotFileParser] = {}
+    """Per-origin robots.txt rules, fetched through the scraper's pooled client and kept for `ttl_sec`."""
 
-    def allowed(self, url: str) -> bool:
+    def __init__(
+        self,
+        user_agent: str,
+        *,
+        ttl_sec: float = 24 * 3600.0,
+        timeout_sec: float = 5.0,
+        allowlist: Iterable[str] = (),
+    ) -> None:
+        self.user_agent = user_agent
+        self.ttl_sec = ttl_sec
+        self.timeout_sec = timeout_sec
+        self.allowlist = tuple(pattern.lower() for pattern in allowlist if pattern)
+        self._cache: dict[str, tuple[RobotFileParser, float]] = {}
+        # One in-flight fetch per origin; concurrent requests to the same host await it.
+        self._pending: dict[str, asyncio.Future[RobotFileParser]] = {}
+
+    async def allowed(self, client: "httpx.AsyncClient", url: str) -> bool:
         parsed = urlparse(url)
+        host = parsed.hostname or ""
+        if self.allowlist and any(fnmatchcase(host, pattern) for pattern in self.allowlist):
+            return True
         key = f"{parsed.scheme}://{parsed.netloc}"
-        parser = self._cache.get(key)
-        if parser is None:
-            parser = RobotFileParser()
-            parser.set_url(f"{key}/robots.txt")
-            try:
-                parser.read()
-            except Exception:
-                parser = RobotFileParser()
-                parser.parse("User-agent: *\nDisallow:\n".splitlines())
-            self._cache[key] = parser
+        parser = await self._parser_for(client, key)
         try:
             return parser.can_fetch(self.user_agent, url)
         except Exception:
             return True
 
+    async def _parser_for(self, client: "httpx.AsyncClient", key: str) -> RobotFileParser:
+        cached = self._cache.get(key)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await pending
+        pending = asyncio.ensure_future(self._fetch(client, key))
+        self._pending[key] = pending
+        try:
+            parser = await pending
+        finally:
+            self._pending.pop(key, None)
+        self._cache[key] = (parser, time.monotonic() + self.ttl_sec)
+        return parser
+
+    async def _fetch(self, client: "httpx.AsyncClient", key: str) -> RobotFileParser:
+        parser = RobotFileParser()
+        parser.set_url(f"{key}/robots.txt")
+        try:
+            response = await client.get(f"{key}/robots.txt", timeout=self.timeout_sec)
+        except Exception:
+            parser.allow_all = True
+            return parser
+        # Same status handling as RobotFileParser.read().
+        if response.status_code in (401, 403):
+            parser.disallow_all = True
+        elif response.status_code >= 400:
+            parser.allow_all = True
+        else:
+            parser.parse(_get_response_text(response).splitlines())
+        return parser
+
 
 def _clean_html(raw_html: str) -> str:
     if not raw_html:
         return ""
+    if HTMLParser is not None:
+        tree = HTMLParser(raw_html)
+        for node in tree.css("script, style, noscript"):
+            node.decompose()
+        root = tree.body or tree.root
+        return root.text(separator="\n", strip=True) if root is not None else ""
     if BeautifulSoup is not None:
-        soup = BeautifulSoup(raw_html, "html.parser")
-        for tag in soup(["script", "style", "noscript"]):
-            tag.extract()
+        soup = BeautifulSoup(raw_html, BS4_FEATURES)
+        # decompose() frees the removed subtrees instead of keeping them detached.
+        for tag in soup.find_all(("script", "style", "noscript")):
+            tag.decompose()
         return soup.get_text(separator="\n", strip=True)
-    text = re.sub(r"<[^>]+>", " ", raw_html)
-    text = re.sub(r"\s+", " ", text)
+    text = _TAG_RE.sub(" ", raw_html)
+    text = _WS_RE.sub(" ", text)
     return text.strip()
 
 
+def _read_gzip_text(path: Path) -> str:
+    with gzip.open(path, "rt", encoding="utf-8") as handle:
+        return handle.read()
+
+
+def _write_gzip_text_atomic(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a sibling temp file and rename so readers never see a torn entry.
+    with tempfile.NamedTemporaryFile(dir=path.parent, suffix=".tmp", delete=False) as tmp:
+        try:
+            with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=3) as handle:
+                handle.write(content)
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    os.replace(tmp.name, path)
+
+
+async def _read_capped(response: "httpx.Response", max_bytes: int) -> bytes:
+    """Read a streamed body, stopping once `max_bytes` have arrived (<= 0 disables the cap)."""
+
+    chunks: List[bytes] = []
+    total = 0
+    async for chunk in response.aiter_bytes():
+        if max_bytes > 0 and total + len(chunk) >= max_bytes:
+            chunks.append(chunk[: max_bytes - total])
+            break
+        chunks.append(chunk)
+        total += len(chunk)
+    return b"".join(chunks)
+
+
 def _get_response_text(response: Any) -> str:
     """Get response body as text with robust encoding handling."""
     try:
@@ -106,7 +243,17 @@ def _get_response_text(response: Any) -> str:
     return raw.decode("utf-8", errors="replace")
 
 
-def _fetch_with_playwright(request: ScrapeRequest, logger: logging.Logger) -> Optional[DocumentRecord]:
+@dataclass(frozen=True, slots=True)
+class FetchedPage:
+    """Cleaned text for one URL plus how it was obtained; shared by every request for that URL."""
+
+    text: str
+    from_cache: bool = False
+    status_code: Optional[int] = None
+    fetched_via: Optional[str] = None
+
+
+def _fetch_with_playwright(url: str, logger: logging.Logger) -> Optional[FetchedPage]:
     """Optional fallback: use headless browser for JS-heavy or bot-resistant pages. Requires playwright."""
     try:
         from playwright.sync_api import sync_playwright
@@ -118,36 +265,26 @@ def _fetch_with_playwright(request: ScrapeRequest, logger: logging.Logger) -> Op
             browser = p.chromium.launch(headless=True)
             page = browser.new_page()
             page.set_extra_http_headers({"User-Agent": "BMD-Ingestor/0.1"})
-            page.goto(request.url, wait_until="domcontentloaded", timeout=30000)
+            page.goto(url, wait_until="domcontentloaded", timeout=30000)
             page.wait_for_timeout(2000)  # allow minimal JS to run
             html = page.content()
             browser.close()
         text = _clean_html(html)
         if not text.strip():
             return None
-        metadata = {
-            "url": request.url,
-            "from_cache": False,
-            "status_code": 200,
-            "source_field": request.source_field,
-            "fetched_via": "playwright",
-        }
-        return DocumentRecord(
-            facility_id=request.facility_id,
-            facility_name=request.facility_name,
-            country=request.country,
-            source_type="scraped_web",
-            source_ref=request.url,
-            text=text,
-            metadata=metadata,
-        )
+        return FetchedPage(text=text, status_code=200, fetched_via="playwright")
     except Exception as exc:
-        logger.warning("Playwright fallback failed", extra={"url": request.url, "error": str(exc)})
+        logger.warning("Playwright fallback failed", extra={"url": url, "error": str(exc)})
         return None
 
 
 class WebScraper:
-    """Threaded scraper with caching, exponential backoff, and optional Playwright fallback."""
+    """Async scraper with caching, exponential backoff, and optional Playwright fallback.
+
+    `config.concurrency` worker tasks drain a bounded queue of requests. All fetches of
+    one `scrape()` call share a single pooled client, so requests to the same host reuse
+    connections (multiplexed over HTTP/2 when `h2` is installed).
+    """
 
     def __init__(self, config: ScraperConfig, logger: logging.Logger) -> None:
         if httpx is None:  # pragma: no cover
@@ -157,57 +294,106 @@ class WebScraper:
         self.cache_dir = config.cache_dir
         if self.cache_dir:
             Path(self.cache_dir).mkdir(parents=True, exist_ok=True)
-        self.robots = RobotsCache(config.user_agent) if config.respect_robots else None
-        self.client = httpx.Client(
-            timeout=config.timeout_sec,
-            follow_redirects=True,
-            headers={"User-Agent": config.user_agent},
+        self.robots = (
+            RobotsCache(config.user_agent, allowlist=config.robots_allowlist)
+            if config.respect_robots
+            else None
         )
-        self._domain_delay_lock = threading.Lock()
-        self._last_request_per_host: dict[str, float] = {}
+        self._next_request_per_host: dict[str, float] = {}
+        self._cache_index: Optional[set[str]] = None
 
-    def _cache_path(self, url: str) -> Optional[Path]:
+    def _cache_path(self, url: str, suffix: str = ".html.gz") -> Optional[Path]:
         if not self.cache_dir:
             return None
         digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
-        return Path(self.cache_dir) / f"{digest}.html"
+        return Path(self.cache_dir) / f"{digest}{suffix}"
+
+    def _text_cache_path(self, url: str) -> Optional[Path]:
+        # Keyed by parser backend so switching parsers re-cleans from the raw HTML.
+        return self._cache_path(url, f".{_HTML_TEXT_BACKEND}.txt.gz")
+
+    def _cache_entries(self) -> set[str]:
+        """File names in the cache dir, listed with one scandir on first use instead of a stat per lookup."""
+
+        if self._cache_index is None:
+            self._cache_index = (
+                {entry.name for entry in os.scandir(self.cache_dir) if entry.is_file()}
+                if self.cache_dir
+                else set()
+            )
+        return self._cache_index
+
+    def _is_cached(self, path: Optional[Path]) -> bool:
+        return path is not None and path.name in self._cache_entries()
+
+    def _store(self, path: Path, content: str) -> None:
+        _write_gzip_text_atomic(path, content)
+        self._cache_entries().add(path.name)
 
     def _read_cache(self, url: str) -> Optional[str]:
         path = self._cache_path(url)
-        if path and path.exists():
-            return path.read_text(encoding="utf-8")
+        if not path:
+            return None
+        if self._is_cached(path):
+            return _read_gzip_text(path)
+        # Migrate entries written before the cache was compressed.
+        legacy_path = path.with_suffix("")
+        if self._is_cached(legacy_path):
+            content = legacy_path.read_text(encoding="utf-8")
+            self._write_cache(url, content)
+            legacy_path.unlink(missing_ok=True)
+            self._cache_entries().discard(legacy_path.name)
+            return content
         return None
 
-    def _write_cache(self, url: str, content: str) -> None:
+    def _read_cached_text(self, url: str) -> Optional[str]:
+        """Cleaned text for a cached page; only re-parses HTML when no sidecar exists yet."""
+
+        text_path = self._text_cache_path(url)
+        if self._is_cached(text_path):
+            return _read_gzip_text(text_path)
+        html = self._read_cache(url)
+        if not html:
+            return None
+        text = _clean_html(html)
+        if text_path:
+            self._store(text_path, text)
+        return text
+
+    def _write_cache(self, url: str, content: str, text: Optional[str] = None) -> None:
         path = self._cache_path(url)
-        if path:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(content, encoding="utf-8")
+        if not path:
+            return
+        self._store(path, content)
+        text_path = self._text_cache_path(url)
+        if text is not None and text_path:
+            self._store(text_path, text)
 
-    def _apply_domain_delay(self, url: str) -> None:
+    async def _apply_domain_delay(self, url: str) -> None:
         """Enforce minimum delay between requests to the same host (politeness)."""
         delay = getattr(self.config, "delay_between_requests_per_domain", 0.0) or 0.0
         if delay <= 0:
             return
         parsed = urlparse(url)
         host = parsed.netloc or url
-        with self._domain_delay_lock:
-            now = time.monotonic()
-            last = self._last_request_per_host.get(host, 0)
-            self._last_request_per_host[host] = now
-            wait = max(0, delay - (now - last))
+        # Reserve the host's next free slot before sleeping, so concurrent requests to one
+        # host queue up `delay` apart while other hosts proceed immediately. There is no
+        # await between the read and the update, so this is atomic on the event loop.
+        now = time.monotonic()
+        slot = max(now, self._next_request_per_host.get(host, now))
+        self._next_request_per_host[host] = slot + delay
+        wait = slot - now
         if wait > 0:
-            time.sleep(wait)
+            await asyncio.sleep(wait)
 
-    def _fetch(self, request: ScrapeRequest) -> Optional[DocumentRecord]:
-        if self.robots and not self.robots.allowed(request.url):
-            self.logger.info("Skipping URL due to robots.txt", extra={"url": request.url})
+    async def _fetch_page(self, client: "httpx.AsyncClient", url: str) -> Optional[FetchedPage]:
+        if self.robots and not await self.robots.allowed(client, url):
+            self.logger.info("Skipping URL due to robots.txt", extra={"url": url})
             return None
 
-        cached = self._read_cache(request.url)
-        if cached:
-            text = _clean_html(cached)
-            return self._build_document(request, text, from_cache=True)
+        cached_text = self._read_cached_text(url)
+        if cached_text is not None:
+            return FetchedPage(text=cached_text, from_cache=True)
 
         retry_on = getattr(self.config, "retry_on_status", (429, 502, 503)) or ()
         backoff_base = getattr(self.config, "backoff_base_sec", 1.0)
@@ -219,38 +405,47 @@ class WebScraper:
             if attempt > 0:
                 # Exponential backoff; respect Retry-After if we have it (set by caller when applicable).
                 wait = min(backoff_base * (2 ** (attempt - 1)), backoff_max)
-                time.sleep(wait)
+                await asyncio.sleep(wait)
 
-            self._apply_domain_delay(request.url)
+            await self._apply_domain_delay(url)
 
             try:
-                response = self.client.get(request.url)
-                last_status = response.status_code
-
-                if response.status_code in retry_on and attempt < self.config.retries:
-                    # Optional: use Retry-After header if present.
-                    retry_after = response.headers.get("Retry-After")
-                    if retry_after and retry_after.isdigit():
-                        wait = min(int(retry_after), int(backoff_max))
-                        time.sleep(wait)
-                    self.logger.warning(
-                        "Scrape got retryable status, will retry",
-                        extra={"url": request.url, "status": response.status_code, "attempt": attempt + 1},
-                    )
-                    continue
-
-                response.raise_for_status()
-                html = _get_response_text(response)
-                self._write_cache(request.url, html)
+                # Stream so non-HTML bodies are never downloaded and huge pages are capped.
+                async with client.stream("GET", url) as response:
+                    last_status = response.status_code
+
+                    if response.status_code in retry_on and attempt < self.config.retries:
+                        # Optional: use Retry-After header if present.
+                        retry_after = response.headers.get("Retry-After")
+                        if retry_after and retry_after.isdigit():
+                            wait = min(int(retry_after), int(backoff_max))
+                            await asyncio.sleep(wait)
+                        self.logger.warning(
+                            "Scrape got retryable status, will retry",
+                            extra={"url": url, "status": response.status_code, "attempt": attempt + 1},
+                        )
+                        continue
+
+                    response.raise_for_status()
+                    content_type = response.headers.get("Content-Type", "")
+                    if content_type and "html" not in content_type.lower():
+                        self.logger.info(
+                            "Skipping non-HTML response",
+                            extra={"url": url, "content_type": content_type},
+                        )
+                        return None
+                    body = await _read_capped(response, self.config.max_response_bytes)
+                html = body.decode(response.charset_encoding or "utf-8", errors="replace")
                 text = _clean_html(html)
-                return self._build_document(request, text, status_code=response.status_code)
+                self._write_cache(url, html, text)
+                return FetchedPage(text=text, status_code=response.status_code)
             except Exception as exc:
                 last_error = exc
                 status_code = getattr(getattr(exc, "response", None), "status_code", None)
                 self.logger.warning(
                     "Scrape attempt failed",
                     extra={
-                        "url": request.url,
+                        "url": url,
                         "attempt": attempt + 1,
                         "error": str(exc),
                         "status": status_code,
@@ -260,52 +455,93 @@ class WebScraper:
                     break
 
         if getattr(self.config, "use_playwright_fallback", False):
-            doc = _fetch_with_playwright(request, self.logger)
-            if doc is not None:
-                return doc
+            # The sync Playwright API refuses to run inside an event loop; use a worker thread.
+            page = await asyncio.to_thread(_fetch_with_playwright, url, self.logger)
+            if page is not None:
+                return page
 
         if last_error:
             self.logger.error(
-                "Failed to scrape URL", extra={"url": request.url, "error": str(last_error)}
+                "Failed to scrape URL", extra={"url": url, "error": str(last_error)}
             )
         return None
 
-    def _build_document(
-        self,
-        request: ScrapeRequest,
-        text: str,
-        *,
-        from_cache: bool = False,
-        status_code: Optional[int] = None,
-    ) -> DocumentRecord:
+    def _build_document(self, request: ScrapeRequest, page: FetchedPage) -> DocumentRecord:
         metadata = {
             "url": request.url,
-            "from_cache": from_cache,
-            "status_code": status_code,
+            "from_cache": page.from_cache,
+            "status_code": page.status_code,
             "source_field": request.source_field,
         }
+        if page.fetched_via:
+            metadata["fetched_via"] = page.fetched_via
         return DocumentRecord(
             facility_id=request.facility_id,
             facility_name=request.facility_name,
             country=request.country,
             source_type="scraped_web",
             source_ref=request.url,
-            text=text,
+            text=page.text,
             metadata=metadata,
         )
 
     def scrape(self, requests: Iterable[ScrapeRequest]) -> List[DocumentRecord]:
-        docs: List[DocumentRecord] = []
+        """Blocking entry point; runs `scrape_async` on a fresh event loop."""
+
         request_list = list(requests)
         if not request_list:
-            return docs
-        with ThreadPoolExecutor(max_workers=self.config.concurrency or 4) as executor:
-            future_map = {executor.submit(self._fetch, req): req for req in request_list}
-            for future in as_completed(future_map):
-                document = future.result()
-                if document:
-                    docs.append(document)
-        return docs
+            return []
+        return anyio.run(self.scrape_async, request_list)
 
+    async def scrape_async(self, requests: Iterable[ScrapeRequest]) -> List[DocumentRecord]:
+        request_list = list(requests)
+        if not request_list:
+            return []
+        # Several facilities often share one website; fetch each URL once and fan the
+        # page back out to every request that referenced it.
+        requests_by_url: Dict[str, List[ScrapeRequest]] = {}
+        for request in request_list:
+            requests_by_url.setdefault(request.url, []).append(request)
+        urls = list(requests_by_url)
+        concurrency = self.config.concurrency or 4
+        # Filled by position so documents come back in request order.
+        pages: List[Optional[FetchedPage]] = [None] * len(urls)
+        # Bounded queue: the producer waits for free workers instead of scheduling every
+        # URL up front.
+        send_stream, receive_stream = anyio.create_memory_object_stream(
+            max_buffer_size=concurrency * 2
+        )
 
-__all__ = ["ScrapeRequest", "ScraperConfig", "WebScraper"]
+        async with build_async_client(
+            user_agent=self.config.user_agent,
+            timeout=self.config.timeout_sec,
+            max_connections=concurrency,
+        ) as client:
+
+            async def _worker(queue: Any) -> None:
+                async with queue:
+                    async for position, url in queue:
+                        try:
+                            pages[position] = await self._fetch_page(client, url)
+                        except Exception as exc:
+                            self.logger.error(
+                                "Failed to scrape URL", extra={"url": url, "error": str(exc)}
+                            )
+
+            async with anyio.create_task_group() as task_group:
+                async with receive_stream:
+                    for _ in range(min(concurrency, len(urls))):
+                        task_group.start_soon(_worker, receive_stream.clone())
+                async with send_stream:
+                    for item in enumerate(urls):
+                        await send_stream.send(item)
+
+        return [
+            self._build_document(request, page)
+            for url, page in zip(urls, pages)
+            if page is not None
+            for request in requests_by_url[url]
+        ]
+
+
+__all__ = ["ScrapeRequest", "ScraperConfig", "WebScraper", "build_async_client"]
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import urllib.parse
 from dataclasses import dataclass, field
-from typing import Iterable, List, Optional, Set
+from typing import Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
 
 import httpx
 import pandas as pd
 from bs4 import BeautifulSoup
 
-from .scraper import ScrapeRequest
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # pragma: no cover
+    HTMLParser = None
+
+from .scraper import BS4_FEATURES, ScrapeRequest, build_async_client
+
+
+# Columns _build_query draws search terms from, in priority order.
+_QUERY_FIELDS = ("facility_name", "name", "city", "district", "region")
+# Every column expand() reads per row; the rest of the frame is never touched.
+_ROW_FIELDS = ("facility_id", "country") + _QUERY_FIELDS
 
 
 @dataclass(frozen=True)
@@ -21,6 +33,11 @@ class SearchExpansionConfig:
     extra_terms: List[str] = field(default_factory=lambda: ["hospital"])
     country_hint: str = "Ghana"
     max_core_terms: int = 3
+    # Max search queries in flight at once (all share one pooled connection set).
+    concurrency: int = 8
+    # Also issue the query without country_hint alongside the primary one; its
+    # results are used only when the primary query finds nothing.
+    fallback_without_country: bool = False
     user_agent: str = (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
         "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0 Safari/537.36"
@@ -32,12 +49,10 @@ class DuckDuckGoSearchClient:
 
     ENDPOINT = "https://duckduckgo.com/html/"
 
-    def __init__(self, user_agent: str, timeout: float = 15.0) -> None:
-        self.client = httpx.Client(
-            headers={"User-Agent": user_agent},
-            timeout=timeout,
-            follow_redirects=True,
-        )
+    def __init__(self, user_agent: str, timeout: float = 15.0, concurrency: int = 8) -> None:
+        self.user_agent = user_agent
+        self.timeout = timeout
+        self.concurrency = max(1, concurrency)
 
     @staticmethod
     def _extract_url(href: str) -> Optional[str]:
@@ -52,13 +67,19 @@ class DuckDuckGoSearchClient:
             return None
         return href
 
-    def search(self, query: str, max_results: int) -> List[str]:
-        response = self.client.get(self.ENDPOINT, params={"q": query})
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
+    @staticmethod
+    def _result_hrefs(html: str) -> Iterable[str]:
+        if HTMLParser is not None:
+            for node in HTMLParser(html).css("a.result__a"):
+                yield node.attributes.get("href") or ""
+            return
+        for anchor in BeautifulSoup(html, BS4_FEATURES).select("a.result__a"):
+            yield anchor.get("href", "")
+
+    def _parse_results(self, html: str, max_results: int) -> List[str]:
         urls: List[str] = []
-        for anchor in soup.select("a.result__a"):
-            url = self._extract_url(anchor.get("href", ""))
+        for href in self._result_hrefs(html):
+            url = self._extract_url(href)
             if not url:
                 continue
             if not url.startswith(("http://", "https://")):
@@ -68,6 +89,62 @@ class DuckDuckGoSearchClient:
                 break
         return urls
 
+    async def search(self, client: httpx.AsyncClient, query: str, max_results: int) -> List[str]:
+        response = await client.get(self.ENDPOINT, params={"q": query})
+        response.raise_for_status()
+        return self._parse_results(response.text, max_results)
+
+    async def search_first(
+        self, client: httpx.AsyncClient, queries: Sequence[str], max_results: int
+    ) -> List[str]:
+        """Run query variants concurrently; return the first non-empty result in priority order.
+
+        Lower-priority variants still in flight are cancelled once a result is chosen.
+        Errors are only raised when no variant produced any URLs.
+        """
+
+        tasks = [asyncio.ensure_future(self.search(client, query, max_results)) for query in queries]
+        first_error: Optional[BaseException] = None
+        try:
+            for task in tasks:
+                try:
+                    urls = await task
+                except Exception as exc:  # pragma: no cover - network variability
+                    first_error = first_error or exc
+                    continue
+                if urls:
+                    return urls
+        finally:
+            for task in tasks:
+                task.cancel()
+        if first_error is not None:
+            raise first_error
+        return []
+
+    async def search_many(
+        self, query_groups: Sequence[Sequence[str]], max_results: int
+    ) -> List[Union[List[str], BaseException]]:
+        """Run each group of query variants concurrently over one pooled client.
+
+        Failures are returned in place of results, not raised.
+        """
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        async with build_async_client(
+            user_agent=self.user_agent,
+            timeout=self.timeout,
+            max_connections=self.concurrency,
+        ) as client:
+
+            async def _bounded_search(queries: Sequence[str]) -> List[str]:
+                async with semaphore:
+                    return await self.search_first(client, queries, max_results)
+
+            return await asyncio.gather(
+                *(_bounded_search(queries) for queries in query_groups),
+                return_exceptions=True,
+            )
+
 
 class SearchExpander:
     """Build additional scrape requests by searching facility metadata."""
@@ -79,13 +156,17 @@ class SearchExpander:
     ) -> None:
         self.config = config
         self.logger = logger
-        self.client = DuckDuckGoSearchClient(user_agent=config.user_agent)
+        self.client = DuckDuckGoSearchClient(
+            user_agent=config.user_agent,
+            concurrency=config.concurrency,
+        )
 
-    def _build_query(self, row: pd.Series) -> Optional[str]:
-        priority_fields = ["facility_name", "name", "city", "district", "region"]
+    def _build_query(
+        self, row: Mapping[str, object], *, include_country: bool = True
+    ) -> Optional[str]:
         terms: List[str] = []
         seen = set()
-        for field in priority_fields:
+        for field in _QUERY_FIELDS:
             value = row.get(field)
             if not isinstance(value, str):
                 continue
@@ -114,7 +195,7 @@ class SearchExpander:
             if len(terms) >= self.config.max_core_terms + 1:
                 break
 
-        if self.config.country_hint:
+        if include_country and self.config.country_hint:
             country = self.config.country_hint.strip()
             if country and country.lower() not in seen:
                 terms.append(country)
@@ -122,6 +203,18 @@ class SearchExpander:
         query = " ".join(terms[: self.config.max_core_terms + 2])
         return query if query else None
 
+    def _build_queries(self, row: Mapping[str, object]) -> Tuple[str, ...]:
+        """Primary query first, then any fallback variants (empty when the row has no terms)."""
+
+        query = self._build_query(row)
+        if not query:
+            return ()
+        if self.config.fallback_without_country:
+            fallback = self._build_query(row, include_country=False)
+            if fallback and fallback != query:
+                return (query, fallback)
+        return (query,)
+
     def expand(
         self,
         facilities: pd.DataFrame,
@@ -133,18 +226,30 @@ class SearchExpander:
         if not self.config.enabled:
             return []
 
+        # Project to the columns actually read, then zip plain tuples into small
+        # dicts; no Series or namedtuple is built per row.
+        columns = [column for column in _ROW_FIELDS if column in facilities.columns]
+        pending = []
+        for cells in facilities[columns].itertuples(index=False, name=None):
+            row = dict(zip(columns, cells))
+            queries = self._build_queries(row)
+            if queries:
+                pending.append((row, queries))
+        if not pending:
+            return []
+
+        results = asyncio.run(
+            self.client.search_many([queries for _, queries in pending], self.config.max_results)
+        )
+
+        # Dedupe after the gather, in row order, so the first facility to find a URL keeps it.
         url_set = set(existing_urls or [])
         requests: List[ScrapeRequest] = []
-        for row in facilities.itertuples(index=False):
-            query = self._build_query(pd.Series(row._asdict()))
-            if not query:
-                continue
-            try:
-                urls = self.client.search(query, self.config.max_results)
-            except Exception as exc:  # pragma: no cover - network variability
+        for (row, queries), urls in zip(pending, results):
+            if isinstance(urls, BaseException):  # pragma: no cover - network variability
                 self.logger.warning(
                     "Search query failed",
-                    extra={"query": query, "error": str(exc)},
+                    extra={"query": queries[0], "error": str(urls)},
                 )
                 continue
             for url in urls:
@@ -153,11 +258,11 @@ class SearchExpander:
                 url_set.add(url)
                 requests.append(
                     ScrapeRequest(
-                        facility_id=str(getattr(row, "facility_id")),
+                        facility_id=str(row["facility_id"]),
                         facility_name=str(
-                            getattr(row, "facility_name", getattr(row, "name", "Unknown Facility"))
+                            row.get("facility_name", row.get("name", "Unknown Facility"))
                         ),
-                        country=str(getattr(row, "country", self.config.country_hint)),
+                        country=str(row.get("country", self.config.country_hint)),
                         url=url,
                         source_field="search_query",
                     )
@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import datetime
+import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
-from uuid import uuid4
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 import pandas as pd
 
@@ -28,6 +31,10 @@ TEXT_FIELDS_DEFAULT = [
     "free_text",
 ]
 
+_NON_WORD_RE = re.compile(r"[^\w\s]")
+_CAMEL_BOUNDARY_RE = re.compile(r"(?<!^)(?=[A-Z])")
+_URL_SPLIT_RE = re.compile(r"[;,\s]+")
+
 
 @dataclass
 class VFIngestResult:
@@ -37,8 +44,8 @@ class VFIngestResult:
 
 
 def _snake_case(value: str) -> str:
-    value = re.sub(r"[^\w\s]", "_", value)
-    value = re.sub(r"(?<!^)(?=[A-Z])", "_", value)
+    value = _NON_WORD_RE.sub("_", value)
+    value = _CAMEL_BOUNDARY_RE.sub("_", value)
     value = value.replace("__", "_")
     return value.strip("_").lower()
 
@@ -47,12 +54,40 @@ def _load_csv_files(csv_dir: Path) -> List[pd.DataFrame]:
     csv_files = sorted(csv_dir.glob("*.csv"))
     if not csv_files:
         raise FileNotFoundError(f"No CSV files found under {csv_dir}")
-    dataframes = []
-    for file in csv_files:
+    # Arrow's multi-threaded CSV reader releases the GIL, so files also parse in parallel.
+    with ThreadPoolExecutor(max_workers=min(8, len(csv_files))) as executor:
+        return list(executor.map(_read_csv_file, csv_files))
+
+
+def _temporal_columns(df: pd.DataFrame) -> List[str]:
+    """Columns Arrow parsed as timestamps, dates or times (Arrow columns are homogeneous)."""
+
+    columns = []
+    for name, values in df.items():
+        if pd.api.types.is_datetime64_any_dtype(values.dtype):
+            columns.append(name)
+        elif values.dtype == object:
+            first = values.first_valid_index()
+            if first is not None and isinstance(values[first], (datetime.date, datetime.time)):
+                columns.append(name)
+    return columns
+
+
+def _read_csv_file(file: Path) -> pd.DataFrame:
+    try:
+        # Default (NumPy) dtypes are kept so downstream fillna("")/astype(str) behave as before.
+        df = pd.read_csv(file, engine="pyarrow")
+    except ValueError:
+        # Rows Arrow's stricter tokenizer rejects still load through the C engine.
         df = pd.read_csv(file)
-        df["__source_file__"] = file.name
-        dataframes.append(df)
-    return dataframes
+    else:
+        # Arrow infers dates and times the C engine leaves as text, and they would render
+        # differently in document text ("10:00" -> "10:00:00"); re-read those cells verbatim.
+        temporal = _temporal_columns(df)
+        if temporal:
+            df[temporal] = pd.read_csv(file, usecols=temporal, dtype=str)
+    df["__source_file__"] = file.name
+    return df
 
 
 def _normalize_dataframe(df: pd.DataFrame) -> pd.DataFrame:
@@ -83,47 +118,39 @@ def _coalesce_columns(df: pd.DataFrame, columns: Sequence[str]) -> Optional[str]
     return None
 
 
-def _clean_value(value: object) -> Optional[str]:
-    if pd.isna(value):
-        return None
-    text = str(value).strip()
-    return text or None
+URL_FIELDS = [
+    "source_url",
+    "source_urls",
+    "website",
+    "websites",
+    "link",
+    "links",
+]
 
 
-def _build_text_bundle(row: pd.Series, text_fields: Sequence[str]) -> str:
-    chunks: List[str] = []
-    for field in text_fields:
-        if field not in row:
-            continue
-        value = _clean_value(row[field])
-        if not value:
-            continue
-        label = field.replace("_", " ").title()
-        chunks.append(f"{label}: {value}")
-    return "\n".join(chunks)
-
-
-def _extract_urls(row: pd.Series) -> Set[str]:
-    url_fields = [
-        "source_url",
-        "source_urls",
-        "website",
-        "websites",
-        "link",
-        "links",
-    ]
-    urls: Set[str] = set()
-    for field in url_fields:
-        if field not in row:
-            continue
-        value = _clean_value(row[field])
+def _clean_column(df: pd.DataFrame, column: str) -> List[Optional[str]]:
+    """Stripped string per cell, None for null/blank cells or a missing column."""
+
+    if column not in df.columns:
+        return [None] * len(df)
+    values = df[column]
+    stripped = values.astype(str).str.strip().tolist()
+    keep = values.notna().tolist()
+    return [text if ok and text else None for text, ok in zip(stripped, keep)]
+
+
+def _split_urls(values: Iterable[Optional[str]]) -> List[str]:
+    """Unique http(s) URLs from delimited cell values, in first-seen order."""
+
+    urls: Dict[str, None] = {}
+    for value in values:
         if not value:
             continue
-        for candidate in re.split(r"[;,\\s]+", value):
+        for candidate in _URL_SPLIT_RE.split(value):
             candidate = candidate.strip()
             if candidate.lower().startswith("http://") or candidate.lower().startswith("https://"):
-                urls.add(candidate)
-    return urls
+                urls.setdefault(candidate, None)
+    return list(urls)
 
 
 def _ensure_facility_id(df: pd.DataFrame) -> pd.DataFrame:
@@ -131,8 +158,10 @@ def _ensure_facility_id(df: pd.DataFrame) -> pd.DataFrame:
     if column:
         df["facility_id"] = df[column].fillna("").astype(str).replace("", pd.NA)
     if "facility_id" not in df.columns or df["facility_id"].isna().all():
+        # One urandom read for the whole frame instead of a uuid4() per row.
+        random_hex = os.urandom(5 * len(df)).hex()
         df["facility_id"] = [
-            f"vf_{uuid4().hex[:10]}" for _ in range(len(df))
+            f"vf_{random_hex[offset:offset + 10]}" for offset in range(0, len(random_hex), 10)
         ]
     df["facility_id"] = df["facility_id"].astype(str)
     return df
@@ -167,16 +196,42 @@ def load_vf_data(
     documents: List[DocumentRecord] = []
     scrape_requests: List[ScrapeRequest] = []
 
-    for idx, row in df.iterrows():
-        facility_id = row["facility_id"]
-        facility_name = _clean_value(row.get("facility_name")) or _clean_value(row.get("name")) or "Unknown Facility"
-        country_value = _clean_value(row.get("country")) or country or "Unknown"
-        text_bundle = _build_text_bundle(row, text_field_list)
-        if text_bundle:
+    # Clean every relevant column once, then assemble rows by zipping plain lists
+    # instead of materializing a Series per row with iterrows().
+    row_count = len(df)
+    present_fields = [field for field in text_field_list if field in df.columns]
+    labels = [field.replace("_", " ").title() for field in present_fields]
+    text_columns = [_clean_column(df, field) for field in present_fields]
+    url_columns = [_clean_column(df, field) for field in URL_FIELDS if field in df.columns]
+    source_files = (
+        df["__source_file__"].tolist() if "__source_file__" in df.columns else [""] * row_count
+    )
+
+    for idx, facility_id, name, alt_name, row_country, source_file, text_values, url_values in zip(
+        df.index.tolist(),
+        df["facility_id"].tolist(),
+        _clean_column(df, "facility_name"),
+        _clean_column(df, "name"),
+        _clean_column(df, "country"),
+        source_files,
+        zip(*text_columns) if text_columns else repeat((), row_count),
+        zip(*url_columns) if url_columns else repeat((), row_count),
+    ):
+        facility_name = name or alt_name or "Unknown Facility"
+        country_value = row_country or country or "Unknown"
+        # One pass over the row's text cells yields both the bundle lines and the field list.
+        filled = [
+            (field, f"{label}: {value}")
+            for field, label, value in zip(present_fields, labels, text_values)
+            if value
+        ]
+        if filled:
+            fields, lines = zip(*filled)
+            text_bundle = "\n".join(lines)
             metadata = {
                 "row_index": int(idx),
-                "source_file": row.get("__source_file__", ""),
-                "fields": [field for field in text_field_list if field in row and _clean_value(row[field])],
+                "source_file": source_file,
+                "fields": list(fields),
             }
             documents.append(
                 DocumentRecord(
@@ -184,14 +239,15 @@ def load_vf_data(
                     facility_name=facility_name,
                     country=country_value,
                     source_type="vf_row",
-                    source_ref=f"vf_row:{row.get('__source_file__','')}:{idx}",
+                    source_ref=f"vf_row:{source_file}:{idx}",
                     text=text_bundle,
                     metadata=metadata,
                 )
             )
 
-        urls = _extract_urls(row)
-        for url in urls:
+        if not any(url_values):
+            continue
+        for url in _split_urls(url_values):
             scrape_requests.append(
                 ScrapeRequest(
                     facility_id=facility_id,
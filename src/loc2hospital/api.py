@@ -60,8 +60,8 @@ class Loc2HospitalService:
         return ranked.reset_index(drop=True)
 
     def facility_detail(self, facility_id: str) -> pd.DataFrame:
-        frame = self.engine.facilities
-        return frame[frame["facility_id"] == facility_id]
+        # Facilities have one row per capability, so this is a multi-row index lookup.
+        return self.engine.rows_where("facility_id", facility_id)
 
 
 __all__ = ["SearchRequest", "Loc2HospitalService"]
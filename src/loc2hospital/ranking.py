@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from typing import List, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 
 def _normalized_strategy(strategy: str) -> str:
@@ -17,21 +20,100 @@ def _normalized_strategy(strategy: str) -> str:
     return aliases.get(value, "confidence")
 
 
+def _descending_key(values: pd.Series) -> np.ndarray:
+    """Sort key ordering larger values first and missing values last."""
+
+    if pd.api.types.is_float_dtype(values.dtype):
+        # Negated floats order like the factorized codes below without a hash-and-sort
+        # pass. Missing values take the next float past the largest key, which stays finite
+        # so `_already_ranked` can diff the key (inf - inf would be NaN).
+        key = -values.to_numpy(dtype=np.float64, na_value=np.nan)
+        missing = np.isnan(key)
+        if not missing.any():
+            if np.isfinite(key).all():
+                return key
+        elif missing.all():
+            return np.zeros(len(key))
+        else:
+            fill = np.nextafter(np.nanmax(key), np.inf)
+            if np.isfinite(fill) and not np.isinf(key).any():
+                key[missing] = fill
+                return key
+    codes, uniques = pd.factorize(values, sort=True)
+    # factorize codes missing values as -1, which maps past the largest key here.
+    return len(uniques) - 1 - codes
+
+
+def _list_length_key(facilities: pd.DataFrame, column: str) -> np.ndarray:
+    if column not in facilities.columns:
+        return np.zeros(len(facilities), dtype=np.int64)
+    values = facilities[column]
+    if isinstance(values.dtype, pd.ArrowDtype) and pa.types.is_list(values.dtype.pyarrow_dtype):
+        # Arrow list columns (as loaded by Loc2Med) carry their lengths in the offsets.
+        lengths = pc.list_value_length(pa.array(values.array)).fill_null(0)
+        return lengths.to_numpy(zero_copy_only=False).astype(np.int64)
+    return np.fromiter(
+        (
+            len(value) if isinstance(value, (list, np.ndarray)) else 0
+            for value in facilities[column]
+        ),
+        dtype=np.int64,
+        count=len(facilities),
+    )
+
+
+def _sort_key_names(facilities: pd.DataFrame, strategy: str) -> List[str]:
+    """Names of a strategy's sort keys, most significant first."""
+
+    if _normalized_strategy(strategy) == "completeness":
+        return ["missing_prerequisites", "flags", "confidence"]
+    if "updated_at" in facilities.columns:
+        return ["confidence", "updated_at"]
+    return ["confidence"]
+
+
+def _sort_key(facilities: pd.DataFrame, name: str) -> np.ndarray:
+    if name in ("missing_prerequisites", "flags"):
+        return _list_length_key(facilities, name)
+    return _descending_key(facilities[name])
+
+
+def _sort_keys(facilities: pd.DataFrame, strategy: str) -> List[np.ndarray]:
+    """Sort keys for a strategy, most significant first."""
+
+    return [_sort_key(facilities, name) for name in _sort_key_names(facilities, strategy)]
+
+
+def _already_ranked(keys: List[np.ndarray]) -> bool:
+    """True when rows are already in key order, so a stable sort would not move any."""
+
+    tied: Optional[np.ndarray] = None
+    for key in keys:
+        steps = np.diff(key)
+        if tied is None:
+            if (steps < 0).any():
+                return False
+            tied = steps == 0
+        else:
+            if (steps[tied] < 0).any():
+                return False
+            tied &= steps == 0
+        if not tied.any():
+            return True
+    return True
+
+
+def _ranked_order(facilities: pd.DataFrame, keys: List[np.ndarray]) -> np.ndarray:
+    # np.lexsort is stable and treats its last key as the primary one.
+    return np.lexsort(keys[::-1]) if keys else np.arange(len(facilities))
+
+
 def rank_by_confidence(facilities: pd.DataFrame) -> pd.DataFrame:
     """Rank facilities by confidence (desc) and recency."""
 
     if facilities.empty:
         return facilities.copy()
-    frame = facilities.copy()
-    if "updated_at" not in frame:
-        frame["updated_at"] = None
-    frame = frame.sort_values(
-        by=["confidence", "updated_at"],
-        ascending=[False, False],
-        na_position="last",
-        kind="mergesort",
-    )
-    return frame
+    return facilities.take(_ranked_order(facilities, _sort_keys(facilities, "confidence")))
 
 
 def rank_by_completeness(facilities: pd.DataFrame) -> pd.DataFrame:
@@ -39,34 +121,7 @@ def rank_by_completeness(facilities: pd.DataFrame) -> pd.DataFrame:
 
     if facilities.empty:
         return facilities.copy()
-
-    frame = facilities.copy()
-    if "missing_prerequisites" in frame.columns:
-        frame["missing_prereq_count"] = frame["missing_prerequisites"].apply(
-            lambda value: len(value) if isinstance(value, list) else 0
-        )
-    else:
-        frame["missing_prereq_count"] = 0
-
-    if "flags" in frame.columns:
-        frame["flag_count"] = frame["flags"].apply(
-            lambda value: len(value) if isinstance(value, list) else 0
-        )
-    else:
-        frame["flag_count"] = 0
-    frame = frame.sort_values(
-        by=["missing_prereq_count", "flag_count", "confidence"],
-        ascending=[True, True, False],
-        kind="mergesort",
-    )
-    return frame
-
-
-def _rank_once(facilities: pd.DataFrame, strategy: str) -> pd.DataFrame:
-    normalized = _normalized_strategy(strategy)
-    if normalized == "completeness":
-        return rank_by_completeness(facilities)
-    return rank_by_confidence(facilities)
+    return facilities.take(_ranked_order(facilities, _sort_keys(facilities, "completeness")))
 
 
 def apply_ranking(
@@ -79,12 +134,27 @@ def apply_ranking(
     if facilities.empty:
         return facilities.copy()
 
-    frame = facilities.copy()
-    if secondary_strategy:
-        frame = _rank_once(frame, secondary_strategy)
-    frame = _rank_once(frame, strategy)
+    frame = facilities
+    if len(facilities) > 1:
+        keys = _sort_keys(facilities, strategy)
+        if secondary_strategy and _normalized_strategy(
+            secondary_strategy
+        ) != _normalized_strategy(strategy):
+            # A stable sort by the secondary strategy followed by the primary one is a single
+            # lexicographic sort on the primary keys, then the secondary keys as tie-breakers.
+            # A key already used by the primary strategy cannot break any of its ties,
+            # so only the secondary strategy's new columns are built and appended.
+            names = _sort_key_names(facilities, strategy)
+            keys = keys + [
+                _sort_key(facilities, name)
+                for name in _sort_key_names(facilities, secondary_strategy)
+                if name not in names
+            ]
+        # Results often arrive already ranked; an O(n) check skips the sort and the take().
+        if not _already_ranked(keys):
+            frame = facilities.take(_ranked_order(facilities, keys))
     frame = frame.reset_index(drop=True)
-    frame["rank"] = range(1, len(frame) + 1)
+    frame["rank"] = np.arange(1, len(frame) + 1)
     return frame
 
 
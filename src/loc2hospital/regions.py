@@ -5,9 +5,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from src.common.geo import load_region_lookup, normalize_region_name
+from src.common.geo import build_region_index, load_region_lookup, normalize_region_names
 
 
 def map_facilities_to_regions(
@@ -18,31 +19,27 @@ def map_facilities_to_regions(
 ) -> pd.DataFrame:
     """Return a copy of facilities with `region_id` + `region_name` columns."""
 
-    frame = facilities.copy()
-    if region_field not in frame.columns:
+    if region_field not in facilities.columns:
         raise ValueError(f"Facility data missing region field '{region_field}'.")
 
-    frame["region_name"] = frame[region_field].fillna("Unknown Region")
-    frame["region_id"] = frame["region_name"].apply(normalize_region_name)
-
+    region_names = facilities[region_field].fillna("Unknown Region")
     if lookup_path:
-        lookup = load_region_lookup(lookup_path)
-        region_map = lookup.set_index("region_name_norm")
-        mapped_ids = []
-        mapped_names = []
-        for _, row in frame.iterrows():
-            norm = normalize_region_name(row[region_field])
-            if norm and norm in region_map.index:
-                entry = region_map.loc[norm]
-                mapped_ids.append(str(entry["region_id"]))
-                mapped_names.append(str(entry["region_name"]))
-            else:
-                mapped_ids.append(norm or "unknown_region")
-                mapped_names.append(row["region_name"])
-        frame["region_id"] = mapped_ids
-        frame["region_name"] = mapped_names
-
-    frame["region_id"] = frame["region_id"].fillna("").replace("", "unknown_region")
+        region_index = build_region_index(load_region_lookup(lookup_path))
+        normalized = normalize_region_names(facilities[region_field])
+        region_ids = normalized.map(
+            {norm: entry.region_id for norm, entry in region_index.items()}
+        ).fillna(normalized)
+        region_names = normalized.map(
+            {norm: entry.region_name for norm, entry in region_index.items()}
+        ).fillna(region_names)
+    else:
+        region_ids = normalize_region_names(region_names)
+
+    # assign() shares the untouched columns with `facilities` instead of deep-copying them.
+    frame = facilities.assign(
+        region_name=region_names,
+        region_id=region_ids.replace("", "unknown_region"),
+    )
     return frame
 
 
@@ -54,13 +51,19 @@ def aggregate_region_coverage(facilities: pd.DataFrame) -> pd.DataFrame:
     if missing:
         raise ValueError(f"Facilities missing columns: {', '.join(sorted(missing))}")
 
+    # Indicator columns let every aggregate run as a built-in reduction (no per-group lambdas).
+    confidence = facilities["confidence"]
+    frame = facilities.assign(
+        _confirmed=(confidence >= 0.7).astype(np.int64),
+        _probable=((confidence >= 0.45) & (confidence < 0.7)).astype(np.int64),
+    )
     grouped = (
-        facilities.groupby(["region_id", "region_name", "capability"])
+        frame.groupby(["region_id", "region_name", "capability"])
         .agg(
             facility_count=("facility_id", "nunique"),
             coverage_score=("confidence", "sum"),
-            confirmed_count=("confidence", lambda s: (s >= 0.7).sum()),
-            probable_count=("confidence", lambda s: ((s >= 0.45) & (s < 0.7)).sum()),
+            confirmed_count=("_confirmed", "sum"),
+            probable_count=("_probable", "sum"),
             avg_confidence=("confidence", "mean"),
         )
         .reset_index()
@@ -83,10 +86,12 @@ def apply_desert_labels(
         frame.loc[frame["coverage_score"] <= hard_threshold, "desert_flag"] = "hard"
 
     if 0 < soft_percentile < 100:
-        for capability, subset in frame.groupby("capability"):
-            threshold = subset["coverage_score"].quantile(soft_percentile / 100.0)
-            mask = (frame["capability"] == capability) & (frame["coverage_score"] <= threshold)
-            frame.loc[mask & (frame["desert_flag"] == "none"), "desert_flag"] = "soft"
+        # Per-row threshold of its capability's percentile; rows without a capability get NaN.
+        thresholds = frame.groupby("capability")["coverage_score"].transform(
+            "quantile", soft_percentile / 100.0
+        )
+        soft = (frame["coverage_score"] <= thresholds) & (frame["desert_flag"] == "none")
+        frame.loc[soft, "desert_flag"] = "soft"
     return frame
 
 
@@ -2,12 +2,27 @@
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
-from src.common.geo import within_radius
+from src.common.geo import (
+    EARTH_RADIUS_KM,
+    bounding_box_mask,
+    haversine_distances_from_radians,
+    require_geo_columns,
+)
+
+
+# Grid cells are this many degrees on each side. Radius queries whose bounding box
+# covers more than _GRID_MAX_CELLS cells (or wraps a pole/the antimeridian) scan every row.
+_GRID_CELL_DEG = 0.5
+_GRID_MAX_CELLS = 64
+# Longitude cell offset that keeps combined (lat cell, lon cell) codes non-negative.
+_GRID_LON_CELLS = int(720 / _GRID_CELL_DEG)
 
 
 @dataclass(frozen=True)
@@ -20,51 +35,205 @@ class LocationQuery:
     radius_km: Optional[float] = None
 
 
-def _apply_capability_filter(
-    facilities: pd.DataFrame,
-    capability: Optional[str],
-    min_confidence: float,
-) -> pd.DataFrame:
-    frame = facilities
-    if capability:
-        frame = frame[frame["capability"] == capability]
-    if min_confidence > 0:
-        frame = frame[frame["confidence"] >= min_confidence]
-    return frame
-
-
-def _apply_region_filter(
-    facilities: pd.DataFrame,
-    region_id: Optional[str],
-    region_field: str,
-) -> pd.DataFrame:
-    if not region_id:
-        return facilities
-    if region_field not in facilities.columns:
-        return facilities[facilities["region_id"] == region_id]
-    return facilities[facilities[region_field] == region_id]
-
-
 class LocQueryEngine:
-    """Reusable wrapper for facility filtering operations."""
+    """Reusable wrapper for facility filtering operations.
+
+    Row positions per capability and per region are indexed on first use, so repeated
+    queries against the same facilities look rows up instead of scanning the columns.
+    The remaining filters narrow that position array directly and the frame is sliced
+    once at the end, instead of materializing a frame per filter. Confidence thresholds
+    on a single lookup (or on all rows) binary-search a confidence-sorted copy of it.
+    Unfiltered radius queries start from the rows in the lat/lon grid cells under the
+    query's bounding box instead of from every row.
+    """
 
     def __init__(self, facilities: pd.DataFrame, region_field: str = "region_id") -> None:
         self.facilities = facilities
         self.region_field = region_field
+        self._positions: Dict[str, Dict[object, np.ndarray]] = {}
+        self._numeric: Dict[str, np.ndarray] = {}
+        self._by_confidence: Dict[Tuple[str, object], Tuple[np.ndarray, np.ndarray]] = {}
+        self._radians: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._grid: Optional[Dict[int, np.ndarray]] = None
+
+    def _region_column(self) -> str:
+        return self.region_field if self.region_field in self.facilities.columns else "region_id"
+
+    def _rows_matching(self, column: str, value: object) -> np.ndarray:
+        index = self._positions.get(column)
+        if index is None:
+            # groupby().indices gives ascending row positions per distinct value.
+            index = self.facilities.groupby(column, sort=False, observed=True).indices
+            self._positions[column] = index
+        return index.get(value, np.empty(0, dtype=np.intp))
+
+    def rows_where(self, column: str, value: object) -> pd.DataFrame:
+        """Rows whose `column` equals `value`, in original order, via the lookup index."""
+
+        return self.facilities.take(self._rows_matching(column, value))
+
+    def _numeric_column(self, column: str) -> np.ndarray:
+        values = self._numeric.get(column)
+        if values is None:
+            values = pd.to_numeric(self.facilities[column], errors="coerce").to_numpy(
+                dtype=np.float64
+            )
+            self._numeric[column] = values
+        return values
+
+    def _radian_columns(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Latitude/longitude in radians plus cos(latitude), converted once per engine."""
+
+        if self._radians is None:
+            phi = np.radians(self._numeric_column("latitude"))
+            self._radians = (phi, np.radians(self._numeric_column("longitude")), np.cos(phi))
+        return self._radians
+
+    def _grid_cells(self) -> Dict[int, np.ndarray]:
+        """Ascending row positions per grid cell code; rows without coordinates are left out."""
+
+        if self._grid is None:
+            lat_cells = np.floor(self._numeric_column("latitude") / _GRID_CELL_DEG)
+            lon_cells = np.floor(self._numeric_column("longitude") / _GRID_CELL_DEG)
+            located = np.flatnonzero(np.isfinite(lat_cells) & np.isfinite(lon_cells))
+            codes = (
+                lat_cells[located].astype(np.int64) * (2 * _GRID_LON_CELLS)
+                + lon_cells[located].astype(np.int64)
+                + _GRID_LON_CELLS
+            )
+            self._grid = {
+                int(code): located[rows]
+                for code, rows in pd.Series(codes).groupby(codes, sort=False).indices.items()
+            }
+        return self._grid
+
+    def _rows_near(
+        self, latitude: float, longitude: float, radius_km: float
+    ) -> Optional[np.ndarray]:
+        """Ascending positions of rows in grid cells under the query's bounding box.
+
+        A superset of the rows within radius_km, or None when the box is too large
+        (or wraps) for the grid to help.
+        """
+
+        angular = radius_km / EARTH_RADIUS_KM
+        lat_delta = math.degrees(angular)
+        if abs(latitude) + lat_delta >= 89.0:
+            return None
+        # Same longitude half-width as bounding_box_mask, plus slack for rounding.
+        lon_delta = math.degrees(
+            math.asin(min(1.0, math.sin(angular) / math.cos(math.radians(latitude))))
+        ) + 1e-6
+        if abs(longitude) + lon_delta >= 180.0:
+            return None
+        lat_range = range(
+            math.floor((latitude - lat_delta) / _GRID_CELL_DEG),
+            math.floor((latitude + lat_delta) / _GRID_CELL_DEG) + 1,
+        )
+        lon_range = range(
+            math.floor((longitude - lon_delta) / _GRID_CELL_DEG),
+            math.floor((longitude + lon_delta) / _GRID_CELL_DEG) + 1,
+        )
+        if len(lat_range) * len(lon_range) > _GRID_MAX_CELLS:
+            return None
+        grid = self._grid_cells()
+        cells = [
+            grid[code]
+            for code in (
+                lat_cell * (2 * _GRID_LON_CELLS) + lon_cell + _GRID_LON_CELLS
+                for lat_cell in lat_range
+                for lon_cell in lon_range
+            )
+            if code in grid
+        ]
+        if not cells:
+            return np.empty(0, dtype=np.intp)
+        return np.sort(np.concatenate(cells))
+
+    def _rows_above_confidence(
+        self, key: Tuple[str, object], positions: np.ndarray, min_confidence: float
+    ) -> np.ndarray:
+        """Positions (from the lookup `key`) whose confidence is at least `min_confidence`."""
+
+        if not len(positions):
+            return positions
+        cached = self._by_confidence.get(key)
+        if cached is None:
+            confidence = self._numeric_column("confidence")[positions]
+            # NaN never passes a threshold, so it is left out of the sorted copy.
+            valid = ~np.isnan(confidence)
+            order = np.argsort(confidence[valid], kind="stable")
+            cached = (confidence[valid][order], positions[valid][order])
+            self._by_confidence[key] = cached
+        sorted_confidence, sorted_positions = cached
+        start = np.searchsorted(sorted_confidence, min_confidence, side="left")
+        return np.sort(sorted_positions[start:])
 
     def run(self, query: LocationQuery) -> pd.DataFrame:
-        frame = _apply_capability_filter(
-            self.facilities, query.capability, query.min_confidence
+        positions: Optional[np.ndarray] = None
+        lookup_key: Optional[Tuple[str, object]] = None
+        if query.capability:
+            positions = self._rows_matching("capability", query.capability)
+            lookup_key = ("capability", query.capability)
+        if query.region_id:
+            region_column = self._region_column()
+            region_rows = self._rows_matching(region_column, query.region_id)
+            if positions is None:
+                positions = region_rows
+                lookup_key = (region_column, query.region_id)
+            else:
+                positions = np.intersect1d(positions, region_rows, assume_unique=True)
+                lookup_key = None
+        radius_query = (
+            query.latitude is not None and query.longitude is not None and query.radius_km
         )
-        frame = _apply_region_filter(frame, query.region_id, self.region_field)
-
-        if query.latitude is not None and query.longitude is not None and query.radius_km:
-            frame = within_radius(
-                frame,
+        if radius_query:
+            # Before the grid lookup, which reads the coordinate columns.
+            require_geo_columns(self.facilities)
+        if positions is None and radius_query:
+            positions = self._rows_near(
+                float(query.latitude), float(query.longitude), float(query.radius_km)
+            )
+        if positions is None and (query.min_confidence > 0 or radius_query):
+            positions = np.arange(len(self.facilities))
+            lookup_key = ("", None)  # every row
+
+        if query.min_confidence > 0:
+            if lookup_key is not None:
+                positions = self._rows_above_confidence(
+                    lookup_key, positions, query.min_confidence
+                )
+            else:
+                confidence = self._numeric_column("confidence")[positions]
+                positions = positions[confidence >= query.min_confidence]
+
+        distances: Optional[np.ndarray] = None
+        if radius_query:
+            latitudes = self._numeric_column("latitude")[positions]
+            longitudes = self._numeric_column("longitude")[positions]
+            in_box = bounding_box_mask(
+                latitudes,
+                longitudes,
                 latitude=float(query.latitude),
                 longitude=float(query.longitude),
                 radius_km=float(query.radius_km),
             )
+            positions = positions[in_box]
+            phi, lam, cos_phi = self._radian_columns()
+            distances = haversine_distances_from_radians(
+                phi[positions],
+                lam[positions],
+                cos_phi[positions],
+                latitude=float(query.latitude),
+                longitude=float(query.longitude),
+            )
+            within = distances <= float(query.radius_km)
+            positions = positions[within]
+            distances = distances[within]
+
+        frame = self.facilities if positions is None else self.facilities.take(positions)
+        if distances is not None:
+            frame = frame.assign(distance_km=distances)
         return frame.reset_index(drop=True)
 
 
@@ -3,8 +3,10 @@
 from .map_data import (
     Loc2MedDataset,
     build_dashboard_payload,
+    build_facility_marker_columns,
     build_facility_markers,
     build_region_overlay,
+    build_region_overlay_columns,
     load_loc2med_dataset,
 )
 from .server import Loc2MedBackend, create_fastapi_app, run_fastapi, run_streamlit
@@ -15,7 +17,9 @@ __all__ = [
     "Loc2MedDataset",
     "load_loc2med_dataset",
     "build_facility_markers",
+    "build_facility_marker_columns",
     "build_region_overlay",
+    "build_region_overlay_columns",
     "build_dashboard_payload",
     "Loc2MedBackend",
     "create_fastapi_app",
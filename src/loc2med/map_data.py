@@ -4,30 +4,61 @@ from __future__ import annotations
 
 import ast
 import json
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional
+from typing import Any, Callable, Dict, List, Mapping, Optional
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
+from src.common.schemas import coerce_schema
 from src.common.storage import read_parquet
 from src.loc2hospital.api import Loc2HospitalService, SearchRequest
 
 from .ui_state import UIState
 
 
+# Below this many facility + coverage rows the two payload builders run inline;
+# thread hand-off would cost more than it overlaps.
+_PARALLEL_MIN_ROWS = 1_000
+# Overlay columns are kept per capability filter; past this many distinct filters new ones
+# are built without being stored.
+_OVERLAY_CACHE_MAX_ENTRIES = 256
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _payload_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="loc2med-payload")
+        return _EXECUTOR
+
+
 @dataclass(frozen=True)
 class Loc2MedDataset:
     """Data bundle required to render map and recommendation views."""
 
     facilities: pd.DataFrame
     region_coverage: pd.DataFrame
+    # Overlay columns per capability filter; they depend on nothing else in the UI state.
+    _overlays: Dict[Optional[str], Dict[str, List[Any]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Distinct-value counts for the payload summary; the frames never change after load.
+    _counts: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
 
 
 def _normalize_list_value(value: object) -> List[str]:
     if value is None:
         return []
-    if isinstance(value, list):
+    if isinstance(value, (list, tuple, np.ndarray)):
+        # pandas reads parquet list columns back as NumPy arrays.
         return [str(item) for item in value]
     if isinstance(value, str):
         raw = value.strip()
@@ -44,8 +75,47 @@ def _normalize_list_value(value: object) -> List[str]:
     return [str(value)]
 
 
+_STRING_LIST_TYPES = (pa.list_(pa.string()), pa.list_(pa.large_string()), pa.list_(pa.null()))
+_STRING_LIST = pa.list_(pa.string())
+
+
+def _normalize_list_column(values: pd.Series) -> pd.api.extensions.ExtensionArray:
+    """Column-wide `_normalize_list_value`, returned as an Arrow `list<string>` array.
+
+    Columns that are already lists of strings convert in one Arrow pass without touching
+    Python objects; anything else goes through the per-value parser, parsing each distinct
+    string only once.
+    """
+
+    try:
+        arrow_values = pa.array(values, from_pandas=False)
+    except (pa.ArrowException, TypeError, ValueError):
+        arrow_values = None
+    if (
+        arrow_values is not None
+        and arrow_values.type in _STRING_LIST_TYPES
+        and arrow_values.flatten().null_count == 0
+    ):
+        normalized = arrow_values.cast(_STRING_LIST)
+        if normalized.null_count:
+            normalized = pc.fill_null(normalized, pa.scalar([], type=_STRING_LIST))
+        return pd.arrays.ArrowExtensionArray(normalized)
+
+    parsed_strings: Dict[str, List[str]] = {}
+    rows: List[List[str]] = []
+    for value in values:
+        if isinstance(value, str):
+            parsed = parsed_strings.get(value)
+            if parsed is None:
+                parsed = parsed_strings[value] = _normalize_list_value(value)
+            rows.append(parsed)
+        else:
+            rows.append(_normalize_list_value(value))
+    # Arrow copies the values, so rows may share the memoized parse results.
+    return pd.arrays.ArrowExtensionArray(pa.array(rows, type=_STRING_LIST))
+
+
 def _ensure_facility_columns(frame: pd.DataFrame) -> pd.DataFrame:
-    out = frame.copy()
     defaults: Dict[str, object] = {
         "facility_name": "Unknown Facility",
         "confidence": 0.0,
@@ -53,15 +123,20 @@ def _ensure_facility_columns(frame: pd.DataFrame) -> pd.DataFrame:
         "region_id": "unknown_region",
         "region_name": "Unknown Region",
     }
-    for column, default in defaults.items():
-        if column not in out.columns:
-            out[column] = default
-        out[column] = out[column].fillna(default)
+    missing_defaults = {
+        column: default for column, default in defaults.items() if column not in frame.columns
+    }
+    out = frame.assign(**missing_defaults).fillna(defaults)
 
     for list_column in ["flags", "missing_prerequisites", "evidence_ids"]:
         if list_column not in out.columns:
-            out[list_column] = [[] for _ in range(len(out))]
-        out[list_column] = out[list_column].apply(_normalize_list_value)
+            out[list_column] = pd.arrays.ArrowExtensionArray(
+                pa.array([[]] * len(out), type=_STRING_LIST)
+            )
+        else:
+            out[list_column] = _normalize_list_column(out[list_column])
+
+    out = coerce_schema(out)
 
     if "latitude" not in out.columns:
         out["latitude"] = pd.NA
@@ -70,6 +145,23 @@ def _ensure_facility_columns(frame: pd.DataFrame) -> pd.DataFrame:
     return out
 
 
+def _sort_for_ranking(facilities: pd.DataFrame) -> pd.DataFrame:
+    """Order rows by capability/region, then by the default confidence ranking.
+
+    Each capability+region slice is then already ranked, so `apply_ranking` only has to
+    verify the order for those queries instead of sorting on every request.
+    """
+
+    by = ["capability", "region_id", "confidence"]
+    ascending = [True, True, False]
+    if "updated_at" in facilities.columns:
+        by.append("updated_at")
+        ascending.append(False)
+    return facilities.sort_values(
+        by=by, ascending=ascending, na_position="last", kind="mergesort"
+    ).reset_index(drop=True)
+
+
 def load_loc2med_dataset(
     facility_capabilities_path: Path,
     region_coverage_path: Path,
@@ -84,14 +176,73 @@ def load_loc2med_dataset(
         region_coverage_path,
         required_columns=["region_id", "region_name", "capability", "coverage_score", "desert_flag"],
     )
-    facilities = _ensure_facility_columns(facilities)
+    facilities = _sort_for_ranking(_ensure_facility_columns(facilities))
     return Loc2MedDataset(facilities=facilities, region_coverage=region_coverage)
 
 
-def build_facility_markers(facilities: pd.DataFrame, state: UIState, limit: int = 200) -> List[Dict[str, object]]:
-    """Create lightweight marker payloads for map rendering."""
+_MARKER_FIELDS = (
+    "facility_id",
+    "facility_name",
+    "capability",
+    "status",
+    "confidence",
+    "region_id",
+    "region_name",
+    "latitude",
+    "longitude",
+    "rank",
+    "flags",
+    "missing_prerequisites",
+    "evidence_ids",
+)
+
+_OVERLAY_FIELDS = (
+    "region_id",
+    "region_name",
+    "capability",
+    "coverage_score",
+    "desert_flag",
+    "facility_count",
+    "confirmed_count",
+    "probable_count",
+)
+
+
+def _rows(columns: Mapping[str, List[Any]]) -> List[Dict[str, object]]:
+    return [dict(zip(columns, values)) for values in zip(*columns.values())]
+
+
+def _column_getter(frame: pd.DataFrame) -> Callable[..., List[Any]]:
+    size = len(frame)
+
+    def column(name: str, default: object = None) -> List[Any]:
+        # One tolist() per column converts NumPy scalars in C instead of per cell.
+        return frame[name].tolist() if name in frame.columns else [default] * size
 
-    service = Loc2HospitalService(facilities, region_field="region_id")
+    return column
+
+
+def _list_column(frame: pd.DataFrame, name: str) -> List[List[Any]]:
+    if name not in frame.columns:
+        return [[] for _ in range(len(frame))]
+    values = frame[name]
+    if isinstance(values.dtype, pd.ArrowDtype):
+        # Arrow list columns (see _ensure_facility_columns) already come out as fresh lists.
+        return [items if items is not None else [] for items in values.tolist()]
+    return [list(items or []) for items in values.tolist()]
+
+
+def build_facility_marker_columns(
+    facilities: pd.DataFrame,
+    state: UIState,
+    limit: int = 200,
+    *,
+    service: Optional[Loc2HospitalService] = None,
+) -> Dict[str, List[Any]]:
+    """Marker fields as one list per field (columnar form of `build_facility_markers`)."""
+
+    if service is None:
+        service = Loc2HospitalService(facilities, region_field="region_id")
     result = service.search(
         SearchRequest(
             capability=state.filters.capability,
@@ -101,68 +252,156 @@ def build_facility_markers(facilities: pd.DataFrame, state: UIState, limit: int
         )
     )
     if result.empty:
-        return []
+        return {field: [] for field in _MARKER_FIELDS}
 
-    markers: List[Dict[str, object]] = []
-    for row in result.head(limit).itertuples(index=False):
-        markers.append(
-            {
-                "facility_id": row.facility_id,
-                "facility_name": row.facility_name,
-                "capability": row.capability,
-                "status": row.status,
-                "confidence": float(row.confidence),
-                "region_id": getattr(row, "region_id", None),
-                "region_name": getattr(row, "region_name", None),
-                "latitude": getattr(row, "latitude", None),
-                "longitude": getattr(row, "longitude", None),
-                "rank": getattr(row, "rank", None),
-                "flags": list(getattr(row, "flags", []) or []),
-                "missing_prerequisites": list(getattr(row, "missing_prerequisites", []) or []),
-                "evidence_ids": list(getattr(row, "evidence_ids", []) or []),
-            }
-        )
-    return markers
+    head = result.head(limit)
+    column = _column_getter(head)
+    return {
+        "facility_id": head["facility_id"].tolist(),
+        "facility_name": head["facility_name"].tolist(),
+        "capability": head["capability"].tolist(),
+        "status": head["status"].tolist(),
+        "confidence": [float(value) for value in head["confidence"].tolist()],
+        "region_id": column("region_id"),
+        "region_name": column("region_name"),
+        "latitude": column("latitude"),
+        "longitude": column("longitude"),
+        "rank": column("rank"),
+        "flags": _list_column(head, "flags"),
+        "missing_prerequisites": _list_column(head, "missing_prerequisites"),
+        "evidence_ids": _list_column(head, "evidence_ids"),
+    }
 
 
-def build_region_overlay(region_coverage: pd.DataFrame, state: UIState) -> List[Dict[str, object]]:
-    """Build region-level overlay stats scoped by active capability."""
+def build_facility_markers(
+    facilities: pd.DataFrame,
+    state: UIState,
+    limit: int = 200,
+    *,
+    service: Optional[Loc2HospitalService] = None,
+) -> List[Dict[str, object]]:
+    """Create lightweight marker payloads for map rendering.
+
+    Pass a long-lived `service` built over `facilities` to reuse its lookup indexes across calls.
+    """
+
+    return _rows(build_facility_marker_columns(facilities, state, limit, service=service))
+
+
+def build_region_overlay_columns(
+    region_coverage: pd.DataFrame, state: UIState
+) -> Dict[str, List[Any]]:
+    """Overlay fields as one list per field (columnar form of `build_region_overlay`)."""
 
-    frame = region_coverage.copy()
+    frame = region_coverage
     capability = state.filters.capability
     if capability:
         frame = frame[frame["capability"] == capability]
 
-    overlays: List[Dict[str, object]] = []
-    for row in frame.itertuples(index=False):
-        overlays.append(
-            {
-                "region_id": row.region_id,
-                "region_name": row.region_name,
-                "capability": row.capability,
-                "coverage_score": float(row.coverage_score),
-                "desert_flag": str(row.desert_flag),
-                "facility_count": int(getattr(row, "facility_count", 0)),
-                "confirmed_count": int(getattr(row, "confirmed_count", 0)),
-                "probable_count": int(getattr(row, "probable_count", 0)),
-            }
+    column = _column_getter(frame)
+    return {
+        "region_id": frame["region_id"].tolist(),
+        "region_name": frame["region_name"].tolist(),
+        "capability": frame["capability"].tolist(),
+        "coverage_score": [float(value) for value in frame["coverage_score"].tolist()],
+        "desert_flag": [str(value) for value in frame["desert_flag"].tolist()],
+        "facility_count": [int(value) for value in column("facility_count", 0)],
+        "confirmed_count": [int(value) for value in column("confirmed_count", 0)],
+        "probable_count": [int(value) for value in column("probable_count", 0)],
+    }
+
+
+def _cached_overlay_columns(
+    dataset: Loc2MedDataset, state: UIState
+) -> Optional[Dict[str, List[Any]]]:
+    """Fresh copies of the dataset's stored overlay columns for this state, if any."""
+
+    cached = dataset._overlays.get(state.filters.capability or None)
+    if cached is None:
+        return None
+    return {name: list(values) for name, values in cached.items()}
+
+
+def _store_overlay_columns(
+    dataset: Loc2MedDataset, state: UIState, columns: Dict[str, List[Any]]
+) -> None:
+    if len(dataset._overlays) < _OVERLAY_CACHE_MAX_ENTRIES:
+        dataset._overlays[state.filters.capability or None] = {
+            name: list(values) for name, values in columns.items()
+        }
+
+
+def _dataset_counts(dataset: Loc2MedDataset) -> Dict[str, int]:
+    """Summary counts of the dataset, hashed once instead of on every payload."""
+
+    if not dataset._counts:
+        dataset._counts.update(
+            facility_rows=int(len(dataset.facilities)),
+            facility_ids=int(dataset.facilities["facility_id"].nunique()),
+            capabilities=int(dataset.facilities["capability"].nunique()),
+            regions=int(dataset.region_coverage["region_id"].nunique()),
         )
-    return overlays
+    return dataset._counts
+
+
+def build_region_overlay(region_coverage: pd.DataFrame, state: UIState) -> List[Dict[str, object]]:
+    """Build region-level overlay stats scoped by active capability."""
+
+    return _rows(build_region_overlay_columns(region_coverage, state))
 
 
-def build_dashboard_payload(dataset: Loc2MedDataset, state: UIState) -> Dict[str, object]:
-    """Compose map markers, overlays, and summary metrics into one payload."""
+def build_dashboard_payload(
+    dataset: Loc2MedDataset,
+    state: UIState,
+    *,
+    service: Optional[Loc2HospitalService] = None,
+    columnar: bool = False,
+) -> Dict[str, object]:
+    """Compose map markers, overlays, and summary metrics into one payload.
+
+    Overlay columns are stored on the dataset per capability filter and reused by later
+    calls that only change the other filters; the summary's dataset counts are computed once.
+
+    With `columnar=True`, markers and overlays are `{"columns": {field: [...]}, "n": rows}`
+    instead of a list of per-row dicts, which drops the repeated keys from the JSON.
+    """
+
+    overlay_columns = _cached_overlay_columns(dataset, state)
+    if overlay_columns is not None:
+        marker_columns = build_facility_marker_columns(
+            dataset.facilities, state=state, service=service
+        )
+    elif len(dataset.facilities) + len(dataset.region_coverage) >= _PARALLEL_MIN_ROWS:
+        # Overlays build on a worker while markers (search + ranking) run here; pandas
+        # releases the GIL in its filtering/sorting kernels so the two overlap.
+        overlays_future = _payload_executor().submit(
+            build_region_overlay_columns, dataset.region_coverage, state
+        )
+        marker_columns = build_facility_marker_columns(
+            dataset.facilities, state=state, service=service
+        )
+        overlay_columns = overlays_future.result()
+        _store_overlay_columns(dataset, state, overlay_columns)
+    else:
+        marker_columns = build_facility_marker_columns(
+            dataset.facilities, state=state, service=service
+        )
+        overlay_columns = build_region_overlay_columns(dataset.region_coverage, state=state)
+        _store_overlay_columns(dataset, state, overlay_columns)
 
-    markers = build_facility_markers(dataset.facilities, state=state)
-    overlays = build_region_overlay(dataset.region_coverage, state=state)
+    markers_returned = len(marker_columns["facility_id"])
+    overlays_returned = len(overlay_columns["region_id"])
     summary = {
-        "facility_rows": int(len(dataset.facilities)),
-        "facility_ids": int(dataset.facilities["facility_id"].nunique()),
-        "capabilities": int(dataset.facilities["capability"].nunique()),
-        "regions": int(dataset.region_coverage["region_id"].nunique()),
-        "markers_returned": len(markers),
-        "overlays_returned": len(overlays),
+        **_dataset_counts(dataset),
+        "markers_returned": markers_returned,
+        "overlays_returned": overlays_returned,
     }
+    if columnar:
+        markers: object = {"columns": marker_columns, "n": markers_returned}
+        overlays: object = {"columns": overlay_columns, "n": overlays_returned}
+    else:
+        markers = _rows(marker_columns)
+        overlays = _rows(overlay_columns)
     return {
         "ui_state": state.to_dict(),
         "summary": summary,
@@ -171,4 +410,12 @@ def build_dashboard_payload(dataset: Loc2MedDataset, state: UIState) -> Dict[str
     }
 
 
-__all__ = ["Loc2MedDataset", "load_loc2med_dataset", "build_facility_markers", "build_region_overlay", "build_dashboard_payload"]
+__all__ = [
+    "Loc2MedDataset",
+    "load_loc2med_dataset",
+    "build_facility_markers",
+    "build_facility_marker_columns",
+    "build_region_overlay",
+    "build_region_overlay_columns",
+    "build_dashboard_payload",
+]
@@ -3,17 +3,34 @@
 from __future__ import annotations
 
 import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.common.storage import ensure_parent_dir
+from src.loc2hospital.api import Loc2HospitalService
 
 from .map_data import Loc2MedDataset, build_dashboard_payload, load_loc2med_dataset
+from .tile_cache import TileCache
 from .ui_state import UIState, apply_filter_overrides
 
 
+_PAYLOAD_CACHE_MAX_ENTRIES = 64
+
+
+def _file_signature(path: Path) -> List[object]:
+    stat = path.stat()
+    return [str(path), stat.st_mtime_ns, stat.st_size]
+
+
 class Loc2MedBackend:
-    """Loads datasets and returns UI payloads for requested filters."""
+    """Loads datasets and returns UI payloads for requested filters.
+
+    Payloads are memoized per resolved UI state until the next `refresh()`; callers must
+    treat returned payloads as read-only. With a `tile_cache`, payloads also persist on
+    disk keyed by UI state and the input files' mtime/size, so they survive restarts.
+    """
 
     def __init__(
         self,
@@ -21,17 +38,33 @@ class Loc2MedBackend:
         facility_capabilities_path: Path,
         region_coverage_path: Path,
         default_state: UIState,
+        tile_cache: Optional[TileCache] = None,
     ) -> None:
         self.facility_capabilities_path = facility_capabilities_path
         self.region_coverage_path = region_coverage_path
         self.default_state = default_state
+        self.tile_cache = tile_cache
+        self._data_signature: List[object] = []
         self._dataset: Optional[Loc2MedDataset] = None
+        self._service: Optional[Loc2HospitalService] = None
+        self._dataset_version = 0
+        self._payloads: "OrderedDict[Tuple[int, UIState, bool], Dict[str, object]]" = OrderedDict()
+        self._payloads_lock = threading.Lock()
 
     def refresh(self) -> Loc2MedDataset:
         self._dataset = load_loc2med_dataset(
             self.facility_capabilities_path,
             self.region_coverage_path,
         )
+        # One search service per loaded dataset so its lookup indexes survive across requests.
+        self._service = Loc2HospitalService(self._dataset.facilities, region_field="region_id")
+        self._data_signature = [
+            _file_signature(self.facility_capabilities_path),
+            _file_signature(self.region_coverage_path),
+        ]
+        with self._payloads_lock:
+            self._dataset_version += 1
+            self._payloads.clear()
         return self._dataset
 
     @property
@@ -40,9 +73,47 @@ class Loc2MedBackend:
             return self.refresh()
         return self._dataset
 
-    def payload(self, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, object]:
+    def payload(
+        self, overrides: Optional[Dict[str, Any]] = None, *, columnar: bool = False
+    ) -> Dict[str, object]:
         state = apply_filter_overrides(self.default_state, overrides)
-        return build_dashboard_payload(self.dataset, state)
+        dataset = self.dataset
+        # UIState is a frozen dataclass, so the resolved state itself is the cache key.
+        key = (self._dataset_version, state, columnar)
+        with self._payloads_lock:
+            cached = self._payloads.get(key)
+            if cached is not None:
+                self._payloads.move_to_end(key)
+                return cached
+        payload = self._cached_payload(dataset, state, columnar)
+        with self._payloads_lock:
+            self._payloads[key] = payload
+            if len(self._payloads) > _PAYLOAD_CACHE_MAX_ENTRIES:
+                self._payloads.popitem(last=False)
+        return payload
+
+    def _cached_payload(
+        self, dataset: Loc2MedDataset, state: UIState, columnar: bool
+    ) -> Dict[str, object]:
+        """Payload from the on-disk tile cache when configured, else freshly built."""
+
+        if self.tile_cache is None:
+            return build_dashboard_payload(
+                dataset, state, service=self._service, columnar=columnar
+            )
+        tile_key = "payload:" + json.dumps(
+            {"data": self._data_signature, "state": state.to_dict(), "columnar": columnar},
+            sort_keys=True,
+        )
+        cached = self.tile_cache.get(tile_key)
+        if cached is not None:
+            return cached
+        payload = build_dashboard_payload(dataset, state, service=self._service, columnar=columnar)
+        try:
+            self.tile_cache.set(tile_key, payload)
+        except (TypeError, ValueError):
+            pass  # not JSON-serializable (e.g. pd.NA coordinates): kept in memory only
+        return payload
 
     def write_preview(self, output_path: Path, overrides: Optional[Dict[str, Any]] = None) -> Path:
         payload = self.payload(overrides)
@@ -73,6 +144,7 @@ def create_fastapi_app(backend: Loc2MedBackend):
         min_confidence: Optional[float] = Query(default=None),
         region_id: Optional[str] = Query(default=None),
         ranking_strategy: Optional[str] = Query(default=None),
+        layout: str = Query(default="rows", pattern="^(rows|columns)$"),
     ) -> Dict[str, object]:
         overrides: Dict[str, Any] = {}
         if capability is not None:
@@ -83,7 +155,7 @@ def create_fastapi_app(backend: Loc2MedBackend):
             overrides["region_id"] = region_id
         if ranking_strategy is not None:
             overrides["ranking_strategy"] = ranking_strategy
-        return backend.payload(overrides)
+        return backend.payload(overrides, columnar=layout == "columns")
 
     return app
 
@@ -4,39 +4,131 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
+import struct
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pyarrow as pa
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from src.common.storage import ensure_parent_dir
 
+# Entries are compact JSON compressed with zstd, behind the JSON length as a u64 header.
+# The file suffix doubles as the format version: entries in other formats are never read.
+_SUFFIX = ".json.zst"
+_HEADER = struct.Struct("<Q")
+
 
+@lru_cache(maxsize=1024)
 def _cache_name(key: str) -> str:
+    # Memoized: the same tile keys repeat on every request, so each is hashed once.
     digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
-    return f"{digest}.json"
+    return f"{digest}{_SUFFIX}"
+
+
+def _dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. values orjson cannot encode; stdlib json decides below
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _pack(payload: Any) -> bytes:
+    data = _dumps(payload)
+    return _HEADER.pack(len(data)) + pa.compress(data, codec="zstd", asbytes=True)
+
+
+def _unpack(blob: bytes) -> Any:
+    (size,) = _HEADER.unpack_from(blob)
+    body = memoryview(blob)[_HEADER.size :]
+    return _loads(pa.decompress(body, decompressed_size=size, codec="zstd", asbytes=True))
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals written by the stdlib fallback
+    return json.loads(data)
 
 
 class TileCache:
-    """Persist/retrieve JSON map artifacts under outputs/tiles."""
+    """Persist/retrieve JSON map artifacts under outputs/tiles.
+
+    Entries are stored zstd-compressed and written atomically. The compressed bytes of
+    recently read entries stay in memory (keyed by file mtime/size so on-disk changes are
+    picked up); each `get` still decodes a fresh dict.
+    """
 
-    def __init__(self, cache_dir: Path) -> None:
+    def __init__(self, cache_dir: Path, *, memory_entries: int = 128) -> None:
         self.cache_dir = cache_dir
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[str, Tuple[int, int, bytes]]" = OrderedDict()
+        # Sync endpoints run in a threadpool, so the in-memory LRU is shared across threads.
+        self._lock = threading.Lock()
 
     def path_for_key(self, key: str) -> Path:
         return self.cache_dir / _cache_name(key)
 
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         path = self.path_for_key(key)
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            with self._lock:
+                self._memory.pop(key, None)
             return None
-        with path.open("r", encoding="utf-8") as handle:
-            return json.load(handle)
+        with self._lock:
+            cached = self._memory.get(key)
+            hit = cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size)
+            if hit:
+                self._memory.move_to_end(key)
+        if hit:
+            return _unpack(cached[2])
+        data = path.read_bytes()
+        if self.memory_entries > 0:
+            with self._lock:
+                self._memory[key] = (stat.st_mtime_ns, stat.st_size, data)
+                self._memory.move_to_end(key)
+                if len(self._memory) > self.memory_entries:
+                    self._memory.popitem(last=False)
+        return _unpack(data)
 
     def set(self, key: str, payload: Dict[str, Any]) -> Path:
         path = self.path_for_key(key)
+        with self._lock:
+            self._memory.pop(key, None)
+        blob = _pack(payload)
         ensure_parent_dir(path)
-        with path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2, ensure_ascii=False)
+        # Write to a unique sibling and rename so concurrent readers and writers (other
+        # threads included) never see a partial entry.
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f"{path.name}.", suffix=".tmp", delete=False
+        ) as tmp:
+            try:
+                tmp.write(blob)
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+        try:
+            os.replace(tmp.name, path)
+        except BaseException:
+            os.unlink(tmp.name)
+            raise
         return path
 
     def get_or_build(self, key: str, builder: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
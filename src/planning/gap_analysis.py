@@ -3,10 +3,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 
+# desert_flag code = position in _DESERT_FLAGS + 1, so unknown flags (-1) land on 0.
+_DESERT_FLAGS = pd.Index(["soft", "hard"])
+_DESERT_BUMP = np.array([0.0, 0.75, 1.5])
+# Below this many rows the NumPy path beats numba's parallel dispatch overhead.
+_NUMBA_MIN_ROWS = 4096
+
 
 @dataclass(frozen=True)
 class GapAnalysisConfig:
@@ -14,6 +21,52 @@ class GapAnalysisConfig:
     coverage_floor: float = 1.0
 
 
+@lru_cache(maxsize=1)
+def _numba_severity_kernel():
+    """Compile (once, cached on disk) a parallel numba severity kernel, or None without numba."""
+
+    try:
+        import numba
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+
+    # No fastmath: scores must match the NumPy path bit for bit.
+    @numba.njit(parallel=True, cache=True)
+    def kernel(
+        coverage_score, desert_code, facility_count, coverage_floor, desert_bump
+    ):  # pragma: no cover
+        out = np.empty(coverage_score.shape[0], dtype=np.float64)
+        for i in numba.prange(coverage_score.shape[0]):
+            deficit = coverage_floor - coverage_score[i]
+            severity = deficit if deficit > 0.0 else 0.0
+            severity += desert_bump[desert_code[i]]
+            if facility_count[i] == 0:
+                severity += 0.1
+            out[i] = severity
+        return out
+
+    return kernel
+
+
+def _severity_scores(
+    coverage_score: np.ndarray,
+    desert_flag: np.ndarray,
+    facility_count: np.ndarray,
+    coverage_floor: float,
+) -> np.ndarray:
+    desert_code = _DESERT_FLAGS.get_indexer(desert_flag) + 1
+    if len(coverage_score) >= _NUMBA_MIN_ROWS:
+        kernel = _numba_severity_kernel()
+        if kernel is not None:
+            return kernel(
+                coverage_score, desert_code, facility_count, float(coverage_floor), _DESERT_BUMP
+            )
+
+    # fmax keeps the old max(0.0, ...) behaviour of treating a NaN deficit as zero.
+    deficit = np.fmax(0.0, coverage_floor - coverage_score)
+    return deficit + _DESERT_BUMP[desert_code] + 0.1 * (facility_count == 0)
+
+
 def compute_gap_table(
     region_coverage: pd.DataFrame,
     *,
@@ -33,37 +86,40 @@ def compute_gap_table(
     if missing:
         raise ValueError(f"region_coverage missing columns: {', '.join(sorted(missing))}")
 
-    rows: List[dict[str, object]] = []
-    for (region_id, region_name), subset in region_coverage.groupby(["region_id", "region_name"]):
-        ranked = []
-        for row in subset.itertuples(index=False):
-            coverage_score = float(getattr(row, "coverage_score", 0.0))
-            facility_count = int(getattr(row, "facility_count", 0))
-            desert_flag = str(getattr(row, "desert_flag", "none"))
-
-            deficit = max(0.0, config.coverage_floor - coverage_score)
-            severity = deficit + (0.75 if desert_flag == "soft" else 0.0)
-            if desert_flag == "hard":
-                severity += 1.5
-            severity += 0.1 if facility_count == 0 else 0.0
-
-            reason = f"coverage={coverage_score:.2f}, facilities={facility_count}, desert={desert_flag}"
-            ranked.append(
-                {
-                    "region_id": region_id,
-                    "region_name": region_name,
-                    "capability": row.capability,
-                    "severity_score": severity,
-                    "reason": reason,
-                    "coverage_score": coverage_score,
-                    "desert_flag": desert_flag,
-                }
-            )
+    frame = region_coverage.dropna(subset=["region_id", "region_name"])
+    if frame.empty:
+        return pd.DataFrame()
+
+    # Severity is column arithmetic (numba-compiled for large tables); only the reason
+    # strings need a per-row pass.
+    coverage_score = frame["coverage_score"].to_numpy(dtype=float)
+    facility_count = frame["facility_count"].to_numpy(dtype=np.int64)
+    desert_flag = frame["desert_flag"].astype(str).to_numpy(dtype=object)
 
-        ranked.sort(key=lambda item: item["severity_score"], reverse=True)
-        rows.extend(ranked[: config.top_n_missing])
+    severity = _severity_scores(coverage_score, desert_flag, facility_count, config.coverage_floor)
+    reason = [
+        f"coverage={score:.2f}, facilities={count}, desert={flag}"
+        for score, count, flag in zip(coverage_score.tolist(), facility_count.tolist(), desert_flag)
+    ]
 
-    return pd.DataFrame(rows)
+    gaps = pd.DataFrame(
+        {
+            "region_id": frame["region_id"].to_numpy(),
+            "region_name": frame["region_name"].to_numpy(),
+            "capability": frame["capability"].to_numpy(),
+            "severity_score": severity,
+            "reason": reason,
+            "coverage_score": coverage_score,
+            "desert_flag": desert_flag,
+        }
+    )
+    gaps = gaps.sort_values(
+        ["region_id", "region_name", "severity_score"],
+        ascending=[True, True, False],
+        kind="stable",
+    )
+    top = gaps.groupby(["region_id", "region_name"], sort=False).head(config.top_n_missing)
+    return top.reset_index(drop=True)
 
 
 __all__ = ["GapAnalysisConfig", "compute_gap_table"]
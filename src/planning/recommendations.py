@@ -3,31 +3,51 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Sequence
 
+import numpy as np
 import pandas as pd
 
+_GAP_KEYS = ["region_id", "capability"]
+_RECOMMENDATION_COLUMNS = [
+    "region_id",
+    "region_name",
+    "capability",
+    "recommendation_type",
+    "facility_id",
+    "facility_name",
+    "action",
+    "severity_score",
+    "rationale",
+]
+_ESCALATE_ACTION = "Escalate to national coordination team (no alternatives available)"
+
 
 @dataclass(frozen=True)
 class RecommendationConfig:
     min_alternatives: int = 1
 
 
-def _select_alternatives(
-    facilities: pd.DataFrame,
-    capability: str,
-    region_id: str,
-) -> pd.DataFrame:
-    subset = facilities[
-        (facilities["capability"] == capability) & (facilities["status"] == "present")
-    ].copy()
-    if subset.empty:
-        return subset
+def _best_alternatives(present: pd.DataFrame, keys: Sequence[str], prefix: str) -> pd.DataFrame:
+    """Highest-confidence present facility per key, with the number of alternatives."""
+
+    keys = list(keys)
+    present = present.dropna(subset=keys)
+    best = present.drop_duplicates(keys)[keys + ["facility_id", "facility_name", "confidence"]]
+    # Both follow first-appearance order of the keys, so the counts line up row for row
+    # with the best rows and need no join.
+    best = best.assign(alternatives=present.groupby(keys, sort=False).size().to_numpy())
+    return best.rename(
+        columns={column: f"{prefix}{column}" for column in best.columns if column not in keys}
+    )
+
 
-    same_region = subset[subset.get("region_id") == region_id]
-    if not same_region.empty:
-        return same_region.sort_values(by="confidence", ascending=False)
-    return subset.sort_values(by="confidence", ascending=False)
+def _referral_action(name: object, confidence: float, alternatives: int) -> str:
+    return (
+        f"Refer patients to {name} "
+        f"(confidence {confidence:.2f}); "
+        f"{alternatives} alternatives available."
+    )
 
 
 def generate_recommendations(
@@ -39,58 +59,95 @@ def generate_recommendations(
 ) -> pd.DataFrame:
     """Produce final planning recommendations with unlocks/referrals."""
 
-    records: List[dict[str, object]] = []
+    if gap_table.empty:
+        return pd.DataFrame()
 
-    for gap in gap_table.itertuples(index=False):
-        unlock_group = unlock_candidates[
-            (unlock_candidates["region_id"] == gap.region_id)
-            & (unlock_candidates["capability"] == gap.capability)
+    # Join each gap to its lookups once instead of masking the candidate frames per gap.
+    merged = gap_table.reset_index(drop=True)
+    if set(_GAP_KEYS).issubset(unlock_candidates.columns) and not unlock_candidates.empty:
+        # Candidates arrive ranked per target, so the first row per key is the best unlock.
+        best_unlocks = unlock_candidates.dropna(subset=_GAP_KEYS).drop_duplicates(_GAP_KEYS)
+        best_unlocks = best_unlocks[
+            _GAP_KEYS + ["facility_id", "facility_name", "recommended_action"]
         ]
-
-        if not unlock_group.empty:
-            best = unlock_group.iloc[0]
-            records.append(
-                {
-                    "region_id": gap.region_id,
-                    "region_name": gap.region_name,
-                    "capability": gap.capability,
-                    "recommendation_type": "unlock",
-                    "facility_id": best.facility_id,
-                    "facility_name": best.facility_name,
-                    "action": best.recommended_action,
-                    "severity_score": gap.severity_score,
-                    "rationale": gap.reason,
-                }
-            )
-        else:
-            alternatives = _select_alternatives(
-                facility_capabilities, gap.capability, gap.region_id
-            )
-            if len(alternatives) >= config.min_alternatives:
-                top = alternatives.iloc[0]
-                action = (
-                    f"Refer patients to {top['facility_name']} "
-                    f"(confidence {float(top['confidence']):.2f}); "
-                    f"{len(alternatives)} alternatives available."
-                )
-            else:
-                action = "Escalate to national coordination team (no alternatives available)"
-
-            records.append(
-                {
-                    "region_id": gap.region_id,
-                    "region_name": gap.region_name,
-                    "capability": gap.capability,
-                    "recommendation_type": "refer",
-                    "facility_id": top["facility_id"] if len(alternatives) >= config.min_alternatives else None,
-                    "facility_name": top["facility_name"] if len(alternatives) >= config.min_alternatives else None,
-                    "action": action,
-                    "severity_score": gap.severity_score,
-                    "rationale": gap.reason,
+        merged = merged.merge(
+            best_unlocks.rename(
+                columns={
+                    "facility_id": "unlock_facility_id",
+                    "facility_name": "unlock_facility_name",
+                    "recommended_action": "unlock_action",
                 }
-            )
-
-    return pd.DataFrame(records)
+            ),
+            on=_GAP_KEYS,
+            how="left",
+            indicator="_unlock",
+        )
+        has_unlock = (merged["_unlock"] == "both").to_numpy()
+    else:
+        has_unlock = np.zeros(len(merged), dtype=bool)
+
+    # Only gaps without an unlock need referral alternatives, so facilities for other
+    # capabilities are dropped before the sort and the per-key aggregations.
+    referral_capabilities = merged.loc[~has_unlock, "capability"].unique()
+    present = facility_capabilities[
+        facility_capabilities["status"].isin(["present"]).to_numpy()
+        & facility_capabilities["capability"].isin(referral_capabilities)
+    ].sort_values(by="confidence", ascending=False, kind="stable")
+    # Referrals prefer the gap's own region and fall back to any region with the capability.
+    merged = merged.merge(
+        _best_alternatives(present, _GAP_KEYS, "regional_"), on=_GAP_KEYS, how="left"
+    )
+    merged = merged.merge(
+        _best_alternatives(present, ["capability"], "national_"), on="capability", how="left"
+    )
+    regional = merged["regional_alternatives"].notna().to_numpy()
+
+    def _pick(column: str) -> np.ndarray:
+        return np.where(
+            regional,
+            merged[f"regional_{column}"].to_numpy(dtype=object),
+            merged[f"national_{column}"].to_numpy(dtype=object),
+        )
+
+    alternatives = pd.Series(_pick("alternatives")).fillna(0).to_numpy(dtype=np.int64)
+    refer = (alternatives >= config.min_alternatives) & (alternatives > 0)
+
+    def _unlock(column: str) -> np.ndarray:
+        if column not in merged.columns:
+            return np.full(len(merged), None, dtype=object)
+        return merged[column].to_numpy(dtype=object)
+
+    names = _pick("facility_name")
+    confidence = _pick("confidence")
+    facility_ids = np.where(
+        has_unlock, _unlock("unlock_facility_id"), np.where(refer, _pick("facility_id"), None)
+    )
+    facility_names = np.where(
+        has_unlock, _unlock("unlock_facility_name"), np.where(refer, names, None)
+    )
+
+    actions = np.full(len(merged), _ESCALATE_ACTION, dtype=object)
+    referrals = np.flatnonzero(refer & ~has_unlock)
+    actions[referrals] = [
+        _referral_action(names[position], float(confidence[position]), int(alternatives[position]))
+        for position in referrals
+    ]
+    actions = np.where(has_unlock, _unlock("unlock_action"), actions)
+
+    records = pd.DataFrame(
+        {
+            "region_id": merged["region_id"].to_numpy(),
+            "region_name": merged["region_name"].to_numpy(),
+            "capability": merged["capability"].to_numpy(),
+            "recommendation_type": np.where(has_unlock, "unlock", "refer"),
+            "facility_id": facility_ids,
+            "facility_name": facility_names,
+            "action": actions,
+            "severity_score": merged["severity_score"].to_numpy(),
+            "rationale": merged["reason"].to_numpy(),
+        }
+    )
+    return records[_RECOMMENDATION_COLUMNS]
 
 
 __all__ = ["RecommendationConfig", "generate_recommendations"]
@@ -3,11 +3,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
 
+import numpy as np
 import pandas as pd
 
 
+_TARGET_KEYS = ["region_id", "capability"]
+
+
 @dataclass(frozen=True)
 class UnlockConfig:
     max_prerequisites_missing: int = 2
@@ -16,11 +19,18 @@ class UnlockConfig:
 
 
 def _missing_prereq_count(value: object) -> int:
-    if isinstance(value, list):
+    # Parquet list columns load as NumPy arrays.
+    if isinstance(value, (list, np.ndarray)):
         return len(value)
     return 0
 
 
+def _prereq_list(value: object) -> list:
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return value or []
+
+
 def find_unlock_candidates(
     facility_capabilities: pd.DataFrame,
     gap_table: pd.DataFrame,
@@ -42,54 +52,53 @@ def find_unlock_candidates(
     if missing:
         raise ValueError(f"facility_capabilities missing columns: {', '.join(sorted(missing))}")
 
-    unlock_rows: List[dict[str, object]] = []
-    gap_targets = gap_table[["region_id", "capability"]].drop_duplicates()
+    gap_targets = gap_table[_TARGET_KEYS].dropna().drop_duplicates()
 
     facility_subset = facility_capabilities[
-        facility_capabilities["status"].isin(["uncertain", "absent"])
-        & (facility_capabilities["confidence"] >= config.min_confidence)
+        facility_capabilities["status"].isin(["uncertain", "absent"]).to_numpy()
+        & (facility_capabilities["confidence"] >= config.min_confidence).to_numpy()
     ].copy()
     facility_subset["missing_count"] = facility_subset["missing_prerequisites"].apply(_missing_prereq_count)
+    facility_subset = facility_subset[
+        facility_subset["missing_count"] <= config.max_prerequisites_missing
+    ]
+
+    # One join against the targets replaces a mask scan of the facilities per gap target;
+    # a stable sort then yields each target's block already ranked, in gap-table order.
+    gap_targets = gap_targets.assign(_target_order=np.arange(len(gap_targets)))
+    candidates = facility_subset.merge(gap_targets, on=_TARGET_KEYS, how="inner")
+    if candidates.empty:
+        return pd.DataFrame()
     rank_by = (config.rank_by or "feasibility").strip().lower()
-
-    for row in gap_targets.itertuples(index=False):
-        candidates = facility_subset[
-            (facility_subset["region_id"] == row.region_id)
-            & (facility_subset["capability"] == row.capability)
-            & (facility_subset["missing_count"] <= config.max_prerequisites_missing)
-        ]
-        if rank_by == "coverage_proxy":
-            candidates = candidates.sort_values(
-                by=["confidence", "missing_count"],
-                ascending=[False, True],
-            )
-        else:
-            candidates = candidates.sort_values(
-                by=["missing_count", "confidence"],
-                ascending=[True, False],
-            )
-
-        for candidate in candidates.itertuples(index=False):
-            missing_prereqs = candidate.missing_prerequisites or []
-            action = (
-                f"Provide prerequisites: {', '.join(missing_prereqs)}"
-                if missing_prereqs
-                else "Verify equipment/staff readiness"
-            )
-            unlock_rows.append(
-                {
-                    "region_id": candidate.region_id,
-                    "facility_id": candidate.facility_id,
-                    "facility_name": candidate.facility_name,
-                    "capability": candidate.capability,
-                    "missing_prerequisites": missing_prereqs,
-                    "recommended_action": action,
-                    "confidence": candidate.confidence,
-                    "missing_count": candidate.missing_count,
-                }
-            )
-
-    return pd.DataFrame(unlock_rows)
+    if rank_by == "coverage_proxy":
+        rank_keys, ascending = ["confidence", "missing_count"], [False, True]
+    else:
+        rank_keys, ascending = ["missing_count", "confidence"], [True, False]
+    candidates = candidates.sort_values(
+        by=["_target_order", *rank_keys],
+        ascending=[True, *ascending],
+        kind="stable",
+    )
+
+    missing_prereqs = [_prereq_list(value) for value in candidates["missing_prerequisites"].tolist()]
+    actions = [
+        f"Provide prerequisites: {', '.join(prereqs)}"
+        if prereqs
+        else "Verify equipment/staff readiness"
+        for prereqs in missing_prereqs
+    ]
+    return pd.DataFrame(
+        {
+            "region_id": candidates["region_id"].to_numpy(),
+            "facility_id": candidates["facility_id"].to_numpy(),
+            "facility_name": candidates["facility_name"].to_numpy(),
+            "capability": candidates["capability"].to_numpy(),
+            "missing_prerequisites": missing_prereqs,
+            "recommended_action": actions,
+            "confidence": candidates["confidence"].to_numpy(),
+            "missing_count": candidates["missing_count"].to_numpy(),
+        }
+    )
 
 
 __all__ = ["UnlockConfig", "find_unlock_candidates"]
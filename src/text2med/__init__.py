@@ -2,7 +2,12 @@
 
 from .confidence import score_claims
 from .extractor import extract_capability_claims, normalize_raw_documents
-from .ontology import CapabilityDefinition, CapabilityOntology, load_capability_ontology
+from .ontology import (
+    CapabilityDefinition,
+    CapabilityOntology,
+    load_capability_ontology,
+    ontology_cache_clear,
+)
 from .verifier import apply_verification
 from .writer import write_pipeline_outputs
 
@@ -10,6 +15,7 @@ __all__ = [
     "CapabilityDefinition",
     "CapabilityOntology",
     "load_capability_ontology",
+    "ontology_cache_clear",
     "normalize_raw_documents",
     "extract_capability_claims",
     "apply_verification",
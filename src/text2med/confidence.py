@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Mapping
 
+import numpy as np
 import pandas as pd
 
 
@@ -12,6 +14,13 @@ BASE_STATUS_SCORE = {
     "uncertain": 0.35,
     "absent": 0.05,
 }
+_STATUS_INDEX = pd.Index(list(BASE_STATUS_SCORE))
+# Base score per status code; the trailing slot covers statuses outside BASE_STATUS_SCORE.
+_BASE_SCORE_LUT = np.array([*BASE_STATUS_SCORE.values(), 0.1])
+# Confidence label by the number of thresholds (0.45, 0.7) a score reaches.
+_CONFIDENCE_LABELS = np.array(["uncertain", "probable", "confirmed"], dtype=object)
+# Below this many rows the NumPy path beats numba's parallel dispatch overhead.
+_NUMBA_MIN_ROWS = 4096
 
 
 def _safe_weight(weights: Mapping[str, float], key: str, fallback: float) -> float:
@@ -22,12 +31,47 @@ def _safe_weight(weights: Mapping[str, float], key: str, fallback: float) -> flo
         return fallback
 
 
-def _confidence_label(score: float) -> str:
-    if score >= 0.7:
-        return "confirmed"
-    if score >= 0.45:
-        return "probable"
-    return "uncertain"
+def _count_column(frame: pd.DataFrame, column: str) -> np.ndarray:
+    if column not in frame.columns:
+        return np.zeros(len(frame), dtype=np.int64)
+    return frame[column].to_numpy(dtype=np.int64)
+
+
+def _missing_prereq_count(value: object) -> int:
+    if isinstance(value, np.ndarray):
+        return len(value)
+    return len(list(value or []))
+
+
+@lru_cache(maxsize=1)
+def _numba_confidence_kernel():
+    """Compile (once, cached on disk) a parallel numba confidence kernel, or None without numba."""
+
+    try:
+        import numba
+    except ImportError:  # pragma: no cover - optional dependency
+        return None
+
+    # No fastmath: scores must match the NumPy path bit for bit.
+    @numba.njit(parallel=True, cache=True)
+    def kernel(base, strong, sources, missing, contradictions, weights):  # pragma: no cover
+        out = np.empty(base.shape[0], dtype=np.float64)
+        for i in numba.prange(base.shape[0]):
+            specificity = min(1.0, strong[i] / 2.0)
+            multi_evidence = min(1.0, max(0.0, sources[i] - 1.0) / 2.0)
+            prereq = 1.0 if missing[i] > 0 else 0.0
+            contradiction = min(1.0, float(contradictions[i]))
+            score = (
+                base[i]
+                + (weights[0] * specificity)
+                + (weights[1] * multi_evidence)
+                + (weights[2] * prereq)
+                + (weights[3] * contradiction)
+            )
+            out[i] = min(1.0, max(0.0, score))
+        return out
+
+    return kernel
 
 
 def score_claims(
@@ -39,30 +83,50 @@ def score_claims(
     if verified_claims.empty:
         return verified_claims.copy()
 
-    scored = verified_claims.copy()
+    # Read inputs straight from the caller's frame; assign() below only adds columns.
+    scored = verified_claims
     spec_weight = _safe_weight(weights, "specificity", 0.3)
     multi_weight = _safe_weight(weights, "multi_evidence", 0.2)
     prereq_weight = _safe_weight(weights, "prerequisite_penalty", -0.2)
     contradiction_weight = _safe_weight(weights, "contradiction_penalty", -0.3)
 
-    confidence_scores = []
-    confidence_labels = []
-    explanations = []
-
-    for row in scored.itertuples(index=False):
-        status = str(getattr(row, "status", "absent"))
-        base = BASE_STATUS_SCORE.get(status, 0.1)
-
-        strong_matches = int(getattr(row, "strong_match_count", 0))
-        evidence_count = int(getattr(row, "evidence_count", 0))
-        source_support_count = int(getattr(row, "source_support_count", 0))
-        missing_prereqs = list(getattr(row, "missing_prerequisites", []) or [])
-        contradiction_count = int(getattr(row, "contradiction_count", 0))
-
-        specificity_signal = min(1.0, strong_matches / 2.0)
-        multi_evidence_signal = min(1.0, max(0.0, source_support_count - 1.0) / 2.0)
-        prereq_signal = 1.0 if missing_prereqs else 0.0
-        contradiction_signal = min(1.0, float(contradiction_count))
+    # Whole-column NumPy arithmetic; only the explanation strings need a per-row pass.
+    row_count = len(scored)
+    if "status" in scored.columns:
+        status_codes = _STATUS_INDEX.get_indexer(scored["status"].astype(str))
+        base = _BASE_SCORE_LUT[np.where(status_codes < 0, len(_STATUS_INDEX), status_codes)]
+    else:
+        base = np.full(row_count, BASE_STATUS_SCORE["absent"])
+
+    strong_matches = _count_column(scored, "strong_match_count")
+    evidence_count = _count_column(scored, "evidence_count")
+    source_support_count = _count_column(scored, "source_support_count")
+    contradiction_count = _count_column(scored, "contradiction_count")
+    missing_prereq_count = (
+        np.fromiter(
+            (_missing_prereq_count(value) for value in scored["missing_prerequisites"].tolist()),
+            dtype=np.int64,
+            count=row_count,
+        )
+        if "missing_prerequisites" in scored.columns
+        else np.zeros(row_count, dtype=np.int64)
+    )
+
+    kernel = _numba_confidence_kernel() if row_count >= _NUMBA_MIN_ROWS else None
+    if kernel is not None:
+        confidence_scores = kernel(
+            base,
+            strong_matches,
+            source_support_count,
+            missing_prereq_count,
+            contradiction_count,
+            np.array([spec_weight, multi_weight, prereq_weight, contradiction_weight]),
+        )
+    else:
+        specificity_signal = np.minimum(1.0, strong_matches / 2.0)
+        multi_evidence_signal = np.minimum(1.0, np.maximum(0.0, source_support_count - 1.0) / 2.0)
+        prereq_signal = (missing_prereq_count > 0).astype(float)
+        contradiction_signal = np.minimum(1.0, contradiction_count.astype(float))
 
         score = (
             base
@@ -71,23 +135,28 @@ def score_claims(
             + (prereq_weight * prereq_signal)
             + (contradiction_weight * contradiction_signal)
         )
-        score = max(0.0, min(1.0, float(score)))
-
-        label = _confidence_label(score)
-        explanation = (
-            f"base={base:.2f}, strong={strong_matches}, evidence={evidence_count}, "
-            f"sources={source_support_count}, missing_prereq={len(missing_prereqs)}, "
-            f"contradictions={contradiction_count}"
+        confidence_scores = np.clip(score, 0.0, 1.0)
+    thresholds_met = (confidence_scores >= 0.45).astype(np.intp) + (confidence_scores >= 0.7)
+    confidence_labels = _CONFIDENCE_LABELS[thresholds_met].tolist()
+    explanations = [
+        f"base={row_base:.2f}, strong={strong}, evidence={evidence}, "
+        f"sources={sources}, missing_prereq={missing}, "
+        f"contradictions={contradictions}"
+        for row_base, strong, evidence, sources, missing, contradictions in zip(
+            base.tolist(),
+            strong_matches.tolist(),
+            evidence_count.tolist(),
+            source_support_count.tolist(),
+            missing_prereq_count.tolist(),
+            contradiction_count.tolist(),
         )
+    ]
 
-        confidence_scores.append(score)
-        confidence_labels.append(label)
-        explanations.append(explanation)
-
-    scored["confidence"] = confidence_scores
-    scored["confidence_label"] = confidence_labels
-    scored["confidence_explanation"] = explanations
-    return scored
+    return scored.assign(
+        confidence=confidence_scores,
+        confidence_label=confidence_labels,
+        confidence_explanation=explanations,
+    )
 
 
 __all__ = ["score_claims"]
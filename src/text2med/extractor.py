@@ -7,12 +7,13 @@ import json
 import re
 from typing import Dict, List
 
+import numpy as np
 import pandas as pd
 
-from src.common.citations import build_citation, citations_to_dicts
+from src.common.citations import build_citation
 
 from .ontology import CapabilityOntology
-from .retrieval import KeywordRetriever, matches_to_frame
+from .retrieval import KeywordRetriever
 
 REQUIRED_RAW_DOCUMENT_COLUMNS = [
     "facility_id",
@@ -21,46 +22,114 @@ REQUIRED_RAW_DOCUMENT_COLUMNS = [
     "text",
 ]
 
+_TEXT_CHUNK_COLUMNS = (
+    "doc_id",
+    "chunk_id",
+    "chunk_index",
+    "facility_id",
+    "facility_name",
+    "country",
+    "source_type",
+    "source_ref",
+    "origin_field",
+    "chunk_text",
+    "metadata",
+)
+_CLAIM_COLUMNS = (
+    "facility_id",
+    "facility_name",
+    "country",
+    "capability",
+    "category",
+    "status",
+    "strong_match_count",
+    "weak_match_count",
+    "negative_match_count",
+    "retrieval_score",
+    "evidence_count",
+    "source_support_count",
+    "evidence_ids",
+    "evidence_chunk_ids",
+    "evidence_doc_ids",
+    "evidence_source_refs",
+    "citations",
+    "raw_explanation",
+)
+_CITATION_COLUMNS = (
+    "facility_id",
+    "capability",
+    "chunk_id",
+    "doc_id",
+    "source_type",
+    "source_ref",
+    "chunk_text",
+)
+_MATCH_TYPE_CODES = {"strong": 0, "weak": 1, "negative": 2}
+
+_BULLET_SPLIT_RE = re.compile(r"[\u2022\n\-]+")
+_PARAGRAPH_SPLIT_RE = re.compile(r"\n{2,}")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_UNIT_SPLITTERS = {"bullet": _BULLET_SPLIT_RE, "paragraph": _PARAGRAPH_SPLIT_RE}
+
 
 def _stable_id(seed: str) -> str:
-    return hashlib.sha1(seed.encode("utf-8")).hexdigest()[:16]
+    # 8-byte blake2b, as for document and chunk ids at ingest; no SHA-1 truncation needed.
+    return hashlib.blake2b(seed.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _positional_seeds(values: pd.Series) -> List[str]:
+    """`f"{value}_{position}"` seeds for a column's string values."""
+
+    return [f"{value}_{position}" for position, value in enumerate(values.astype(str).tolist())]
+
+
+def _stable_ids(prefix: str, seeds: List[str]) -> List[str]:
+    """Prefixed `_stable_id` for a batch of seeds, with the hash constructor bound once."""
+
+    blake2b = hashlib.blake2b
+    return [f"{prefix}{blake2b(seed.encode('utf-8'), digest_size=8).hexdigest()}" for seed in seeds]
+
+
+def _split_units(content: str, strategy: str) -> List[str]:
+    if strategy not in _UNIT_SPLITTERS:
+        # `content` is stripped with single spaces, so sentences split off clean and non-empty.
+        return _SENTENCE_SPLIT_RE.split(content)
+    splitter = _UNIT_SPLITTERS[strategy]
+    strip_chars = " -\t" if strategy == "bullet" else None
+    return [unit.strip(strip_chars) for unit in splitter.split(content) if unit.strip()]
 
 
 def _split_text(text: str, *, strategy: str, max_chars: int) -> List[str]:
-    content = re.sub(r"\s+", " ", str(text).strip())
+    # str.split() breaks on the same characters as `\s+` and drops the ends, so this strips
+    # and collapses whitespace runs in one C pass instead of a regex substitution.
+    content = " ".join(str(text).split())
     if not content:
         return []
     if len(content) <= max_chars:
         return [content]
 
-    if strategy == "bullet":
-        units = [unit.strip(" -\t") for unit in re.split(r"[\u2022\n\-]+", content) if unit.strip()]
-    elif strategy == "paragraph":
-        units = [unit.strip() for unit in re.split(r"\n{2,}", content) if unit.strip()]
-    else:
-        units = [unit.strip() for unit in re.split(r"(?<=[.!?])\s+", content) if unit.strip()]
-
-    if not units:
-        units = [content]
+    units = _split_units(content, strategy) or [content]
 
+    # Track the pending chunk as a list of units plus its joined length, and join
+    # once per emitted chunk instead of rebuilding the buffer string per unit.
     chunks: List[str] = []
-    buffer = ""
+    pending: List[str] = []
+    pending_len = 0
     for unit in units:
-        candidate = f"{buffer} {unit}".strip() if buffer else unit
-        if buffer and len(candidate) > max_chars:
-            chunks.append(buffer)
-            buffer = unit
+        candidate_len = pending_len + 1 + len(unit) if pending else len(unit)
+        if pending and candidate_len > max_chars:
+            chunks.append(" ".join(pending))
+            pending = [unit]
+            pending_len = len(unit)
             continue
-        if len(candidate) <= max_chars:
-            buffer = candidate
+        if candidate_len <= max_chars:
+            pending.append(unit)
+            pending_len = candidate_len
         else:
-            if buffer:
-                chunks.append(buffer)
             for i in range(0, len(unit), max_chars):
                 chunks.append(unit[i : i + max_chars].strip())
-            buffer = ""
-    if buffer:
-        chunks.append(buffer)
+    if pending:
+        chunks.append(" ".join(pending))
     return [chunk for chunk in chunks if chunk]
 
 
@@ -97,15 +166,9 @@ def normalize_raw_documents(
 
     normalized = raw_documents.copy()
     if "doc_id" not in normalized.columns:
-        normalized["doc_id"] = [
-            f"doc_{_stable_id(f'{facility}_{idx}')}"
-            for idx, facility in enumerate(normalized["facility_id"].astype(str))
-        ]
+        normalized["doc_id"] = _stable_ids("doc_", _positional_seeds(normalized["facility_id"]))
     if "chunk_id" not in normalized.columns:
-        normalized["chunk_id"] = [
-            f"chunk_{_stable_id(f'{doc}_{idx}')}"
-            for idx, doc in enumerate(normalized["doc_id"].astype(str))
-        ]
+        normalized["chunk_id"] = _stable_ids("chunk_", _positional_seeds(normalized["doc_id"]))
     if "chunk_index" not in normalized.columns:
         normalized["chunk_index"] = 0
     if "facility_name" not in normalized.columns:
@@ -115,36 +178,83 @@ def normalize_raw_documents(
     if "metadata" not in normalized.columns:
         normalized["metadata"] = "{}"
 
-    rows: List[Dict[str, object]] = []
-    for row in normalized.itertuples(index=False):
-        base_chunk_id = str(getattr(row, "chunk_id"))
-        doc_id = str(getattr(row, "doc_id"))
-        text = str(getattr(row, "text", ""))
+    # Accumulate one list per output column (as the ingest document store does) rather
+    # than a dict per chunk, so the frame is built without per-row key inference.
+    columns: Dict[str, List[object]] = {name: [] for name in _TEXT_CHUNK_COLUMNS}
+    origin_fields: Dict[str, str] = {}
+    # Plain per-column lists: zipping them avoids a namedtuple (and Arrow scalar reads) per row.
+    for (
+        base_chunk_id,
+        doc_id,
+        text,
+        metadata,
+        facility_id,
+        facility_name,
+        country,
+        source_type,
+        source_ref,
+    ) in zip(
+        *(
+            normalized[column].tolist()
+            for column in (
+                "chunk_id",
+                "doc_id",
+                "text",
+                "metadata",
+                "facility_id",
+                "facility_name",
+                "country",
+                "source_type",
+                "source_ref",
+            )
+        )
+    ):
+        base_chunk_id = str(base_chunk_id)
+        doc_id = str(doc_id)
         split_chunks = _split_text(text, strategy=strategy, max_chars=max_chunk_chars)
         if not split_chunks:
             continue
-        origin_field = _derive_origin_field(getattr(row, "metadata", None))
+        if isinstance(metadata, str):
+            # Rows from one source share a metadata string; parse each distinct one once.
+            origin_field = origin_fields.get(metadata)
+            if origin_field is None:
+                origin_field = origin_fields[metadata] = _derive_origin_field(metadata)
+        else:
+            origin_field = _derive_origin_field(metadata)
+        repeat = len(split_chunks)
+        columns["doc_id"].extend([doc_id] * repeat)
+        columns["facility_id"].extend([str(facility_id)] * repeat)
+        columns["facility_name"].extend([str(facility_name)] * repeat)
+        columns["country"].extend([str(country)] * repeat)
+        columns["source_type"].extend([str(source_type)] * repeat)
+        columns["source_ref"].extend([str(source_ref)] * repeat)
+        columns["origin_field"].extend([origin_field] * repeat)
+        columns["metadata"].extend([metadata] * repeat)
         for split_idx, chunk_text in enumerate(split_chunks):
             chunk_id = base_chunk_id
             if split_idx > 0:
                 chunk_id = f"{base_chunk_id}_{split_idx}_{_stable_id(f'{doc_id}:{split_idx}:{chunk_text}')[:8]}"
-            rows.append(
-                {
-                    "doc_id": doc_id,
-                    "chunk_id": chunk_id,
-                    "chunk_index": split_idx,
-                    "facility_id": str(getattr(row, "facility_id")),
-                    "facility_name": str(getattr(row, "facility_name")),
-                    "country": str(getattr(row, "country")),
-                    "source_type": str(getattr(row, "source_type")),
-                    "source_ref": str(getattr(row, "source_ref")),
-                    "origin_field": origin_field,
-                    "chunk_text": chunk_text,
-                    "metadata": getattr(row, "metadata", "{}"),
-                }
-            )
+            columns["chunk_id"].append(chunk_id)
+            columns["chunk_index"].append(split_idx)
+            columns["chunk_text"].append(chunk_text)
+
+    if not columns["chunk_id"]:
+        return pd.DataFrame()
+    return pd.DataFrame(columns)
 
-    return pd.DataFrame(rows)
+
+def _claim_score_sums(scores: np.ndarray, key_codes: np.ndarray) -> List[float]:
+    """Per-claim score totals, summed with np.sum like the per-claim frames used to be.
+
+    groupby().sum() compensates rounding differently, which can move totals by an ulp.
+    Matches arrive grouped by claim, so each claim's scores are one contiguous slice.
+    """
+
+    if len(key_codes) > 1 and (np.diff(key_codes) < 0).any():
+        order = np.argsort(key_codes, kind="stable")
+        scores, key_codes = scores[order], key_codes[order]
+    bounds = np.flatnonzero(np.diff(key_codes)) + 1
+    return [float(segment.sum()) for segment in np.split(scores, bounds)]
 
 
 def _decide_claim_status(strong_matches: int, weak_matches: int, negative_matches: int) -> str:
@@ -177,90 +287,120 @@ def extract_capability_claims(
     ontology: CapabilityOntology,
     *,
     max_evidence_per_claim: int = 5,
+    workers: int = 1,
 ) -> tuple[pd.DataFrame, pd.DataFrame]:
-    """Generate raw facility-capability claims and retrieval matches."""
+    """Generate raw facility-capability claims and retrieval matches.
+
+    `workers` is passed to `KeywordRetriever.retrieve_all`.
+    """
 
     if text_chunks.empty:
         return pd.DataFrame(), pd.DataFrame()
 
-    retriever = KeywordRetriever(ontology)
-    claims: List[Dict[str, object]] = []
-    all_match_rows: List[pd.DataFrame] = []
-
-    for facility_id, facility_chunks in text_chunks.groupby("facility_id", sort=False):
-        facility_name = str(facility_chunks.iloc[0].get("facility_name", "Unknown Facility"))
-        country = str(facility_chunks.iloc[0].get("country", "Unknown"))
+    capabilities = ontology.ordered_capabilities()
+    # One retrieval pass over all chunks and capabilities, then grouped aggregation,
+    # instead of a retrieval pass per (facility, capability) pair.
+    matches = KeywordRetriever(ontology).retrieve_all(text_chunks, capabilities, workers=workers)
+    claim_keys = ["facility_id", "capability"]
+
+    counts: Dict[tuple, tuple] = {}
+    retrieval_scores: Dict[tuple, float] = {}
+    citation_dicts: Dict[tuple, List[dict[str, str]]] = {}
+    if not matches.empty:
+        grouped = matches.groupby(claim_keys, sort=False)
+        claim_index = list(grouped.size().index)
+        # Integer-coded (claim, match type) pairs give all strong/weak/negative counts
+        # from one bincount.
+        key_codes = grouped.ngroup().to_numpy()
+        type_codes = matches["match_type"].map(_MATCH_TYPE_CODES).to_numpy(dtype=np.int64)
+        type_counts = np.bincount(
+            key_codes * len(_MATCH_TYPE_CODES) + type_codes,
+            minlength=len(claim_index) * len(_MATCH_TYPE_CODES),
+        ).reshape(-1, len(_MATCH_TYPE_CODES))
+        counts = dict(zip(claim_index, map(tuple, type_counts.tolist())))
+        retrieval_scores = dict(
+            zip(claim_index, _claim_score_sums(matches["score"].to_numpy(), key_codes))
+        )
+
+        # Absent claims cite negative matches; every other status cites strong/weak ones.
+        strong, weak, negative = type_counts.T
+        absent = ~((strong > 0) | ((weak > 0) & (negative == 0)))
+        cites_negative = absent[key_codes]
+        is_negative = type_codes == _MATCH_TYPE_CODES["negative"]
+        evidence = matches[is_negative == cites_negative]
+        evidence = evidence.drop_duplicates(subset=claim_keys + ["chunk_id"])
+        evidence = evidence.groupby(claim_keys, sort=False).head(max_evidence_per_claim)
+        # Plain column lists zipped together; no namedtuple per evidence row.
+        for facility_key, capability_id, chunk_id, doc_id, source_type, source_ref, text in zip(
+            *(evidence[column].tolist() for column in _CITATION_COLUMNS)
+        ):
+            citation = build_citation(
+                facility_id=facility_key,
+                capability=capability_id,
+                chunk_id=chunk_id,
+                doc_id=doc_id,
+                source_type=source_type,
+                source_ref=source_ref,
+                text=text,
+            )
+            citation_dicts.setdefault((facility_key, capability_id), []).append(
+                citation.to_dict()
+            )
 
-        for capability in ontology.ordered_capabilities():
-            matches = retriever.retrieve_for_capability(facility_chunks, capability)
-            match_frame = matches_to_frame(matches)
-            if not match_frame.empty:
-                all_match_rows.append(match_frame)
+    first_rows = text_chunks.drop_duplicates(subset=["facility_id"])
+    first_rows = first_rows[first_rows["facility_id"].notna()]
+    facility_names = (
+        first_rows["facility_name"].tolist()
+        if "facility_name" in first_rows.columns
+        else ["Unknown Facility"] * len(first_rows)
+    )
+    countries = (
+        first_rows["country"].tolist()
+        if "country" in first_rows.columns
+        else ["Unknown"] * len(first_rows)
+    )
 
-            strong_count = int((match_frame["match_type"] == "strong").sum()) if not match_frame.empty else 0
-            weak_count = int((match_frame["match_type"] == "weak").sum()) if not match_frame.empty else 0
-            negative_count = int((match_frame["match_type"] == "negative").sum()) if not match_frame.empty else 0
+    claims: Dict[str, List[object]] = {name: [] for name in _CLAIM_COLUMNS}
+    for facility_id, facility_name, country in zip(
+        first_rows["facility_id"].tolist(), facility_names, countries
+    ):
+        facility_key = str(facility_id)
+        for capability in capabilities:
+            key = (facility_key, capability.capability_id)
+            strong_count, weak_count, negative_count = counts.get(key, (0, 0, 0))
             status = _decide_claim_status(strong_count, weak_count, negative_count)
-
-            if status == "absent":
-                evidence_candidates = match_frame[match_frame["match_type"] == "negative"]
-            else:
-                evidence_candidates = match_frame[match_frame["match_type"].isin(["strong", "weak"])]
-            evidence_candidates = evidence_candidates.drop_duplicates(subset=["chunk_id"]).head(
-                max_evidence_per_claim
-            )
-
-            citations = [
-                build_citation(
-                    facility_id=str(facility_id),
-                    capability=capability.capability_id,
-                    chunk_id=str(row.chunk_id),
-                    doc_id=str(row.doc_id),
-                    source_type=str(row.source_type),
-                    source_ref=str(row.source_ref),
-                    text=str(row.chunk_text),
+            citations = citation_dicts.get(key, [])
+            evidence_source_refs = [item["source_ref"] for item in citations]
+
+            claims["facility_id"].append(facility_key)
+            claims["facility_name"].append(str(facility_name))
+            claims["country"].append(str(country))
+            claims["capability"].append(capability.capability_id)
+            claims["category"].append(capability.category)
+            claims["status"].append(status)
+            claims["strong_match_count"].append(strong_count)
+            claims["weak_match_count"].append(weak_count)
+            claims["negative_match_count"].append(negative_count)
+            claims["retrieval_score"].append(retrieval_scores.get(key, 0.0))
+            claims["evidence_count"].append(len(citations))
+            claims["source_support_count"].append(len(set(evidence_source_refs)))
+            claims["evidence_ids"].append([item["evidence_id"] for item in citations])
+            claims["evidence_chunk_ids"].append([item["chunk_id"] for item in citations])
+            claims["evidence_doc_ids"].append([item["doc_id"] for item in citations])
+            claims["evidence_source_refs"].append(evidence_source_refs)
+            claims["citations"].append(citations)
+            claims["raw_explanation"].append(
+                _build_raw_explanation(
+                    capability.capability_id,
+                    status,
+                    strong_count,
+                    weak_count,
+                    negative_count,
                 )
-                for row in evidence_candidates.itertuples(index=False)
-            ]
-            citation_dicts = citations_to_dicts(citations)
-
-            evidence_ids = [item["evidence_id"] for item in citation_dicts]
-            evidence_chunk_ids = [item["chunk_id"] for item in citation_dicts]
-            evidence_doc_ids = [item["doc_id"] for item in citation_dicts]
-            evidence_source_refs = [item["source_ref"] for item in citation_dicts]
-
-            claims.append(
-                {
-                    "facility_id": str(facility_id),
-                    "facility_name": facility_name,
-                    "country": country,
-                    "capability": capability.capability_id,
-                    "category": capability.category,
-                    "status": status,
-                    "strong_match_count": strong_count,
-                    "weak_match_count": weak_count,
-                    "negative_match_count": negative_count,
-                    "retrieval_score": float(match_frame["score"].sum()) if not match_frame.empty else 0.0,
-                    "evidence_count": len(evidence_ids),
-                    "source_support_count": len(set(evidence_source_refs)),
-                    "evidence_ids": evidence_ids,
-                    "evidence_chunk_ids": evidence_chunk_ids,
-                    "evidence_doc_ids": evidence_doc_ids,
-                    "evidence_source_refs": evidence_source_refs,
-                    "citations": citation_dicts,
-                    "raw_explanation": _build_raw_explanation(
-                        capability.capability_id,
-                        status,
-                        strong_count,
-                        weak_count,
-                        negative_count,
-                    ),
-                }
             )
 
-    claim_frame = pd.DataFrame(claims)
-    matches_frame = pd.concat(all_match_rows, ignore_index=True) if all_match_rows else pd.DataFrame()
-    return claim_frame, matches_frame
+    claim_frame = pd.DataFrame(claims) if claims["facility_id"] else pd.DataFrame()
+    return claim_frame, matches if not matches.empty else pd.DataFrame()
 
 
 __all__ = ["normalize_raw_documents", "extract_capability_claims"]
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping, Sequence
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
+import yaml
 from omegaconf import OmegaConf
 
 from src.common.config import PROJECT_ROOT
@@ -13,6 +17,8 @@ from src.common.config import PROJECT_ROOT
 
 DEFAULT_CAPABILITIES_PATH = PROJECT_ROOT / "config" / "ontology" / "capabilities.yaml"
 DEFAULT_PREREQUISITES_PATH = PROJECT_ROOT / "config" / "ontology" / "prerequisites.yaml"
+# libyaml's C loader when PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 @dataclass(frozen=True)
@@ -30,19 +36,28 @@ class CapabilityDefinition:
 
 @dataclass(frozen=True)
 class CapabilityOntology:
-    """Container for loaded capability definitions and categories."""
-
-    capabilities: Dict[str, CapabilityDefinition]
-    categories: Dict[str, List[str]]
+    """Container for loaded capability definitions and categories.
+
+    Instances are shared process-wide by `load_capability_ontology`, so the
+    loader hands out read-only mappings.
+    """
+
+    capabilities: Mapping[str, CapabilityDefinition]
+    categories: Mapping[str, Sequence[str]]
+    _ordered: tuple[CapabilityDefinition, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Both mappings are fixed at construction, so the category walk happens once.
+        ordered = tuple(
+            self.capabilities[capability_id]
+            for capability_ids in self.categories.values()
+            for capability_id in capability_ids
+            if capability_id in self.capabilities
+        )
+        object.__setattr__(self, "_ordered", ordered)
 
     def ordered_capabilities(self) -> List[CapabilityDefinition]:
-        ordered: List[CapabilityDefinition] = []
-        for category in self.categories:
-            for capability_id in self.categories[category]:
-                definition = self.capabilities.get(capability_id)
-                if definition is not None:
-                    ordered.append(definition)
-        return ordered
+        return list(self._ordered)
 
 
 DEFAULT_SYNONYMS: Dict[str, List[str]] = {
@@ -77,7 +92,8 @@ def _dedupe(values: Iterable[str]) -> tuple[str, ...]:
         if not norm or norm in seen:
             continue
         seen.add(norm)
-        out.append(norm)
+        # Interned so every capability (and the retriever) shares one object per phrase.
+        out.append(sys.intern(norm))
     return tuple(out)
 
 
@@ -85,7 +101,8 @@ def _capability_label(capability_id: str) -> str:
     return capability_id.replace("_", " ").strip().lower()
 
 
-def _default_phrases(capability_id: str, synonyms: Sequence[str]) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
+@lru_cache(maxsize=512)
+def _default_phrases(capability_id: str, synonyms: tuple[str, ...]) -> tuple[tuple[str, ...], tuple[str, ...], tuple[str, ...]]:
     base_terms = list(_dedupe([_capability_label(capability_id), *synonyms]))
     strong_templates = (
         "provides {term}",
@@ -113,23 +130,44 @@ def _default_phrases(capability_id: str, synonyms: Sequence[str]) -> tuple[tuple
 
 
 def _load_yaml(path: Path) -> Mapping[str, object]:
-    if not path.exists():
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
         return {}
-    cfg = OmegaConf.load(path)
-    payload = OmegaConf.to_container(cfg, resolve=True)
+    if b"${" in data:
+        # Interpolations need OmegaConf to resolve them.
+        payload = OmegaConf.to_container(OmegaConf.create(data.decode("utf-8")), resolve=True)
+    else:
+        # Plain YAML parses an order of magnitude faster without building an OmegaConf tree;
+        # libyaml decodes the UTF-8 bytes itself.
+        payload = yaml.load(data, Loader=_YAML_LOADER)
     if isinstance(payload, dict):
         return payload
     return {}
 
 
-def load_capability_ontology(
-    capabilities_path: Path | None = None,
-    prerequisites_path: Path | None = None,
+_FileSignature = Tuple[Path, Optional[int], Optional[int]]
+
+
+def _file_signature(path: Path) -> _FileSignature:
+    """(path, mtime_ns, size) so edits on disk produce a new cache key; Nones when missing."""
+
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return path, None, None
+    return path, stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=4)
+def _load_capability_ontology_internal(
+    capabilities_signature: _FileSignature,
+    prerequisites_signature: _FileSignature,
 ) -> CapabilityOntology:
-    """Load ontology files and return normalized capability definitions."""
+    """Internal cached loader keyed by ontology file paths plus their mtime and size."""
 
-    capabilities_cfg = _load_yaml(capabilities_path or DEFAULT_CAPABILITIES_PATH)
-    prerequisites_cfg = _load_yaml(prerequisites_path or DEFAULT_PREREQUISITES_PATH)
+    capabilities_cfg = _load_yaml(capabilities_signature[0])
+    prerequisites_cfg = _load_yaml(prerequisites_signature[0])
 
     categories_payload = capabilities_cfg.get("categories", {})
     categories: Dict[str, List[str]] = {}
@@ -203,7 +241,41 @@ def load_capability_ontology(
             prerequisites=prerequisites,
         )
 
-    return CapabilityOntology(capabilities=capabilities, categories=categories)
+    return CapabilityOntology(
+        capabilities=MappingProxyType(capabilities),
+        categories=MappingProxyType({name: tuple(ids) for name, ids in categories.items()}),
+    )
+
+
+def ontology_cache_clear() -> None:
+    """Drop cached ontologies so the next load re-reads the YAML files."""
+
+    _load_capability_ontology_internal.cache_clear()
+    _default_phrases.cache_clear()
+
+
+def load_capability_ontology(
+    capabilities_path: Path | None = None,
+    prerequisites_path: Path | None = None,
+    *,
+    reload: bool = False,
+) -> CapabilityOntology:
+    """Load ontology files and return normalized capability definitions.
+
+    Results are cached per process until either YAML file changes on disk.
+    """
+
+    if reload:
+        ontology_cache_clear()
+    return _load_capability_ontology_internal(
+        _file_signature(Path(capabilities_path or DEFAULT_CAPABILITIES_PATH)),
+        _file_signature(Path(prerequisites_path or DEFAULT_PREREQUISITES_PATH)),
+    )
 
 
-__all__ = ["CapabilityDefinition", "CapabilityOntology", "load_capability_ontology"]
+__all__ = [
+    "CapabilityDefinition",
+    "CapabilityOntology",
+    "load_capability_ontology",
+    "ontology_cache_clear",
+]
@@ -2,11 +2,21 @@
 
 from __future__ import annotations
 
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, List
+from functools import lru_cache
+from itertools import repeat
+from typing import Dict, Iterable, List, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
 from .ontology import CapabilityDefinition, CapabilityOntology
 
 
@@ -26,13 +36,194 @@ class ChunkMatch:
     score: float
 
 
-def _count_hits(text: str, phrases: Iterable[str]) -> List[str]:
-    matches: List[str] = []
-    for phrase in phrases:
-        phrase = phrase.strip().lower()
-        if phrase and phrase in text:
-            matches.append(phrase)
-    return matches
+_MATCH_COLUMNS = [
+    "facility_id",
+    "capability",
+    "chunk_id",
+    "doc_id",
+    "source_type",
+    "source_ref",
+    "chunk_text",
+    "match_type",
+    "keyword",
+    "score",
+]
+# ChunkMatch field names that differ from their `_MATCH_COLUMNS` entry.
+_CHUNK_MATCH_FIELDS = {"chunk_text": "text"}
+# Matches are ranked by score (desc); these are the per-type scores in that order.
+_MATCH_EVENTS: Tuple[Tuple[str, float], ...] = (("strong", 1.0), ("negative", 0.8), ("weak", 0.45))
+
+
+def _normalized_phrases(phrases: Iterable[str]) -> Tuple[str, ...]:
+    # Interning maps already-normalized ontology phrases back to their shared objects, so
+    # phrase tables compare by identity (e.g. as `_build_automaton` cache keys).
+    return tuple(sys.intern(phrase) for phrase in (p.strip().lower() for p in phrases) if phrase)
+
+
+@lru_cache(maxsize=1024)
+def _phrase_events(capability: CapabilityDefinition) -> Tuple[Tuple[str, ...], ...]:
+    """A capability's normalized phrases per match event, in _MATCH_EVENTS order.
+
+    Memoized per (frozen, hashable) definition: the cached ontology hands out the same
+    definitions on every call, so each scan reuses one phrase table and its automaton.
+    """
+
+    return (
+        _normalized_phrases(capability.strong_phrases),
+        _normalized_phrases(capability.negative_phrases),
+        _normalized_phrases(capability.weak_phrases),
+    )
+
+
+_PhraseTable = Tuple[Tuple[Tuple[str, ...], ...], ...]
+_Tagged = Dict[Tuple[int, int, int], List[Tuple[int, str]]]
+
+
+@lru_cache(maxsize=32)
+def _build_automaton(phrase_table: _PhraseTable):
+    """Aho-Corasick automaton over every phrase in the table, or None without pyahocorasick.
+
+    Each phrase maps to its (capability, event, phrase position, keyword) slots; a phrase
+    can sit in several capabilities' lists.
+    """
+
+    if ahocorasick is None:
+        return None
+    slots: Dict[str, List[Tuple[int, int, int, str]]] = {}
+    for capability_position, event_phrases in enumerate(phrase_table):
+        for event_position, phrases in enumerate(event_phrases):
+            for phrase_position, keyword in enumerate(phrases):
+                slots.setdefault(keyword, []).append(
+                    (capability_position, event_position, phrase_position, keyword)
+                )
+    if not slots:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword, keyword_slots in slots.items():
+        automaton.add_word(keyword, tuple(keyword_slots))
+    automaton.make_automaton()
+    return automaton
+
+
+def _scan_chunks(
+    chunk_texts: Sequence[str],
+    facility_codes: Sequence[int],
+    phrase_table: _PhraseTable,
+    offset: int = 0,
+) -> _Tagged:
+    """Phrase hits keyed by (facility, capability, event) tag, as (chunk position, keyword).
+
+    Lists keep chunk order and phrase order, so a stable sort on the tag alone reproduces
+    `retrieve_for_capability`'s ordering. Uses the Aho-Corasick automaton when available;
+    otherwise plain `in` checks, which on these short chunks beat both a per-capability
+    regex alternation and per-phrase `str.contains` column passes.
+    """
+
+    automaton = _build_automaton(phrase_table)
+    tagged: _Tagged = {}
+    for position, (facility_code, text) in enumerate(zip(facility_codes, chunk_texts), offset):
+        if facility_code < 0 or not text:
+            continue
+        lowered = text.lower()
+        if automaton is not None:
+            # One pass over the text finds every phrase; sorting the hit slots restores the
+            # capability / event / phrase order of the nested loops below.
+            # Slots are unique per phrase position, so the set also drops repeat occurrences.
+            hits = {slot for _, slots in automaton.iter(lowered) for slot in slots}
+            for capability_position, event_position, _, keyword in sorted(hits):
+                tagged.setdefault((facility_code, capability_position, event_position), []).append(
+                    (position, keyword)
+                )
+            continue
+        for capability_position, event_phrases in enumerate(phrase_table):
+            for event_position, phrases in enumerate(event_phrases):
+                for keyword in phrases:
+                    if keyword in lowered:
+                        tagged.setdefault(
+                            (facility_code, capability_position, event_position), []
+                        ).append((position, keyword))
+    return tagged
+
+
+def _scan_chunks_parallel(
+    chunk_texts: Sequence[str],
+    facility_codes: Sequence[int],
+    phrase_table: _PhraseTable,
+    workers: int,
+) -> _Tagged:
+    """`_scan_chunks` split across `workers` processes; a single worker scans inline.
+
+    Substring matching holds the GIL, so threads would not help. Batches are contiguous
+    and merged in order, which keeps each tag's hits in chunk order.
+    """
+
+    workers = min(workers, len(chunk_texts))
+    if workers < 2:
+        return _scan_chunks(chunk_texts, facility_codes, phrase_table)
+
+    batch_size = -(-len(chunk_texts) // workers)
+    starts = range(0, len(chunk_texts), batch_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        batches = executor.map(
+            _scan_chunks,
+            [chunk_texts[start : start + batch_size] for start in starts],
+            [facility_codes[start : start + batch_size] for start in starts],
+            repeat(phrase_table),
+            starts,
+        )
+        tagged: _Tagged = {}
+        for batch in batches:
+            for tag, hits in batch.items():
+                tagged.setdefault(tag, []).extend(hits)
+    return tagged
+
+
+def _match_columns(
+    chunks: pd.DataFrame,
+    chunk_texts: Sequence[str],
+    tagged: _Tagged,
+    capability_ids: Sequence[str],
+) -> Dict[str, List[object]]:
+    """Scan hits as one list per `_MATCH_COLUMNS` entry, ordered by tag.
+
+    Rows are accumulated column by column, so no per-match object is built on the way to
+    a DataFrame.
+    """
+
+    positions: List[int] = []
+    match_capabilities: List[str] = []
+    match_types: List[str] = []
+    keywords: List[str] = []
+    scores: List[float] = []
+    for tag in sorted(tagged):
+        capability_id = capability_ids[tag[1]]
+        match_type, score = _MATCH_EVENTS[tag[2]]
+        for position, keyword in tagged[tag]:
+            positions.append(position)
+            match_capabilities.append(capability_id)
+            match_types.append(match_type)
+            keywords.append(keyword)
+            scores.append(score)
+
+    # Each chunk can match many phrases: convert every column to str once per chunk and
+    # gather by position, rather than converting per match.
+    match_positions = np.asarray(positions, dtype=np.intp)
+
+    def _text_column(values: Sequence[object]) -> List[str]:
+        return np.array([str(value) for value in values], dtype=object)[match_positions].tolist()
+
+    return {
+        "facility_id": _text_column(chunks["facility_id"].tolist()),
+        "capability": match_capabilities,
+        "chunk_id": _text_column(chunks["chunk_id"].tolist()),
+        "doc_id": _text_column(chunks["doc_id"].tolist()),
+        "source_type": _text_column(chunks["source_type"].tolist()),
+        "source_ref": _text_column(chunks["source_ref"].tolist()),
+        "chunk_text": _text_column(chunk_texts),
+        "match_type": match_types,
+        "keyword": keywords,
+        "score": scores,
+    }
 
 
 class KeywordRetriever:
@@ -48,73 +239,77 @@ class KeywordRetriever:
     ) -> List[ChunkMatch]:
         """Return chunk matches for a single capability."""
 
-        matches: List[ChunkMatch] = []
-        for row in chunks.itertuples(index=False):
-            text = str(getattr(row, "chunk_text", "")).lower()
-            if not text:
-                continue
-
-            strong_hits = _count_hits(text, capability.strong_phrases)
-            weak_hits = _count_hits(text, capability.weak_phrases)
-            negative_hits = _count_hits(text, capability.negative_phrases)
-
-            events = [
-                ("strong", strong_hits, 1.0),
-                ("weak", weak_hits, 0.45),
-                ("negative", negative_hits, 0.8),
-            ]
-            for match_type, keywords, weight in events:
-                for keyword in keywords:
-                    matches.append(
-                        ChunkMatch(
-                            facility_id=str(getattr(row, "facility_id")),
-                            capability=capability.capability_id,
-                            chunk_id=str(getattr(row, "chunk_id")),
-                            doc_id=str(getattr(row, "doc_id")),
-                            source_type=str(getattr(row, "source_type")),
-                            source_ref=str(getattr(row, "source_ref")),
-                            text=str(getattr(row, "chunk_text")),
-                            match_type=match_type,
-                            keyword=keyword,
-                            score=weight,
-                        )
-                    )
-
-        matches.sort(key=lambda item: item.score, reverse=True)
-        return matches
+        if chunks.empty or "chunk_text" not in chunks.columns:
+            return []
+        chunk_texts = [str(value) for value in chunks["chunk_text"].tolist()]
+        # Every row counts as one facility here, so hits group by event only: strong,
+        # negative, then weak (score order), each in chunk order.
+        tagged = _scan_chunks(chunk_texts, [0] * len(chunk_texts), (_phrase_events(capability),))
+
+        if not tagged:
+            return []
+        columns = _match_columns(chunks, chunk_texts, tagged, [capability.capability_id])
+        fields = [_CHUNK_MATCH_FIELDS.get(column, column) for column in columns]
+        return [ChunkMatch(**dict(zip(fields, row))) for row in zip(*columns.values())]
+
+    def retrieve_all(
+        self,
+        chunks: pd.DataFrame,
+        capabilities: Sequence[CapabilityDefinition] | None = None,
+        *,
+        workers: int = 1,
+    ) -> pd.DataFrame:
+        """Return matches for every capability over all chunks as one long-form frame.
+
+        Each chunk's text is read and lowercased once for all capabilities. Rows are
+        ordered by facility (first appearance), capability, then as
+        `retrieve_for_capability` orders a single facility/capability pair.
+
+        `workers > 1` scans contiguous batches of chunks in that many worker processes.
+        It is meant for CLI entry points (which run under a `__main__` guard) on large
+        corpora; the default scans in the calling process.
+        """
+
+        capabilities = (
+            self.ontology.ordered_capabilities() if capabilities is None else list(capabilities)
+        )
+        if chunks.empty or "chunk_text" not in chunks.columns:
+            return pd.DataFrame(columns=_MATCH_COLUMNS)
+
+        capability_ids_by_position = [capability.capability_id for capability in capabilities]
+        # phrase_table[capability][event] holds the normalized phrases in _MATCH_EVENTS order.
+        phrase_table = tuple(_phrase_events(capability) for capability in capabilities)
+        facility_codes = pd.factorize(chunks["facility_id"])[0].tolist()
+        chunk_texts = [str(value) for value in chunks["chunk_text"].tolist()]
+        tagged = _scan_chunks_parallel(chunk_texts, facility_codes, phrase_table, workers)
+
+        if not tagged:
+            return pd.DataFrame(columns=_MATCH_COLUMNS)
+
+        return pd.DataFrame(
+            _match_columns(chunks, chunk_texts, tagged, capability_ids_by_position)
+        )
 
 
 def matches_to_frame(matches: Iterable[ChunkMatch]) -> pd.DataFrame:
     """Convert chunk matches to a DataFrame."""
 
-    columns = [
-        "facility_id",
-        "capability",
-        "chunk_id",
-        "doc_id",
-        "source_type",
-        "source_ref",
-        "chunk_text",
-        "match_type",
-        "keyword",
-        "score",
-    ]
-    rows = [
-        {
-            "facility_id": match.facility_id,
-            "capability": match.capability,
-            "chunk_id": match.chunk_id,
-            "doc_id": match.doc_id,
-            "source_type": match.source_type,
-            "source_ref": match.source_ref,
-            "chunk_text": match.text,
-            "match_type": match.match_type,
-            "keyword": match.keyword,
-            "score": match.score,
-        }
-        for match in matches
-    ]
-    return pd.DataFrame(rows, columns=columns)
+    matches = list(matches)
+    columns = {
+        "facility_id": [match.facility_id for match in matches],
+        "capability": [match.capability for match in matches],
+        "chunk_id": [match.chunk_id for match in matches],
+        "doc_id": [match.doc_id for match in matches],
+        "source_type": [match.source_type for match in matches],
+        "source_ref": [match.source_ref for match in matches],
+        "chunk_text": [match.text for match in matches],
+        "match_type": [match.match_type for match in matches],
+        "keyword": [match.keyword for match in matches],
+        "score": [match.score for match in matches],
+    }
+    if not matches:
+        return pd.DataFrame(columns=_MATCH_COLUMNS)
+    return pd.DataFrame(columns)
 
 
 __all__ = ["ChunkMatch", "KeywordRetriever", "matches_to_frame"]
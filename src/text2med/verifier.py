@@ -2,19 +2,88 @@
 
 from __future__ import annotations
 
-from typing import List
+from typing import List, Mapping, Sequence
 
+import numpy as np
 import pandas as pd
 
 from .ontology import CapabilityOntology
 
 
-def _missing_required_status(frame: pd.DataFrame, facility_id: str, capability: str) -> bool:
-    subset = frame[(frame["facility_id"] == facility_id) & (frame["capability"] == capability)]
-    if subset.empty:
-        return True
-    status = str(subset.iloc[0].get("status", "absent"))
-    return status == "absent"
+_ACTIVE_STATUSES = ["present", "uncertain"]
+_FLAG_NAMES = ("missing_prerequisite", "inconsistent_claim", "low_evidence")
+# Flag names per 3-bit code (bit i set = _FLAG_NAMES[i] raised), in _FLAG_NAMES order.
+_FLAG_COMBOS = tuple(
+    tuple(name for bit, name in enumerate(_FLAG_NAMES) if code >> bit & 1)
+    for code in range(1 << len(_FLAG_NAMES))
+)
+
+
+def _count_column(frame: pd.DataFrame, column: str) -> np.ndarray:
+    if column not in frame.columns:
+        return np.zeros(len(frame), dtype=np.int64)
+    return frame[column].to_numpy(dtype=np.int64)
+
+
+def _missing_prerequisites(
+    facility_ids: List[str],
+    capabilities: List[str],
+    statuses: np.ndarray,
+    active: np.ndarray,
+    prerequisites: Mapping[str, Sequence[str]],
+) -> List[List[str]]:
+    """Per row, the prerequisites whose claim for the same facility is absent or missing.
+
+    Only active rows are checked, and the first row per (facility, capability) decides its
+    status. Facilities and capabilities are integer-coded so every check is one gather
+    from a (facility x capability) "has a non-absent claim" matrix.
+    """
+
+    row_count = len(capabilities)
+    missing_lists: List[List[str]] = [[] for _ in range(row_count)]
+    width = max((len(prereqs) for prereqs in prerequisites.values()), default=0)
+    if not width or not active.any():
+        return missing_lists
+
+    prereq_names = [prereq for prereqs in prerequisites.values() for prereq in prereqs]
+    codes, uniques = pd.factorize(np.asarray(capabilities + prereq_names, dtype=object))
+    vocabulary = pd.Index(uniques)
+    capability_codes = codes[:row_count]
+    facility_codes, facilities = pd.factorize(np.asarray(facility_ids, dtype=object))
+
+    # prereq_codes[capability] lists its prerequisite codes in ontology order, -1 padded.
+    prereq_codes = np.full((len(vocabulary), width), -1, dtype=np.intp)
+    for capability, prereqs in prerequisites.items():
+        # Capabilities with no claim rows never need their prerequisites checked.
+        if prereqs and capability in vocabulary:
+            prereq_codes[vocabulary.get_loc(capability), : len(prereqs)] = (
+                vocabulary.get_indexer(prereqs)
+            )
+
+    _, first_rows = np.unique(
+        facility_codes * len(vocabulary) + capability_codes, return_index=True
+    )
+    claimed = np.zeros((len(facilities), len(vocabulary)), dtype=bool)
+    claimed[facility_codes[first_rows], capability_codes[first_rows]] = (
+        statuses[first_rows] != "absent"
+    )
+
+    row_prereqs = prereq_codes[capability_codes]
+    checked = (row_prereqs >= 0) & active[:, None]
+    missing = checked & ~claimed[facility_codes[:, None], np.maximum(row_prereqs, 0)]
+    names = vocabulary.tolist()
+    for row in np.flatnonzero(missing.any(axis=1)).tolist():
+        missing_lists[row] = [names[code] for code in row_prereqs[row][missing[row]].tolist()]
+    return missing_lists
+
+
+def _verification_note(flags: List[str], missing_prereqs: List[str]) -> str:
+    if not flags:
+        return "Verification checks passed."
+    note = "; ".join(flags)
+    if missing_prereqs:
+        note += f" ({', '.join(missing_prereqs)})"
+    return note
 
 
 def apply_verification(
@@ -32,55 +101,46 @@ def apply_verification(
     verified = raw_claims.copy()
     verified["original_status"] = verified["status"]
 
-    final_statuses: List[str] = []
-    flags_list: List[List[str]] = []
-    missing_prereqs_list: List[List[str]] = []
-    contradiction_counts: List[int] = []
-    verification_notes: List[str] = []
-
-    for row in verified.itertuples(index=False):
-        facility_id = str(getattr(row, "facility_id"))
-        capability = str(getattr(row, "capability"))
-        status = str(getattr(row, "status"))
-        strong_count = int(getattr(row, "strong_match_count", 0))
-        negative_count = int(getattr(row, "negative_match_count", 0))
-
-        flags: List[str] = []
-        missing_prereqs: List[str] = []
-        contradictions = 0
-
-        definition = capability_map.get(capability)
-        prerequisites = list(definition.prerequisites) if definition else []
-        if status in {"present", "uncertain"} and prerequisites:
-            for prereq in prerequisites:
-                if _missing_required_status(verified, facility_id, prereq):
-                    missing_prereqs.append(prereq)
-            if missing_prereqs:
-                flags.append("missing_prerequisite")
-                if prerequisite_strict and status == "present":
-                    status = "uncertain"
-
-        if status in {"present", "uncertain"} and strong_count > 0 and negative_count > 0:
-            flags.append("inconsistent_claim")
-            contradictions += 1
-            if status == "present":
-                status = "uncertain"
-
-        if status == "absent" and int(getattr(row, "evidence_count", 0)) == 0:
-            flags.append("low_evidence")
-
-        if not flags:
-            note = "Verification checks passed."
-        else:
-            note = "; ".join(flags)
-            if missing_prereqs:
-                note += f" ({', '.join(missing_prereqs)})"
-
-        final_statuses.append(status)
-        flags_list.append(flags)
-        missing_prereqs_list.append(missing_prereqs)
-        contradiction_counts.append(contradictions)
-        verification_notes.append(note)
+    facility_ids = [str(value) for value in verified["facility_id"].tolist()]
+    capabilities = [str(value) for value in verified["capability"].tolist()]
+    statuses = [str(value) for value in verified["status"].tolist()]
+    # Downgrades only turn present into uncertain, so the active set and the absent
+    # rows are the same before and after each rule.
+    status = np.array(statuses, dtype=object)
+    active = np.isin(status, _ACTIVE_STATUSES)
+    prerequisites = {
+        capability_id: definition.prerequisites
+        for capability_id, definition in capability_map.items()
+    }
+    # Prerequisite checks read the original statuses.
+    missing_prereqs_list = _missing_prerequisites(
+        facility_ids, capabilities, status, active, prerequisites
+    )
+    has_missing = np.fromiter(
+        (bool(missing) for missing in missing_prereqs_list), dtype=bool, count=len(status)
+    )
+    inconsistent = (
+        active
+        & (_count_column(verified, "strong_match_count") > 0)
+        & (_count_column(verified, "negative_match_count") > 0)
+    )
+    low_evidence = (status == "absent") & (_count_column(verified, "evidence_count") == 0)
+
+    downgrade = (inconsistent | has_missing) if prerequisite_strict else inconsistent
+    final_statuses = np.where(downgrade & (status == "present"), "uncertain", status).tolist()
+    # Rows share one of eight flag combinations; look each row's up by code instead of
+    # testing every flag per row. Only rows with missing prerequisites need their own note.
+    flag_codes = (
+        has_missing.astype(np.intp)
+        | inconsistent.astype(np.intp) << 1
+        | low_evidence.astype(np.intp) << 2
+    ).tolist()
+    flags_list = [list(_FLAG_COMBOS[code]) for code in flag_codes]
+    combo_notes = [_verification_note(list(combo), []) for combo in _FLAG_COMBOS]
+    verification_notes = [combo_notes[code] for code in flag_codes]
+    for row in np.flatnonzero(has_missing).tolist():
+        verification_notes[row] = _verification_note(flags_list[row], missing_prereqs_list[row])
+    contradiction_counts = inconsistent.astype(np.int64)
 
     verified["status"] = final_statuses
     verified["flags"] = flags_list
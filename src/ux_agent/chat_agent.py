@@ -7,8 +7,10 @@ import json
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 
+from src.common.schemas import coerce_schema
 from src.loc2hospital.api import Loc2HospitalService, SearchRequest
 
 from .intent_router import Intent, route_intent
@@ -35,6 +37,35 @@ def _normalize_list(value: object) -> List[str]:
     return [str(value)]
 
 
+_NO_ROWS = np.empty(0, dtype=np.intp)
+_LOOKUP_COLUMNS = ("capability", "region_id")
+
+
+def _row_index(frame: pd.DataFrame, column: str) -> Dict[object, np.ndarray]:
+    """Ascending row positions per distinct value of `column` ({} when it is absent)."""
+
+    if column not in frame.columns:
+        return {}
+    return frame.groupby(column, sort=False, observed=True).indices
+
+
+def _lookup_rows(
+    index: Dict[str, Dict[object, np.ndarray]],
+    row_count: int,
+    capability: Optional[str],
+    region_id: Optional[str],
+) -> np.ndarray:
+    """Row positions matching the capability / region filters that are set, in order."""
+
+    positions: Optional[np.ndarray] = None
+    for column, value in zip(_LOOKUP_COLUMNS, (capability, region_id)):
+        if not value:
+            continue
+        rows = index[column].get(value, _NO_ROWS)
+        positions = rows if positions is None else np.intersect1d(positions, rows)
+    return np.arange(row_count) if positions is None else positions
+
+
 @dataclass
 class ChatResponse:
     """Response payload for UX chat interactions."""
@@ -53,18 +84,44 @@ class PlannerChatAgent:
         planning_recommendations: Optional[pd.DataFrame] = None,
         trace_bridge: Optional[TraceBridge] = None,
     ) -> None:
-        self.facilities = facility_capabilities.copy()
+        self.facilities = coerce_schema(facility_capabilities.copy())
         if "missing_prerequisites" in self.facilities.columns:
             self.facilities["missing_prerequisites"] = self.facilities["missing_prerequisites"].apply(
                 _normalize_list
             )
+        # Prerequisite -> row positions, built once so per-query filters are array lookups.
+        self._missing_prereq_rows: Dict[str, np.ndarray] = {}
+        self._has_missing_prereq = np.zeros(len(self.facilities), dtype=bool)
+        if "missing_prerequisites" in self.facilities.columns:
+            positions: Dict[str, List[int]] = {}
+            for position, values in enumerate(self.facilities["missing_prerequisites"].tolist()):
+                for prerequisite in dict.fromkeys(values):
+                    positions.setdefault(prerequisite, []).append(position)
+                self._has_missing_prereq[position] = bool(values)
+            self._missing_prereq_rows = {
+                prerequisite: np.asarray(rows, dtype=np.intp)
+                for prerequisite, rows in positions.items()
+            }
+        self._active_status = (
+            self.facilities["status"].isin(["present", "uncertain"]).to_numpy()
+            if "status" in self.facilities.columns
+            else np.zeros(len(self.facilities), dtype=bool)
+        )
         self.recommendations = (
             planning_recommendations.copy()
             if planning_recommendations is not None
             else pd.DataFrame()
         )
+        # Capability / region row positions, so queries slice the tables once by position.
+        self._facility_index = {
+            column: _row_index(self.facilities, column) for column in _LOOKUP_COLUMNS
+        }
+        self._recommendation_index = {
+            column: _row_index(self.recommendations, column) for column in _LOOKUP_COLUMNS
+        }
         self.service = Loc2HospitalService(self.facilities)
         self.trace_bridge = trace_bridge
+        self._summary_answer: Optional[str] = None
 
     def _run_facility_search(self, intent: Intent) -> ChatResponse:
         result = self.service.search(
@@ -92,19 +149,16 @@ class PlannerChatAgent:
         return ChatResponse(answer=answer, rows=rows)
 
     def _run_missing_prereq(self, intent: Intent) -> ChatResponse:
-        frame = self.facilities.copy()
-        if intent.capability:
-            frame = frame[frame["capability"] == intent.capability]
-        frame = frame[frame["status"].isin(["present", "uncertain"])]
-        if intent.region_id:
-            frame = frame[frame.get("region_id", "") == intent.region_id]
-
+        positions = _lookup_rows(
+            self._facility_index, len(self.facilities), intent.capability, intent.region_id
+        )
         if intent.prerequisite:
-            frame = frame[
-                frame["missing_prerequisites"].apply(lambda values: intent.prerequisite in values)
-            ]
+            positions = np.intersect1d(
+                positions, self._missing_prereq_rows.get(intent.prerequisite, _NO_ROWS)
+            )
         else:
-            frame = frame[frame["missing_prerequisites"].apply(bool)]
+            positions = positions[self._has_missing_prereq[positions]]
+        frame = self.facilities.take(positions[self._active_status[positions]])
 
         rows = frame.head(8)[
             [
@@ -126,24 +180,29 @@ class PlannerChatAgent:
                 rows=[],
             )
 
-        frame = self.recommendations.copy()
-        if intent.capability:
-            frame = frame[frame["capability"] == intent.capability]
-        if intent.region_id:
-            frame = frame[frame["region_id"] == intent.region_id]
+        frame = self.recommendations.take(
+            _lookup_rows(
+                self._recommendation_index,
+                len(self.recommendations),
+                intent.capability,
+                intent.region_id,
+            )
+        )
 
         rows = frame.head(8).to_dict("records")
         answer = f"Found {len(frame)} planning recommendations."
         return ChatResponse(answer=answer, rows=rows)
 
     def _run_summary(self) -> ChatResponse:
-        facilities = self.facilities
-        answer = (
-            f"Dataset includes {facilities['facility_id'].nunique()} facilities, "
-            f"{facilities['capability'].nunique()} capabilities, "
-            f"and {len(facilities)} facility-capability rows."
-        )
-        return ChatResponse(answer=answer, rows=[])
+        if self._summary_answer is None:
+            # The tables never change after __init__, so the counts are computed once.
+            facilities = self.facilities
+            self._summary_answer = (
+                f"Dataset includes {facilities['facility_id'].nunique()} facilities, "
+                f"{len(self._facility_index['capability'])} capabilities, "
+                f"and {len(facilities)} facility-capability rows."
+            )
+        return ChatResponse(answer=self._summary_answer, rows=[])
 
     def answer(self, question: str) -> ChatResponse:
         trace = self.trace_bridge.start_trace(question) if self.trace_bridge else None
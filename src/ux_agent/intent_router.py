@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from typing import Dict, Optional
 
 
@@ -17,6 +18,19 @@ CAPABILITY_KEYWORDS = {
     "lab_tests": ["lab test", "laboratory"],
 }
 
+_REGION_RE = re.compile(r"\bin\s+([a-zA-Z][a-zA-Z\s\-]{1,50})")
+
+
+def _any_substring_re(tokens: tuple[str, ...]) -> re.Pattern[str]:
+    # One compiled literal alternation tests every token in a single scan of the text.
+    return re.compile("|".join(map(re.escape, tokens)))
+
+
+_PLANNING_RE = _any_substring_re(("recommend", "plan", "unlock", "intervention"))
+_MISSING_RE = _any_substring_re(("lack", "missing", "without"))
+_SEARCH_RE = _any_substring_re(("where", "which", "find", "show"))
+_SUMMARY_RE = _any_substring_re(("summary", "overview", "status", "desert"))
+
 
 @dataclass(frozen=True)
 class Intent:
@@ -40,26 +54,35 @@ def _extract_capability(question: str) -> Optional[str]:
 
 
 def _extract_region(question: str) -> Optional[str]:
-    match = re.search(r"\bin\s+([a-zA-Z][a-zA-Z\s\-]{1,50})", question)
+    match = _REGION_RE.search(question)
     if not match:
         return None
-    region = match.group(1).strip().lower()
-    region = re.sub(r"[^a-z0-9\s\-]", "", region)
-    return " ".join(region.split()) or None
+    # The capture only admits ASCII letters, whitespace and '-', so once lowercased there is
+    # nothing for a character filter to drop; split/join trims and collapses whitespace.
+    return " ".join(match.group(1).lower().split()) or None
 
 
 def route_intent(question: str) -> Intent:
-    """Return intent for a user question using lightweight heuristics."""
+    """Return intent for a user question using lightweight heuristics.
+
+    Routing only looks at the stripped, lowercased question, so results are cached on
+    that form. Each call gets its own Intent with a fresh `params` dict, so callers may
+    mutate it without affecting later identical questions.
+    """
+
+    cached = _route_lowered(question.strip().lower())
+    return replace(cached, params=dict(cached.params))
+
 
-    text = question.strip()
-    lower = text.lower()
+@lru_cache(maxsize=1024)
+def _route_lowered(lower: str) -> Intent:
     capability = _extract_capability(lower)
     region = _extract_region(lower)
 
-    if any(token in lower for token in ["recommend", "plan", "unlock", "intervention"]):
+    if _PLANNING_RE.search(lower):
         return Intent(name="planning_recommendations", capability=capability, region_id=region)
 
-    if any(token in lower for token in ["lack", "missing", "without"]) and capability:
+    if capability and _MISSING_RE.search(lower):
         prerequisite = "oxygen_supply" if "oxygen" in lower else None
         return Intent(
             name="missing_prerequisite",
@@ -68,7 +91,7 @@ def route_intent(question: str) -> Intent:
             region_id=region,
         )
 
-    if any(token in lower for token in ["where", "which", "find", "show"]) and capability:
+    if capability and _SEARCH_RE.search(lower):
         min_confidence = 0.45 if "confirmed" in lower else 0.0
         return Intent(
             name="facility_search",
@@ -77,7 +100,7 @@ def route_intent(question: str) -> Intent:
             min_confidence=min_confidence,
         )
 
-    if any(token in lower for token in ["summary", "overview", "status", "desert"]):
+    if _SUMMARY_RE.search(lower):
         return Intent(name="system_summary", capability=capability, region_id=region)
 
     return Intent(name="unknown", capability=capability, region_id=region)
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
-import json
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
-from src.common.storage import ensure_parent_dir
+from src.common.storage import write_json
 
 
 @dataclass
@@ -54,20 +55,46 @@ class AgentTrace:
 
 
 class TraceBridge:
-    """Trace persistence helper for UX flows."""
+    """Trace persistence helper for UX flows.
 
-    def __init__(self, output_dir: Path) -> None:
+    With `background=True`, `write` snapshots the trace and returns its path right away
+    while a single worker thread writes the file; call `flush` before reading traces back.
+    """
+
+    def __init__(self, output_dir: Path, *, background: bool = False) -> None:
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.background = background
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: List[Future] = []
+        self._lock = threading.Lock()
 
     def start_trace(self, question: str) -> AgentTrace:
         return AgentTrace(trace_id=f"trace_{uuid4().hex[:12]}", question=question)
 
     def write(self, trace: AgentTrace) -> Path:
+        # Compact JSON: traces are read by tools, and skipping indentation halves the bytes.
         path = self.output_dir / f"{trace.trace_id}.json"
-        ensure_parent_dir(path)
-        path.write_text(json.dumps(trace.to_dict(), indent=2, ensure_ascii=False), encoding="utf-8")
+        payload = trace.to_dict()
+        if not self.background:
+            return write_json(payload, path, indent=None)
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="trace-writer"
+                )
+            # Finished writes are dropped so the list only holds in-flight ones.
+            self._pending = [future for future in self._pending if not future.done()]
+            self._pending.append(self._executor.submit(write_json, payload, path, indent=None))
         return path
 
+    def flush(self) -> None:
+        """Block until queued background writes finish; re-raises the first write error."""
+
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
 
 __all__ = ["AgentTrace", "TraceStep", "TraceBridge"]
@@ -0,0 +1,154 @@
+import hashlib
+import logging
+import pathlib
+import sys
+from collections import Counter
+
+import httpx
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.data_ingest import scraper as scraper_mod
+from src.data_ingest.scraper import ScrapeRequest, ScraperConfig, WebScraper
+from src.data_ingest.vf_loader import load_vf_data
+
+_HTML = {"Content-Type": "text/html; charset=utf-8"}
+
+
+def _request(url, facility_id="f1"):
+    return ScrapeRequest(
+        facility_id=facility_id,
+        facility_name=f"Facility {facility_id}",
+        country="Ghana",
+        url=url,
+        source_field="vf_url",
+    )
+
+
+def _mock_site(monkeypatch, routes):
+    """Serve `routes` ({url: httpx.Response}) to every scraper; returns per-URL hit counts."""
+
+    hits = Counter()
+
+    def handler(request):
+        url = str(request.url)
+        hits[url] += 1
+        if url in routes:
+            return routes[url]
+        return httpx.Response(404)
+
+    def build_client(*, user_agent, timeout, max_connections, max_keepalive_connections=None):
+        return httpx.AsyncClient(
+            transport=httpx.MockTransport(handler), headers={"User-Agent": user_agent}
+        )
+
+    monkeypatch.setattr(scraper_mod, "build_async_client", build_client)
+    return hits
+
+
+def _scraper(**config):
+    return WebScraper(ScraperConfig(retries=0, **config), logging.getLogger("test_scraper"))
+
+
+def test_load_vf_data_keeps_datetime_like_text_verbatim(tmp_path):
+    (tmp_path / "ghana.csv").write_text(
+        "facility_id,name,country,opened,hours,notes\n"
+        "f1,Alpha Clinic,Ghana,2021-03-04 10:00,08:30,icu available\n"
+        "f2,Beta Hospital,Ghana,2021-02-03T08:15,17:00,\n",
+        encoding="utf-8",
+    )
+    result = load_vf_data(tmp_path, "Ghana", text_fields=["opened", "hours", "notes"])
+
+    assert [doc.text for doc in result.documents] == [
+        "Opened: 2021-03-04 10:00\nHours: 08:30\nNotes: icu available",
+        "Opened: 2021-02-03T08:15\nHours: 17:00",
+    ]
+
+
+def test_scraper_honours_robots_disallow_and_allowlist(monkeypatch):
+    hits = _mock_site(
+        monkeypatch,
+        {
+            "https://example.org/robots.txt": httpx.Response(
+                200, text="User-agent: *\nDisallow: /private\n"
+            ),
+            "https://example.org/private": httpx.Response(200, headers=_HTML, text="secret"),
+            "https://example.org/public": httpx.Response(200, headers=_HTML, text="open"),
+            "https://moh.gov.gh/robots.txt": httpx.Response(
+                200, text="User-agent: *\nDisallow: /\n"
+            ),
+            "https://moh.gov.gh/list": httpx.Response(200, headers=_HTML, text="listed"),
+        },
+    )
+    docs = _scraper(robots_allowlist=("*.gov.gh",)).scrape(
+        [
+            _request("https://example.org/private"),
+            _request("https://example.org/public"),
+            _request("https://moh.gov.gh/list"),
+        ]
+    )
+
+    assert [doc.source_ref for doc in docs] == [
+        "https://example.org/public",
+        "https://moh.gov.gh/list",
+    ]
+    assert hits["https://example.org/private"] == 0
+    assert hits["https://example.org/robots.txt"] == 1
+    assert hits["https://moh.gov.gh/robots.txt"] == 0
+
+
+def test_scraper_skips_non_html_and_caps_body(monkeypatch):
+    _mock_site(
+        monkeypatch,
+        {
+            "https://example.org/report.pdf": httpx.Response(
+                200, headers={"Content-Type": "application/pdf"}, content=b"%PDF-1.4"
+            ),
+            "https://example.org/long": httpx.Response(
+                200, headers=_HTML, text="abcdefghijklmnopqrstuvwxyz"
+            ),
+        },
+    )
+    docs = _scraper(max_response_bytes=10).scrape(
+        [_request("https://example.org/report.pdf"), _request("https://example.org/long")]
+    )
+
+    assert [(doc.source_ref, doc.text) for doc in docs] == [
+        ("https://example.org/long", "abcdefghij")
+    ]
+
+
+def test_scraper_fetches_shared_url_once(monkeypatch):
+    url = "https://example.org/clinic"
+    hits = _mock_site(monkeypatch, {url: httpx.Response(200, headers=_HTML, text="icu ward")})
+    docs = _scraper().scrape([_request(url, "f1"), _request(url, "f2"), _request(url, "f3")])
+
+    assert hits[url] == 1
+    assert [doc.facility_id for doc in docs] == ["f1", "f2", "f3"]
+    assert {doc.text for doc in docs} == {"icu ward"}
+
+
+def test_scraper_cache_is_reused_by_a_new_instance(monkeypatch, tmp_path):
+    url = "https://example.org/clinic"
+    hits = _mock_site(monkeypatch, {url: httpx.Response(200, headers=_HTML, text="icu ward")})
+    first = _scraper(cache_dir=tmp_path, respect_robots=False).scrape([_request(url)])
+    second = _scraper(cache_dir=tmp_path, respect_robots=False).scrape([_request(url)])
+
+    assert hits[url] == 1
+    assert [doc.metadata["from_cache"] for doc in first + second] == [False, True]
+    assert second[0].text == first[0].text == "icu ward"
+
+
+def test_scraper_migrates_legacy_html_cache_entry(monkeypatch, tmp_path):
+    url = "https://example.org/clinic"
+    hits = _mock_site(monkeypatch, {})
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    (tmp_path / f"{digest}.html").write_text("<p>oxygen plant</p>", encoding="utf-8")
+    docs = _scraper(cache_dir=tmp_path, respect_robots=False).scrape([_request(url)])
+
+    assert hits[url] == 0
+    assert [(doc.text, doc.metadata["from_cache"]) for doc in docs] == [("oxygen plant", True)]
+    assert not (tmp_path / f"{digest}.html").exists()
+    assert (tmp_path / f"{digest}.html.gz").exists()
@@ -1,13 +1,14 @@
 import pathlib
 import sys
 
+import numpy as np
 import pandas as pd
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
-from src.common.geo import haversine_km, normalize_region_name, within_radius
+from src.common.geo import haversine_km, normalize_region_name, normalize_region_names, within_radius
 
 
 def test_normalize_region_name():
@@ -16,6 +17,13 @@ def test_normalize_region_name():
     assert normalize_region_name(None) == ""
 
 
+def test_normalize_region_names_matches_scalar():
+    values = [" Upper-East ", "UPPER_EAST", "Greater. Accra", "a  b\tc", ""]
+    expected = [normalize_region_name(value) for value in values]
+    assert normalize_region_names(pd.Series(values)).tolist() == expected
+    assert normalize_region_names(pd.Series([None])).tolist() == [""]
+
+
 def test_haversine_distance_basic():
     accra_lat, accra_lon = 5.6037, -0.1870
     kumasi_lat, kumasi_lon = 6.6885, -1.6244
@@ -23,6 +31,14 @@ def test_haversine_distance_basic():
     assert 200 <= distance <= 260  # approx km
 
 
+def test_haversine_km_broadcasts_arrays():
+    lats = np.array([5.6037, 6.6885, 9.4034])
+    lons = np.array([-0.1870, -1.6244, -0.8424])
+    distances = haversine_km(lats, lons, 5.6037, -0.1870)
+    expected = [haversine_km(lat, lon, 5.6037, -0.1870) for lat, lon in zip(lats, lons)]
+    assert np.allclose(distances, expected)
+
+
 def test_within_radius_filters_correctly():
     facilities = pd.DataFrame(
         [
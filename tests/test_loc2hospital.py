@@ -2,6 +2,7 @@ import pathlib
 import sys
 
 import pandas as pd
+import pytest
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
@@ -69,3 +70,24 @@ def test_loc2hospital_service_search():
     service = Loc2HospitalService(facilities)
     result = service.search(SearchRequest(capability="icu", min_confidence=0.3))
     assert list(result["facility_id"]) == ["f1", "f2"]
+    # Results keep the input's plain string dtypes.
+    assert not isinstance(result["capability"].dtype, pd.CategoricalDtype)
+
+
+def test_loc_query_engine_radius_query_spans_grid_cells():
+    facilities = _sample_facilities()
+    # Just across a grid cell boundary from f1, and ~7km away.
+    extra = facilities.iloc[[0]].assign(facility_id="f3", latitude=5.49, longitude=-0.21)
+    engine = LocQueryEngine(pd.concat([facilities, extra], ignore_index=True))
+    result = engine.run(LocationQuery(latitude=5.55, longitude=-0.2, radius_km=50))
+    assert result["facility_id"].tolist() == ["f1", "f3"]
+    assert (result["distance_km"] <= 50).all()
+    wide = engine.run(LocationQuery(latitude=5.55, longitude=-0.2, radius_km=5000))
+    assert wide["facility_id"].tolist() == ["f1", "f2", "f3"]
+
+
+def test_loc_query_engine_radius_query_requires_geo_columns():
+    facilities = _sample_facilities()[["facility_id", "capability", "confidence"]]
+    engine = LocQueryEngine(facilities)
+    with pytest.raises(ValueError, match="missing required geo columns"):
+        engine.run(LocationQuery(latitude=5.55, longitude=-0.2, radius_km=50))
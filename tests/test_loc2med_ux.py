@@ -1,5 +1,6 @@
 import pathlib
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import pandas as pd
 
@@ -8,6 +9,7 @@ if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
 from src.loc2med.map_data import Loc2MedDataset, build_dashboard_payload
+from src.loc2med.server import Loc2MedBackend
 from src.loc2med.tile_cache import TileCache
 from src.loc2med.ui_state import state_from_config
 from src.ux_agent.chat_agent import PlannerChatAgent
@@ -85,9 +87,25 @@ def test_loc2med_payload_and_cache(tmp_path):
     assert cache.get("payload_test") is not None
 
 
+def test_tile_cache_concurrent_writes_to_one_key(tmp_path):
+    cache = TileCache(tmp_path / "tiles")
+
+    def write_and_read(i):
+        cache.set("shared", {"writer": i, "rows": list(range(200))})
+        return cache.get("shared")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(write_and_read, range(64)))
+
+    assert all(result is not None and result["rows"] == list(range(200)) for result in results)
+    assert [p.name for p in (tmp_path / "tiles").iterdir()] == [cache.path_for_key("shared").name]
+
+
 def test_ux_intent_and_chat_response(tmp_path):
     intent = route_intent("Which hospitals claim ICUs but lack oxygen in north?")
     assert intent.name in {"missing_prerequisite", "facility_search"}
+    intent.params["seen"] = True
+    assert route_intent("Which hospitals claim ICUs but lack oxygen in north?").params == {}
 
     trace_bridge = TraceBridge(tmp_path / "traces")
     agent = PlannerChatAgent(_facilities(), trace_bridge=trace_bridge)
@@ -96,3 +114,33 @@ def test_ux_intent_and_chat_response(tmp_path):
     assert response.trace_id is not None
     trace_path = tmp_path / "traces" / f"{response.trace_id}.json"
     assert trace_path.exists()
+
+
+def test_trace_bridge_background_writes_land_after_flush(tmp_path):
+    trace_bridge = TraceBridge(tmp_path / "traces", background=True)
+    agent = PlannerChatAgent(_facilities(), trace_bridge=trace_bridge)
+    response = agent.answer("Show icu facilities in north")
+    trace_bridge.flush()
+    trace_path = tmp_path / "traces" / f"{response.trace_id}.json"
+    assert trace_path.exists()
+    assert all(row["_trace_path"] == str(trace_path) for row in response.rows)
+
+
+def test_loc2med_backend_persists_payloads_in_tile_cache(tmp_path):
+    facilities_path = tmp_path / "facility_capabilities.parquet"
+    coverage_path = tmp_path / "region_coverage.parquet"
+    _facilities().to_parquet(facilities_path)
+    _coverage().to_parquet(coverage_path)
+    cache = TileCache(tmp_path / "tiles")
+
+    def backend():
+        return Loc2MedBackend(
+            facility_capabilities_path=facilities_path,
+            region_coverage_path=coverage_path,
+            default_state=state_from_config({}),
+            tile_cache=cache,
+        )
+
+    payload = backend().payload({"min_confidence": 0.0})
+    assert len(list((tmp_path / "tiles").iterdir())) == 1
+    assert backend().payload({"min_confidence": 0.0}) == payload
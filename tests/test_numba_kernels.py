@@ -0,0 +1,93 @@
+import pathlib
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.common import geo
+from src.planning import gap_analysis
+from src.planning.gap_analysis import GapAnalysisConfig, compute_gap_table
+from src.text2med import confidence
+from src.text2med.confidence import score_claims
+
+
+# Each case builds inputs of `count` rows and returns a zero-argument call into the public
+# entry point; the test runs it once on the numba kernel and once on the NumPy path.
+def _haversine_degrees(rng, count):
+    latitudes = rng.uniform(-80.0, 80.0, count)
+    longitudes = rng.uniform(-180.0, 180.0, count)
+    latitudes[::97] = np.nan
+    return lambda: geo.haversine_distances_km(latitudes, longitudes, latitude=5.6, longitude=-0.2)
+
+
+def _haversine_radians(rng, count):
+    phi = np.radians(rng.uniform(-80.0, 80.0, count))
+    lam = np.radians(rng.uniform(-180.0, 180.0, count))
+    phi[::89] = np.nan
+    cos_phi = np.cos(phi)
+    return lambda: geo.haversine_distances_from_radians(
+        phi, lam, cos_phi, latitude=5.6, longitude=-0.2
+    )
+
+
+def _gap_severity(rng, count):
+    coverage_score = rng.uniform(0.0, 1.5, count)
+    coverage_score[::53] = np.nan
+    coverage = pd.DataFrame(
+        {
+            "region_id": [f"r{index % 40}" for index in range(count)],
+            "region_name": [f"Region {index % 40}" for index in range(count)],
+            "capability": [f"cap_{index}" for index in range(count)],
+            "coverage_score": coverage_score,
+            "desert_flag": rng.choice(["none", "soft", "hard"], count),
+            "facility_count": rng.integers(0, 3, count),
+        }
+    )
+    config = GapAnalysisConfig(top_n_missing=count, coverage_floor=1.0)
+    return lambda: compute_gap_table(coverage, config=config)
+
+
+def _claim_confidence(rng, count):
+    claims = pd.DataFrame(
+        {
+            "status": rng.choice(["present", "uncertain", "absent", "unknown"], count),
+            "strong_match_count": rng.integers(0, 4, count),
+            "source_support_count": rng.integers(0, 4, count),
+            "contradiction_count": rng.integers(0, 2, count),
+            "missing_prerequisites": [
+                ["oxygen_supply"] if missing else [] for missing in rng.random(count) < 0.3
+            ],
+        }
+    )
+    weights = {"specificity": 0.3, "multi_evidence": 0.2, "prerequisite_penalty": -0.2}
+    return lambda: score_claims(claims, weights)
+
+
+def _assert_arrays_match(kernel, numpy_path):
+    # assert_allclose also requires the inf rows (NaN inputs) to line up.
+    np.testing.assert_allclose(kernel, numpy_path, rtol=1e-12)
+
+
+@pytest.mark.parametrize(
+    "module, kernel_factory, build, assert_same",
+    [
+        (geo, "_numba_haversine_kernel", _haversine_degrees, _assert_arrays_match),
+        (geo, "_numba_radians_haversine_kernel", _haversine_radians, _assert_arrays_match),
+        (gap_analysis, "_numba_severity_kernel", _gap_severity, pd.testing.assert_frame_equal),
+        (confidence, "_numba_confidence_kernel", _claim_confidence, pd.testing.assert_frame_equal),
+    ],
+    ids=["haversine", "haversine_radians", "gap_severity", "claim_confidence"],
+)
+def test_numba_kernel_matches_numpy(monkeypatch, module, kernel_factory, build, assert_same):
+    pytest.importorskip("numba")
+    assert getattr(module, kernel_factory)() is not None
+    count = module._NUMBA_MIN_ROWS
+    run = build(np.random.default_rng(0), count)
+    kernel = run()
+    monkeypatch.setattr(module, "_NUMBA_MIN_ROWS", count + 1)
+    assert_same(kernel, run())
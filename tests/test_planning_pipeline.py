@@ -1,6 +1,7 @@
 import pathlib
 import sys
 
+import numpy as np
 import pandas as pd
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
@@ -95,3 +96,22 @@ def test_planning_gap_unlock_recommendations_flow():
     )
     assert not recommendations.empty
     assert {"recommendation_type", "action", "severity_score"}.issubset(recommendations.columns)
+
+
+def test_planning_accepts_array_prerequisites():
+    coverage = _coverage_frame()
+    facilities = _facilities_frame()
+    # Parquet round-trips list columns as NumPy arrays.
+    facilities["missing_prerequisites"] = [
+        np.array(value, dtype=object) for value in facilities["missing_prerequisites"]
+    ]
+    gap_table = compute_gap_table(
+        coverage, config=GapAnalysisConfig(top_n_missing=2, coverage_floor=1.0)
+    )
+    unlock = find_unlock_candidates(facilities, gap_table, config=UnlockConfig())
+    assert unlock["missing_prerequisites"].tolist() == [["oxygen_supply"]]
+    assert unlock["recommended_action"].tolist() == ["Provide prerequisites: oxygen_supply"]
+    recommendations = generate_recommendations(
+        gap_table, unlock, facilities, config=RecommendationConfig(min_alternatives=1)
+    )
+    assert recommendations["recommendation_type"].tolist()[0] == "unlock"
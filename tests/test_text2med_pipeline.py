@@ -7,6 +7,7 @@ ROOT = pathlib.Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from src.text2med import retrieval
 from src.text2med.confidence import score_claims
 from src.text2med.extractor import extract_capability_claims, normalize_raw_documents
 from src.text2med.ontology import load_capability_ontology
@@ -82,3 +83,92 @@ def test_text2med_rule_pipeline_end_to_end(tmp_path):
     assert outputs["text_chunks"].exists()
     assert outputs["raw_claims"].exists()
     assert outputs["facility_capabilities"].exists()
+
+
+def test_load_capability_ontology_is_cached_and_read_only():
+    first = load_capability_ontology()
+    assert load_capability_ontology() is first
+    assert load_capability_ontology(reload=True) is not first
+
+    try:
+        first.capabilities["icu"] = None  # type: ignore[index]
+    except TypeError:
+        pass
+    else:  # pragma: no cover - mapping should be immutable
+        raise AssertionError("cached ontology mappings must be read-only")
+
+
+def test_apply_verification_flags_and_downgrades():
+    def claim(facility_id, capability, status, strong=0, negative=0, evidence=0):
+        return {
+            "facility_id": facility_id,
+            "capability": capability,
+            "status": status,
+            "strong_match_count": strong,
+            "negative_match_count": negative,
+            "evidence_count": evidence,
+        }
+
+    raw_claims = pd.DataFrame(
+        [
+            claim("f1", "icu", "present", strong=2, evidence=2),
+            claim("f1", "oxygen_supply", "present", strong=1, evidence=1),
+            claim("f1", "ventilators", "absent"),
+            claim("f1", "x_ray", "uncertain", strong=1, negative=1, evidence=2),
+            claim("f2", "lab_tests", "absent"),
+        ]
+    )
+    ontology = load_capability_ontology()
+
+    strict = apply_verification(raw_claims, ontology, prerequisite_strict=True)
+    assert strict["status"].tolist() == ["uncertain", "present", "absent", "uncertain", "absent"]
+    assert strict["original_status"].tolist() == raw_claims["status"].tolist()
+    assert strict["missing_prerequisites"].tolist() == [["ventilators"], [], [], ["lab_tests"], []]
+    assert strict["flags"].tolist() == [
+        ["missing_prerequisite"],
+        [],
+        ["low_evidence"],
+        ["missing_prerequisite", "inconsistent_claim"],
+        ["low_evidence"],
+    ]
+    assert strict["contradiction_count"].tolist() == [0, 0, 0, 1, 0]
+    assert strict["verification_notes"].tolist()[:2] == [
+        "missing_prerequisite (ventilators)",
+        "Verification checks passed.",
+    ]
+
+    lenient = apply_verification(raw_claims, ontology, prerequisite_strict=False)
+    assert lenient["status"].tolist()[0] == "present"
+
+
+def test_keyword_retriever_scan_paths_agree(monkeypatch):
+    chunks = pd.DataFrame(
+        {
+            "facility_id": ["f1", "f1", "f2", "f3"],
+            "chunk_id": ["c1", "c2", "c3", "c4"],
+            "doc_id": ["d1", "d1", "d2", "d3"],
+            "source_type": ["vf_row"] * 4,
+            "source_ref": ["r1", "r1", "r2", "r3"],
+            "chunk_text": [
+                "ICU available; provides oxygen supply and oxygen.",
+                "No ventilator. Ventilators unavailable, lack ventilators.",
+                "Performs c-section and caesarean; no blood bank.",
+                "",
+            ],
+        }
+    )
+    retriever = retrieval.KeywordRetriever(load_capability_ontology())
+
+    default = retriever.retrieve_all(chunks)
+    monkeypatch.setattr(retrieval, "ahocorasick", None)
+    retrieval._build_automaton.cache_clear()
+    try:
+        substring_loop = retriever.retrieve_all(chunks)
+    finally:
+        # Drop the automaton-less cache entries before pyahocorasick comes back.
+        retrieval._build_automaton.cache_clear()
+
+    assert not default.empty
+    pd.testing.assert_frame_equal(default, substring_loop)
+    # Worker batches merge back in chunk order.
+    pd.testing.assert_frame_equal(default, retriever.retrieve_all(chunks, workers=2))
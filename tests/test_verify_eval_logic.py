@@ -2,6 +2,7 @@ import importlib.util
 import pathlib
 import sys
 
+import numpy as np
 import pandas as pd
 
 ROOT = pathlib.Path(__file__).resolve().parents[1]
@@ -39,6 +40,26 @@ def test_verify_preparation_and_counts():
     assert prepared.iloc[0]["evidence_count"] == 1
 
 
+def test_verify_preparation_reads_parquet_list_arrays():
+    verify_mod = _load_script_module(ROOT / "scripts" / "verify_capabilities.py", "verify_mod")
+    frame = pd.DataFrame(
+        {
+            "facility_id": ["f1", "f2"],
+            "capability": ["icu", "icu"],
+            "status": ["present", "absent"],
+            "raw_explanation": ["icu: status=present; strong=3, weak=0, negative=1", None],
+            "evidence_ids": [np.array(["ev_1", "ev_2"], dtype=object), np.array([], dtype=object)],
+            "flags": ["[]", ""],
+        }
+    )
+    prepared = verify_mod._prepare_input_for_verification(frame)
+    assert prepared["evidence_ids"].tolist() == [["ev_1", "ev_2"], []]
+    assert prepared["flags"].tolist() == [[], []]
+    assert prepared["evidence_count"].tolist() == [2, 0]
+    assert prepared["strong_match_count"].tolist() == [3, 0]
+    assert prepared["negative_match_count"].tolist() == [1, 0]
+
+
 def test_eval_regression_checks_and_question_eval():
     eval_mod = _load_script_module(ROOT / "scripts" / "eval_suite.py", "eval_mod")
     frame = pd.DataFrame(